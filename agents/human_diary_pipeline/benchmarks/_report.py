@@ -0,0 +1,43 @@
+"""
+Shared measurement helpers for the benchmark scripts.
+"""
+
+from __future__ import annotations
+
+import json
+import resource
+import statistics
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+
+def peak_rss_mb() -> float:
+    # ru_maxrss is reported in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def summarize(runs: Iterable[List[Dict[str, Any]]], key: str) -> List[Dict[str, Any]]:
+    """Collapse repeated runs into one row per `key` using the median of each metric."""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for rows in runs:
+        for row in rows:
+            grouped.setdefault(row[key], []).append(row)
+    summary: List[Dict[str, Any]] = []
+    for name, rows in grouped.items():
+        merged: Dict[str, Any] = {key: name}
+        for metric in rows[0]:
+            if metric != key:
+                merged[metric] = round(statistics.median(row[metric] for row in rows), 2)
+        summary.append(merged)
+    return summary
+
+
+def emit(rows: List[Dict[str, Any]], json_path: Optional[Path]) -> None:
+    columns = list(rows[0]) if rows else []
+    widths = [max(len(str(column)), *(len(str(row[column])) for row in rows)) for column in columns]
+    print("  ".join(str(column).ljust(width) for column, width in zip(columns, widths)))
+    for row in rows:
+        print("  ".join(str(row[c]).ljust(w) for c, w in zip(columns, widths)))
+    if json_path:
+        json_path.parent.mkdir(parents=True, exist_ok=True)
+        json_path.write_text(json.dumps(rows, indent=2))
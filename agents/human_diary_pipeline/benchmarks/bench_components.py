@@ -0,0 +1,125 @@
+"""
+Offline micro-benchmarks for the CPU-bound stages: provenance, cleaning and state
+serialization, over synthetic records.
+
+    python benchmarks/bench_components.py --records 20000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import copy
+import datetime as dt
+import random
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from _report import emit, peak_rss_mb, summarize
+
+from human_diary_pipeline.adapters.base import DocumentRecord
+from human_diary_pipeline.agents.retrieval import CleanerAgent
+from human_diary_pipeline.pipelines.checkpoint import NewsroomSerializer
+from human_diary_pipeline.pipelines.sharded import (
+    columns_to_records,
+    pack,
+    records_to_columns,
+    unpack,
+)
+from human_diary_pipeline.utils import provenance
+
+
+def synthetic_records(count: int, *, seed: int = 7) -> List[DocumentRecord]:
+    """Wire-style corpus: many domains, exact URL repeats and syndicated near-copies."""
+    rng = random.Random(seed)
+    vocabulary = [f"term{index}" for index in range(4000)]
+    stories = [" ".join(rng.choices(vocabulary, k=40)) for _ in range(max(count // 4, 1))]
+    start = dt.datetime(2024, 1, 1, tzinfo=dt.timezone.utc)
+    records: List[DocumentRecord] = []
+    for index in range(count):
+        story_id = rng.randrange(len(stories))
+        words = stories[story_id].split()
+        words[rng.randrange(len(words))] = "edited"
+        domain = f"outlet{rng.randrange(200)}.example"
+        records.append(
+            DocumentRecord(
+                id=f"doc-{index}",
+                title=f"Story {story_id}",
+                summary=" ".join(words),
+                url=f"https://{domain}/news/{story_id}/?utm_source=feed",
+                source=domain,
+                published_at=start + dt.timedelta(minutes=rng.randrange(60 * 24 * 7)),
+                score=rng.random(),
+            )
+        )
+    return records
+
+
+def _measure(
+    name: str,
+    fn: Callable[[List[DocumentRecord]], Any],
+    records: List[DocumentRecord],
+) -> Dict[str, Any]:
+    # Stages mutate record metadata, so each one gets a fresh copy outside the timed region.
+    records = copy.deepcopy(records)
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn(records)
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "stage": name,
+        "wall_ms": elapsed * 1000,
+        "alloc_peak_kb": peak / 1024,
+        "peak_rss_mb": peak_rss_mb(),
+    }
+
+
+def run_once(records: List[DocumentRecord]) -> List[Dict[str, Any]]:
+    cleaner = CleanerAgent()
+    serializer = NewsroomSerializer()
+
+    def incremental(batch: List[DocumentRecord]) -> None:
+        stream = cleaner.incremental()
+        for start in range(0, len(batch), 50):
+            stream.add(batch[start : start + 50])
+        stream.result()
+
+    def state_roundtrip(batch: List[DocumentRecord]) -> None:
+        state = {"raw_documents": batch, "clean_documents": batch[: len(batch) // 10]}
+        serializer.loads_typed(serializer.dumps_typed(state))
+
+    def shard_transfer(batch: List[DocumentRecord]) -> None:
+        columns_to_records(unpack(pack({"documents": records_to_columns(batch)}))["documents"])
+
+    return [
+        _measure("normalize_exact", provenance.normalize, records),
+        _measure(
+            "normalize_near_duplicates",
+            lambda batch: provenance.normalize(batch, near_duplicates=True),
+            records,
+        ),
+        _measure("cleaner_run", lambda batch: asyncio.run(cleaner.run(batch)), records),
+        _measure("cleaner_incremental", incremental, records),
+        _measure("state_roundtrip", state_roundtrip, records),
+        _measure("shard_transfer", shard_transfer, records),
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--records", type=int, default=20_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, default=None, help="Write the summary as JSON.")
+    args = parser.parse_args()
+
+    records = synthetic_records(args.records)
+    runs = [run_once(records) for _ in range(args.repeat)]
+    emit(summarize(runs, "stage"), args.json)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""
+Startup-latency guard: time cold imports of the CLI and the package in fresh interpreters
+and check that heavy dependencies stay unloaded until a run actually needs them.
+
+    python benchmarks/bench_import.py --repeat 5 --max-seconds 1.0
+
+Exits non-zero when a median exceeds `--max-seconds` or a deferred module was imported.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+from _report import emit, summarize
+
+# Modules that must not be imported by `--help` or by importing the package.
+DEFERRED = (
+    "langgraph",
+    "langchain",
+    "langchain_experimental",
+    "langchain_community",
+    "langchain_openai",
+    "langchain_anthropic",
+    "openai",
+    "anthropic",
+    "docarray",
+    "duckdb",
+    "numpy",
+)
+
+TARGETS = {
+    "cli_help": "import sys; sys.argv = ['human-diary-newsroom', '--help']\n"
+    "from human_diary_pipeline.cli import main\n"
+    "try:\n    main()\nexcept SystemExit:\n    pass",
+    "import_package": "import human_diary_pipeline",
+}
+
+_PROBE = (
+    "\nimport json, sys\n"
+    "print(json.dumps(sorted(m for m in {deferred!r} if m in sys.modules)))"
+)
+
+
+def run_once(code: str) -> Dict[str, Any]:
+    probe = code + _PROBE.format(deferred=DEFERRED)
+    started = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-c", probe],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    elapsed = time.perf_counter() - started
+    loaded: List[str] = json.loads(completed.stdout.strip().splitlines()[-1])
+    return {"wall_seconds": elapsed, "loaded": loaded}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--max-seconds", type=float, default=1.0)
+    parser.add_argument("--json", type=Path, default=None)
+    args = parser.parse_args()
+
+    runs: List[List[Dict[str, Any]]] = []
+    loaded: Dict[str, set] = {name: set() for name in TARGETS}
+    for _ in range(args.repeat):
+        rows: List[Dict[str, Any]] = []
+        for name, code in TARGETS.items():
+            sample = run_once(code)
+            loaded[name].update(sample["loaded"])
+            rows.append({"target": name, "wall_seconds": sample["wall_seconds"]})
+        runs.append(rows)
+    summary = summarize(runs, "target")
+    emit(summary, args.json)
+
+    failures: List[str] = []
+    for row in summary:
+        name = row["target"]
+        if loaded[name]:
+            modules = ", ".join(sorted(loaded[name]))
+            failures.append(f"{name} imported deferred modules: {modules}")
+        if row["wall_seconds"] > args.max_seconds:
+            failures.append(
+                f"{name} took {row['wall_seconds']:.2f}s (limit {args.max_seconds:.2f}s)"
+            )
+    if failures:
+        raise SystemExit("\n".join(failures))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+End-to-end newsroom benchmark running `build_default_newsroom` under replay fixtures.
+
+Record once with live keys, then replay anywhere:
+
+    human-diary-newsroom --record fixtures/baseline --plan "Daily brief on ..."
+    python benchmarks/bench_newsroom.py --fixtures fixtures/baseline --repeat 5
+
+Reports per-node wall time, peak traced allocations and process peak RSS.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Dict, List
+
+from _report import emit, peak_rss_mb, summarize
+
+from human_diary_pipeline.adapters.registry import build_adapter_suite
+from human_diary_pipeline.config import RuntimeConfig, load_runtime_config
+from human_diary_pipeline.pipelines.newsroom import build_default_newsroom
+
+
+def _replay_config(fixtures: Path, workdir: Path) -> RuntimeConfig:
+    config = load_runtime_config()
+    return config.model_copy(
+        update={
+            "replay": config.replay.model_copy(update={"mode": "replay", "fixtures_dir": fixtures}),
+            "cache": config.cache.model_copy(update={"directory": workdir / ".cache"}),
+            "checkpoint": config.checkpoint.model_copy(update={"enabled": False}),
+        }
+    )
+
+
+async def run_once(config: RuntimeConfig, plan: str) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    async with build_adapter_suite(config) as adapters:
+        workflow = build_default_newsroom(
+            config,
+            planner_directive=plan,
+            adapters=adapters.values(),
+        )
+        tracemalloc.start()
+        last = time.perf_counter()
+        async for update in workflow.astream({}, stream_mode="updates"):
+            now = time.perf_counter()
+            _, peak = tracemalloc.get_traced_memory()
+            for node in update:
+                rows.append(
+                    {
+                        "node": node,
+                        "wall_ms": (now - last) * 1000,
+                        "alloc_peak_kb": peak / 1024,
+                        "peak_rss_mb": peak_rss_mb(),
+                    }
+                )
+            tracemalloc.reset_peak()
+            last = time.perf_counter()
+        tracemalloc.stop()
+    return rows
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--fixtures", type=Path, required=True)
+    parser.add_argument("--plan", type=str, default=None, help="Defaults to the recorded plan.")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--json", type=Path, default=None, help="Write the summary as JSON.")
+    args = parser.parse_args()
+
+    fixtures = args.fixtures.resolve()
+    manifest = fixtures / "run.json"
+    plan = args.plan or json.loads(manifest.read_text())["plan"]
+    json_path = args.json.resolve() if args.json else None
+
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(tmp)
+        os.chdir(workdir)  # PublishAgent / MemoryAgent write relative to the cwd.
+        config = _replay_config(fixtures, workdir)
+        for _ in range(args.repeat):
+            runs.append(asyncio.run(run_once(config, plan)))
+    emit(summarize(runs, "node"), json_path)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,18 @@ This module glues together BabyAGI planners, LangChain tools, LangGraph workflow
 and bespoke adapters for citation-aware summarization pipelines.
 """
 
-from .pipelines.newsroom import build_default_newsroom
+from __future__ import annotations
+
+from typing import Any
 
 __all__ = ["build_default_newsroom"]
+
+
+def __getattr__(name: str) -> Any:
+    # Deferred so that importing the package (or running `--help`) does not pull in
+    # LangGraph, LangChain and the provider SDKs.
+    if name == "build_default_newsroom":
+        from .pipelines.newsroom import build_default_newsroom
+
+        return build_default_newsroom
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
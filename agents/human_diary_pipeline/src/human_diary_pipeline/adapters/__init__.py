@@ -2,16 +2,26 @@
 Adapters for third-party data sources.
 """
 
-from .newsapi import NewsApiAdapter
-from .openai_web import OpenAIWebSearchAdapter
-from .perplexity import PerplexitySonarAdapter
-from .semantic_scholar import SemanticScholarAdapter
-from .serpapi import SerpApiNewsAdapter
+from __future__ import annotations
 
-__all__ = [
-    "NewsApiAdapter",
-    "OpenAIWebSearchAdapter",
-    "PerplexitySonarAdapter",
-    "SemanticScholarAdapter",
-    "SerpApiNewsAdapter",
-]
+from importlib import import_module
+from typing import Any
+
+_EXPORTS = {
+    "DocumentArchive": ".archive",
+    "LocalArchiveAdapter": ".archive",
+    "NewsApiAdapter": ".newsapi",
+    "OpenAIWebSearchAdapter": ".openai_web",
+    "PerplexitySonarAdapter": ".perplexity",
+    "SemanticScholarAdapter": ".semantic_scholar",
+    "SerpApiNewsAdapter": ".serpapi",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(import_module(module, __name__), name)
@@ -4,14 +4,26 @@ Shared types for adapters that pull external evidence.
 
 from __future__ import annotations
 
+import asyncio
 import datetime as dt
+import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Mapping, MutableMapping, Optional, Protocol
 
+import httpx
 
-@dataclass
+from .payloads import payload_store
+
+
+@dataclass(slots=True)
 class DocumentRecord:
+    """
+    One retrieved document. Slotted, with `source` and `domain` interned, because runs hold
+    tens of thousands of these; raw provider payloads live in the `PayloadStore` and are
+    referenced by `payload_ref` rather than kept in `metadata`.
+    """
+
     id: str
     title: str
     summary: str
@@ -20,6 +32,21 @@ class DocumentRecord:
     published_at: Optional[dt.datetime] = None
     score: Optional[float] = None
     metadata: MutableMapping[str, Any] = field(default_factory=dict)
+    domain: Optional[str] = None
+    canonical_url: Optional[str] = None
+    payload_ref: Optional[str] = None
+
+    def __post_init__(self) -> None:
+        if self.source is not None:
+            self.source = sys.intern(self.source)
+        if self.domain is not None:
+            self.domain = sys.intern(self.domain)
+
+    def raw_payload(self) -> Any:
+        """The provider payload this record was parsed from, if the adapter kept one."""
+        if self.payload_ref is None:
+            return None
+        return payload_store().get(self.payload_ref)
 
     def as_dict(self) -> Dict[str, Any]:
         payload = {
@@ -31,9 +58,33 @@ class DocumentRecord:
             "published_at": self.published_at.isoformat() if self.published_at else None,
             "score": self.score,
             "metadata": dict(self.metadata),
+            "domain": self.domain,
+            "canonical_url": self.canonical_url,
+            "payload_ref": self.payload_ref,
         }
         return payload
 
+    @classmethod
+    def from_dict(cls, payload: Mapping[str, Any]) -> "DocumentRecord":
+        published_at = payload.get("published_at")
+        metadata = dict(payload.get("metadata") or {})
+        # Caches, archives and fixtures written before these were fields keep them in metadata.
+        domain = payload.get("domain") or metadata.pop("domain", None)
+        canonical = payload.get("canonical_url") or metadata.pop("canonical_url", None)
+        return cls(
+            id=payload["id"],
+            title=payload.get("title") or "",
+            summary=payload.get("summary") or "",
+            url=payload.get("url"),
+            source=payload.get("source"),
+            published_at=dt.datetime.fromisoformat(published_at) if published_at else None,
+            score=payload.get("score"),
+            metadata=metadata,
+            domain=domain,
+            canonical_url=canonical,
+            payload_ref=payload.get("payload_ref"),
+        )
+
     def as_langchain_document(self):
         from langchain_core.documents import Document
 
@@ -44,6 +95,8 @@ class DocumentRecord:
             self.published_at.isoformat() if self.published_at else None
         )
         metadata["score"] = self.score
+        metadata["domain"] = self.domain
+        metadata["canonical_url"] = self.canonical_url
         return Document(page_content=self.summary, metadata=metadata)
 
 
@@ -71,7 +124,52 @@ class SyncAdapter(SourceAdapter):
         raise NotImplementedError
 
     async def search(self, query: str) -> List[DocumentRecord]:
-        return self.search_sync(query)
+        return await asyncio.to_thread(self.search_sync, query)
+
+
+class HttpAdapter(SyncAdapter):
+    """
+    JSON-over-HTTP adapter with a blocking path and a native async path.
+
+    Subclasses describe the request and parse the payload. When a shared
+    `httpx.AsyncClient` is provided, `search` uses it directly instead of a thread.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_results: int = 8,
+        timeout: float = 10.0,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(max_results=max_results)
+        self.timeout = timeout
+        self.client = client
+
+    def build_request(self, query: str) -> Optional[Dict[str, Any]]:
+        """Return keyword arguments for `httpx.request`, or None to skip the call."""
+        raise NotImplementedError
+
+    def parse_payload(self, payload: Any) -> List[DocumentRecord]:
+        raise NotImplementedError
+
+    def search_sync(self, query: str) -> List[DocumentRecord]:
+        request = self.build_request(query)
+        if request is None:
+            return []
+        response = httpx.request(timeout=self.timeout, **request)
+        response.raise_for_status()
+        return self.parse_payload(response.json())
+
+    async def search(self, query: str) -> List[DocumentRecord]:
+        if self.client is None:
+            return await super().search(query)
+        request = self.build_request(query)
+        if request is None:
+            return []
+        response = await self.client.request(timeout=self.timeout, **request)
+        response.raise_for_status()
+        return self.parse_payload(response.json())
 
 
 class Normalizer(Protocol):
@@ -0,0 +1,144 @@
+"""
+Persistent retrieval cache keyed by (adapter, normalized query).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import sqlite3
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Literal, Mapping, Optional
+
+from .base import DocumentRecord, SourceAdapter
+
+CacheMode = Literal["use", "bypass", "warm"]
+
+_TOKEN = re.compile(r"\w+")
+
+
+def normalize_query(query: str) -> str:
+    """Fold case, punctuation, spacing and word order so near-identical queries share a key."""
+    tokens = sorted(set(_TOKEN.findall(query.lower())))
+    return " ".join(tokens)
+
+
+class RetrievalCache:
+    """
+    SQLite-backed store of adapter results with per-adapter TTLs and LRU eviction. Empty
+    results expire after `empty_ttl`, so one transient blank response does not hide a
+    provider for the full TTL.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        default_ttl: float = 6 * 3600.0,
+        ttls: Optional[Mapping[str, float]] = None,
+        max_entries: int = 50_000,
+        empty_ttl: float = 300.0,
+    ) -> None:
+        self.path = path
+        self.default_ttl = default_ttl
+        self.empty_ttl = empty_ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.hits: Counter[str] = Counter()
+        self.misses: Counter[str] = Counter()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS entries ("
+            " adapter TEXT NOT NULL,"
+            " query TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " stored_at REAL NOT NULL,"
+            " accessed_at REAL NOT NULL,"
+            " PRIMARY KEY (adapter, query))"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS entries_lru ON entries (accessed_at)")
+        self._conn.commit()
+
+    def ttl_for(self, adapter: str) -> float:
+        return self.ttls.get(adapter, self.default_ttl)
+
+    def get(self, adapter: str, query: str) -> Optional[List[DocumentRecord]]:
+        key = normalize_query(query)
+        row = self._conn.execute(
+            "SELECT payload, stored_at FROM entries WHERE adapter = ? AND query = ?",
+            (adapter, key),
+        ).fetchone()
+        now = time.time()
+        ttl = self.empty_ttl if row is not None and row[0] == "[]" else self.ttl_for(adapter)
+        if row is None or now - row[1] > ttl:
+            self.misses[adapter] += 1
+            return None
+        self._conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE adapter = ? AND query = ?",
+            (now, adapter, key),
+        )
+        self._conn.commit()
+        self.hits[adapter] += 1
+        return [DocumentRecord.from_dict(item) for item in json.loads(row[0])]
+
+    def put(self, adapter: str, query: str, records: List[DocumentRecord]) -> None:
+        now = time.time()
+        payload = json.dumps([record.as_dict() for record in records], default=str)
+        self._conn.execute(
+            "INSERT OR REPLACE INTO entries (adapter, query, payload, stored_at, accessed_at)"
+            " VALUES (?, ?, ?, ?, ?)",
+            (adapter, normalize_query(query), payload, now, now),
+        )
+        self._conn.execute(
+            "DELETE FROM entries WHERE rowid IN ("
+            " SELECT rowid FROM entries ORDER BY accessed_at ASC"
+            " LIMIT max(0, (SELECT COUNT(*) FROM entries) - ?))",
+            (self.max_entries,),
+        )
+        self._conn.commit()
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        adapters = set(self.hits) | set(self.misses)
+        return {
+            adapter: {"hits": self.hits[adapter], "misses": self.misses[adapter]}
+            for adapter in sorted(adapters)
+        }
+
+    def close(self) -> None:
+        self._conn.close()
+
+
+class CachedAdapter(SourceAdapter):
+    """
+    Serve an adapter's results from `RetrievalCache` when fresh.
+
+    `mode="warm"` skips reads but still stores fresh results; `mode="bypass"` ignores the cache.
+    """
+
+    def __init__(
+        self,
+        inner: SourceAdapter,
+        cache: RetrievalCache,
+        *,
+        mode: CacheMode = "use",
+    ) -> None:
+        super().__init__(max_results=inner.max_results)
+        self.inner = inner
+        self.cache = cache
+        self.mode = mode
+        self.name = inner.name
+
+    async def search(self, query: str) -> List[DocumentRecord]:
+        if self.mode == "bypass":
+            return await self.inner.search(query)
+        if self.mode == "use":
+            cached = self.cache.get(self.name, query)
+            if cached is not None:
+                return cached
+        records = await self.inner.search(query)
+        self.cache.put(self.name, query, records)
+        return records
@@ -0,0 +1,94 @@
+"""
+Shared pooled HTTP client for adapters that talk to JSON APIs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import AsyncIterator, Callable, Dict
+
+import httpx
+
+from ..config import HttpConfig, ReplayConfig
+from ..utils.replay import FixtureStore, RecordingTransport, ReplayTransport
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    def __init__(self, stream: httpx.AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._release()
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Cap in-flight requests per host on top of the pool-wide connection limits.
+
+    The slot is held until the response body is closed, so it tracks open connections
+    rather than just time-to-headers.
+    """
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, max_per_host: int) -> None:
+        self._transport = transport
+        self._max_per_host = max_per_host
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = self._semaphores[host] = asyncio.Semaphore(self._max_per_host)
+        return semaphore
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        semaphore = self._semaphore(request.url.host)
+        await semaphore.acquire()
+        released = False
+
+        def release() -> None:
+            nonlocal released
+            if not released:
+                released = True
+                semaphore.release()
+
+        try:
+            response = await self._transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        response.stream = _ReleasingStream(response.stream, release)
+        return response
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+def build_http_client(
+    config: HttpConfig,
+    replay: ReplayConfig | None = None,
+) -> httpx.AsyncClient:
+    if replay is not None and replay.mode == "replay":
+        return httpx.AsyncClient(transport=ReplayTransport(FixtureStore(replay.fixtures_dir)))
+    limits = httpx.Limits(
+        max_connections=config.max_connections,
+        max_keepalive_connections=config.max_keepalive_connections,
+        keepalive_expiry=config.keepalive_expiry,
+    )
+    transport: httpx.AsyncBaseTransport = httpx.AsyncHTTPTransport(
+        http2=config.http2,
+        limits=limits,
+    )
+    if replay is not None and replay.mode == "record":
+        transport = RecordingTransport(transport, FixtureStore(replay.fixtures_dir))
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, config.max_connections_per_host),
+        follow_redirects=True,
+    )
@@ -5,15 +5,15 @@ NewsAPI adapter for structured global coverage.
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from ..utils.provenance import normalize
-from .base import DocumentRecord, SyncAdapter
+from .base import DocumentRecord, HttpAdapter
 
 
-class NewsApiAdapter(SyncAdapter):
+class NewsApiAdapter(HttpAdapter):
     name = "newsapi"
     endpoint = "https://newsapi.org/v2/everything"
 
@@ -24,10 +24,10 @@ class NewsApiAdapter(SyncAdapter):
         max_results: int = 10,
         timeout: float = 10.0,
         language: str = "en",
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        super().__init__(max_results=max_results)
+        super().__init__(max_results=max_results, timeout=timeout, client=client)
         self.api_key = api_key
-        self.timeout = timeout
         self.language = language
 
     def _parse_time(self, raw: Optional[str]) -> Optional[dt.datetime]:
@@ -38,9 +38,9 @@ class NewsApiAdapter(SyncAdapter):
         except ValueError:
             return None
 
-    def search_sync(self, query: str) -> List[DocumentRecord]:
+    def build_request(self, query: str) -> Optional[Dict[str, Any]]:
         if not self.api_key:
-            return []
+            return None
         params = {
             "q": query,
             "language": self.language,
@@ -48,9 +48,9 @@ class NewsApiAdapter(SyncAdapter):
             "pageSize": self.max_results,
         }
         headers = {"X-Api-Key": self.api_key}
-        response = httpx.get(self.endpoint, params=params, headers=headers, timeout=self.timeout)
-        response.raise_for_status()
-        payload = response.json()
+        return {"method": "GET", "url": self.endpoint, "params": params, "headers": headers}
+
+    def parse_payload(self, payload: Any) -> List[DocumentRecord]:
         articles = payload.get("articles", [])
         records: List[DocumentRecord] = []
         for idx, article in enumerate(articles[: self.max_results]):
@@ -6,6 +6,7 @@ from __future__ import annotations
 
 from typing import Any, List, Optional
 
+import httpx
 from openai import AsyncOpenAI
 
 from ..utils.provenance import normalize
@@ -21,9 +22,14 @@ class OpenAIWebSearchAdapter(SourceAdapter):
         *,
         model: str = "o4-mini",
         max_results: int = 5,
+        timeout: float = 60.0,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
         super().__init__(max_results=max_results)
-        self._client = AsyncOpenAI(api_key=api_key) if api_key else None
+        self.timeout = timeout
+        self._client = (
+            AsyncOpenAI(api_key=api_key, http_client=client, timeout=timeout) if api_key else None
+        )
         self.model = model
 
     async def search(self, query: str) -> List[DocumentRecord]:
@@ -0,0 +1,92 @@
+"""
+Out-of-line storage for raw provider payloads referenced by `DocumentRecord.payload_ref`.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Optional
+
+
+class PayloadStore:
+    """
+    Content-addressed raw payloads, zlib-compressed JSON kept in memory or, with a
+    `directory`, one file per payload. Nothing is decoded until `get` is called. In memory
+    only the `max_entries` most recently used payloads are kept.
+    """
+
+    def __init__(self, directory: Optional[Path] = None, *, max_entries: int = 4096) -> None:
+        self.directory = directory
+        self.max_entries = max_entries
+        self._blobs: OrderedDict[str, bytes] = OrderedDict()
+        if directory is not None:
+            directory.mkdir(parents=True, exist_ok=True)
+
+    def _path(self, ref: str) -> Path:
+        assert self.directory is not None
+        return self.directory / f"{ref}.json.z"
+
+    def put(self, payload: Any) -> str:
+        data = json.dumps(payload, separators=(",", ":"), sort_keys=True, default=str)
+        encoded = data.encode("utf-8")
+        ref = hashlib.sha1(encoded).hexdigest()[:20]
+        if ref in self:
+            if self.directory is None:
+                self._blobs.move_to_end(ref)
+            return ref
+        blob = zlib.compress(encoded, 6)
+        if self.directory is None:
+            self._blobs[ref] = blob
+            while len(self._blobs) > self.max_entries:
+                self._blobs.popitem(last=False)
+        else:
+            self._path(ref).write_bytes(blob)
+        return ref
+
+    def get(self, ref: str) -> Any:
+        """The payload for `ref`, or None when it is not stored here (another process, evicted)."""
+        if self.directory is None:
+            blob = self._blobs.get(ref)
+            if blob is not None:
+                self._blobs.move_to_end(ref)
+        else:
+            path = self._path(ref)
+            blob = path.read_bytes() if path.exists() else None
+        if blob is None:
+            return None
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+
+    def __contains__(self, ref: str) -> bool:
+        if self.directory is None:
+            return ref in self._blobs
+        return self._path(ref).exists()
+
+    def __len__(self) -> int:
+        if self.directory is None:
+            return len(self._blobs)
+        return sum(1 for _ in self.directory.glob("*.json.z"))
+
+    def nbytes(self) -> int:
+        if self.directory is None:
+            return sum(len(blob) for blob in self._blobs.values())
+        return sum(path.stat().st_size for path in self.directory.glob("*.json.z"))
+
+
+_store: Optional[PayloadStore] = None
+
+
+def payload_store() -> PayloadStore:
+    """Store used by adapters; a bounded in-memory one until `set_payload_store` replaces it."""
+    global _store
+    if _store is None:
+        _store = PayloadStore()
+    return _store
+
+
+def set_payload_store(store: PayloadStore) -> None:
+    global _store
+    _store = store
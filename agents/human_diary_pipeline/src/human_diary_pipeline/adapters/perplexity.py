@@ -6,15 +6,16 @@ from __future__ import annotations
 
 import datetime as dt
 import json
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from ..utils.provenance import normalize
-from .base import DocumentRecord, SyncAdapter
+from .base import DocumentRecord, HttpAdapter
+from .payloads import payload_store
 
 
-class PerplexitySonarAdapter(SyncAdapter):
+class PerplexitySonarAdapter(HttpAdapter):
     name = "perplexity_sonar"
     endpoint = "https://api.perplexity.ai/chat/completions"
 
@@ -25,15 +26,15 @@ class PerplexitySonarAdapter(SyncAdapter):
         model: str = "sonar-reasoning",
         max_results: int = 5,
         timeout: float = 30.0,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        super().__init__(max_results=max_results)
+        super().__init__(max_results=max_results, timeout=timeout, client=client)
         self.api_key = api_key
         self.model = model
-        self.timeout = timeout
 
-    def search_sync(self, query: str) -> List[DocumentRecord]:
+    def build_request(self, query: str) -> Optional[Dict[str, Any]]:
         if not self.api_key:
-            return []
+            return None
         headers = {
             "accept": "application/json",
             "content-type": "application/json",
@@ -52,19 +53,20 @@ class PerplexitySonarAdapter(SyncAdapter):
             "temperature": 0.2,
             "return_citations": True,
         }
-        response = httpx.post(
-            self.endpoint,
-            headers=headers,
-            content=json.dumps(payload),
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        data = response.json()
+        return {
+            "method": "POST",
+            "url": self.endpoint,
+            "headers": headers,
+            "content": json.dumps(payload),
+        }
+
+    def parse_payload(self, data: Any) -> List[DocumentRecord]:
         choice = data.get("choices", [{}])[0]
         message = choice.get("message", {})
         content = message.get("content")
         citations = message.get("citations") or []
         records: List[DocumentRecord] = []
+        payloads = payload_store()
         for idx, citation in enumerate(citations[: self.max_results]):
             link = citation.get("url")
             title = citation.get("title") or f"Perplexity finding {idx + 1}"
@@ -83,7 +85,7 @@ class PerplexitySonarAdapter(SyncAdapter):
                     url=link,
                     source="Perplexity Sonar",
                     published_at=published_at,
-                    metadata={"raw": citation},
+                    payload_ref=payloads.put(citation),
                 )
             )
         if not records and content:
@@ -93,7 +95,7 @@ class PerplexitySonarAdapter(SyncAdapter):
                     title="Perplexity Sonar Summary",
                     summary=content,
                     source="Perplexity Sonar",
-                    metadata={"citations": citations},
+                    payload_ref=payloads.put(citations),
                 )
             )
         return normalize(records)
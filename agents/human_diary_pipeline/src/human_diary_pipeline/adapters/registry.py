@@ -4,28 +4,137 @@ Factory helpers to instantiate adapters based on runtime config.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Dict, Optional
+
+import httpx
 
 from ..config import RuntimeConfig
+from .archive import DocumentArchive, LocalArchiveAdapter
 from .base import SourceAdapter
+from .cache import CachedAdapter, RetrievalCache
+from .http import build_http_client
 from .newsapi import NewsApiAdapter
 from .openai_web import OpenAIWebSearchAdapter
+from .payloads import PayloadStore, set_payload_store
 from .perplexity import PerplexitySonarAdapter
+from .resilience import ResilientAdapter
 from .semantic_scholar import SemanticScholarAdapter
 from .serpapi import SerpApiNewsAdapter
 
 
-def build_adapter_suite(config: RuntimeConfig) -> Dict[str, SourceAdapter]:
+class AdapterSuite(Dict[str, SourceAdapter]):
+    """
+    Named adapters plus the pooled HTTP client, retrieval cache and local archive they share.
+
+    Use as an async context manager (or call `aclose`) so connections are released
+    at the end of a run.
+    """
+
+    def __init__(
+        self,
+        adapters: Dict[str, SourceAdapter],
+        *,
+        client: httpx.AsyncClient,
+        owns_client: bool = True,
+        cache: Optional[RetrievalCache] = None,
+        archive: Optional[DocumentArchive] = None,
+    ) -> None:
+        super().__init__(adapters)
+        self.client = client
+        self.owns_client = owns_client
+        self.cache = cache
+        self.archive = archive
+
+    async def aclose(self) -> None:
+        if self.cache is not None:
+            self.cache.close()
+        if self.archive is not None:
+            self.archive.close()
+        if self.owns_client:
+            await self.client.aclose()
+
+    async def __aenter__(self) -> "AdapterSuite":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+
+def build_adapter_suite(
+    config: RuntimeConfig,
+    *,
+    client: Optional[httpx.AsyncClient] = None,
+) -> AdapterSuite:
     api = config.api
-    adapters = {
-        "semantic_scholar": SemanticScholarAdapter(api.semantic_scholar_key),
-        "perplexity": PerplexitySonarAdapter(api.perplexity_key),
-        "serpapi": SerpApiNewsAdapter(api.serpapi_api_key),
-        "newsapi": NewsApiAdapter(api.newsapi_key),
-        "openai_web": OpenAIWebSearchAdapter(api.openai_api_key),
-    }
-    return adapters
+    if config.replay.mode == "replay":
+        # Adapters skip providers without keys; fixtures stand in for every provider.
+        api = api.model_copy(
+            update={name: value or "replay" for name, value in api.model_dump().items()}
+        )
+    # Each suite starts a fresh store so payloads from earlier runs are released.
+    set_payload_store(
+        PayloadStore(
+            config.cache.payload_directory, max_entries=config.cache.payload_max_entries
+        )
+    )
+    owns_client = client is None
+    client = client or build_http_client(config.http, config.replay)
+    timeouts = config.retrieval.adapter_timeouts
 
+    def options(key: str) -> Dict[str, Any]:
+        options: Dict[str, Any] = {"client": client}
+        if key in timeouts:
+            options["timeout"] = timeouts[key]
+        return options
+
+    adapters: Dict[str, SourceAdapter] = {
+        "semantic_scholar": SemanticScholarAdapter(
+            api.semantic_scholar_key, **options("semantic_scholar")
+        ),
+        "perplexity": PerplexitySonarAdapter(api.perplexity_key, **options("perplexity")),
+        "serpapi": SerpApiNewsAdapter(api.serpapi_api_key, **options("serpapi")),
+        "newsapi": NewsApiAdapter(api.newsapi_key, **options("newsapi")),
+        "openai_web": OpenAIWebSearchAdapter(api.openai_api_key, **options("openai_web")),
+    }
+    if config.resilience.enabled:
+        adapters = {
+            key: ResilientAdapter.from_config(adapter, config.resilience)
+            for key, adapter in adapters.items()
+        }
+    # The cache wraps the resilience layer so hits never spend rate-limit tokens.
+    cache_config = config.cache
+    cache: Optional[RetrievalCache] = None
+    # Recordings must see every HTTP call and replays must not depend on local cache state.
+    retrieval_mode = cache_config.retrieval_mode if config.replay.mode == "off" else "bypass"
+    if retrieval_mode != "bypass":
+        cache = RetrievalCache(
+            cache_config.directory / "retrieval_cache.sqlite",
+            default_ttl=cache_config.retrieval_ttl_seconds,
+            ttls=cache_config.retrieval_ttls,
+            max_entries=cache_config.retrieval_max_entries,
+            empty_ttl=cache_config.retrieval_empty_ttl_seconds,
+        )
+        adapters = {
+            key: CachedAdapter(adapter, cache, mode=retrieval_mode)
+            for key, adapter in adapters.items()
+        }
+    # The archive is local and answers in milliseconds: no rate limits, retries or cache.
+    # Recordings skip it so every task reaches HTTP and gets a fixture, and replays skip it
+    # so fixtures alone decide what retrieval returns.
+    archive_config = config.archive
+    archive: Optional[DocumentArchive] = None
+    if archive_config.enabled and config.replay.mode == "off":
+        archive = DocumentArchive(archive_config.path)
+        adapters = {
+            "local_archive": LocalArchiveAdapter(
+                archive,
+                max_results=archive_config.max_results,
+                min_results=archive_config.min_results,
+                max_age_seconds=archive_config.max_age_seconds,
+            ),
+            **adapters,
+        }
+    return AdapterSuite(
+        adapters, client=client, owns_client=owns_client, cache=cache, archive=archive
+    )
 
-def adapter_list(config: RuntimeConfig) -> List[SourceAdapter]:
-    return list(build_adapter_suite(config).values())
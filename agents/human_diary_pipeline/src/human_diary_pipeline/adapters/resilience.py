@@ -0,0 +1,274 @@
+"""
+Per-provider rate limiting, jittered retries and circuit breaking around adapters.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+import time
+from dataclasses import asdict, dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+import httpx
+from tenacity import (
+    AsyncRetrying,
+    RetryCallState,
+    retry_if_exception,
+    stop_after_attempt,
+    wait_random_exponential,
+)
+
+from ..config import ResilienceConfig
+from .base import DocumentRecord, SourceAdapter
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit is open."""
+
+
+def _status_code(exc: BaseException) -> Optional[int]:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code
+    return getattr(exc, "status_code", None)
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Throttling, server errors, timeouts and dropped connections are worth another try."""
+    if isinstance(exc, (httpx.TransportError, asyncio.TimeoutError)):
+        return True
+    # Only check SDK errors when the SDK is loaded; otherwise none can have been raised.
+    openai = sys.modules.get("openai")
+    if openai is not None and isinstance(exc, openai.APIConnectionError):
+        return True
+    status = _status_code(exc)
+    return status is not None and (status == 429 or status >= 500)
+
+
+def _retry_after(exc: BaseException) -> float:
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    if not value:
+        return 0.0
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+class TokenBucket:
+    """Async token bucket: `rate` tokens per second, holding at most `burst`."""
+
+    def __init__(self, rate: float, burst: int, clock: Callable[[], float] = time.monotonic):
+        self.rate = rate
+        self.burst = burst
+        self._clock = clock
+        self._tokens = float(burst)
+        self._updated = clock()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """Take one token, sleeping until one is available. Returns the time waited."""
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = self._clock()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self.rate
+                waited += delay
+                await asyncio.sleep(delay)
+
+
+class CircuitBreaker:
+    """
+    Closed → open after `failure_threshold` consecutive failures; after `cooldown`
+    seconds a single probe call is let through (half-open) and decides the next state.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self._clock = clock
+        self.failures = 0
+        self._opened_at: Optional[float] = None
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.cooldown:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and not self._probing:
+            self._probing = True
+            return True
+        return False
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def release_probe(self) -> None:
+        """Give up a half-open probe without a verdict (e.g. it was cancelled)."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self._probing or self.failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+        self._probing = False
+
+
+@dataclass
+class ProviderHealth:
+    provider: str
+    state: str = "closed"
+    calls: int = 0
+    successes: int = 0
+    failures: int = 0
+    retries: int = 0
+    short_circuited: int = 0
+    throttled_seconds: float = 0.0
+    last_error: Optional[str] = None
+
+    def as_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["throttled_seconds"] = round(self.throttled_seconds, 3)
+        return data
+
+
+class ResilientAdapter(SourceAdapter):
+    """
+    Wrap an adapter with a token bucket, jittered retries on retryable errors and a
+    circuit breaker, so a throttled or hung provider fails fast instead of stalling a run.
+    """
+
+    def __init__(
+        self,
+        inner: SourceAdapter,
+        *,
+        bucket: Optional[TokenBucket] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        max_attempts: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 8.0,
+    ) -> None:
+        super().__init__(max_results=inner.max_results)
+        self.inner = inner
+        self.name = inner.name
+        self.bucket = bucket
+        self.breaker = breaker or CircuitBreaker()
+        self.max_attempts = max_attempts
+        self.backoff_max = backoff_max
+        self._jitter = wait_random_exponential(multiplier=backoff_base, max=backoff_max)
+        self.health = ProviderHealth(provider=inner.name)
+
+    def _wait(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        hinted = _retry_after(exc) if exc is not None else 0.0
+        return min(max(hinted, self._jitter(retry_state)), self.backoff_max)
+
+    async def _attempt(self, query: str) -> List[DocumentRecord]:
+        self.health.calls += 1
+        if self.bucket is not None:
+            self.health.throttled_seconds += await self.bucket.acquire()
+        return await self.inner.search(query)
+
+    async def search(self, query: str) -> List[DocumentRecord]:
+        if not self.breaker.allow():
+            self.health.short_circuited += 1
+            self.health.state = self.breaker.state
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        retrying = AsyncRetrying(
+            stop=stop_after_attempt(self.max_attempts),
+            wait=self._wait,
+            retry=retry_if_exception(is_retryable),
+            reraise=True,
+        )
+        try:
+            records = await retrying(self._attempt, query)
+        except Exception as exc:
+            # Only failures the retry policy treats as provider trouble move the breaker;
+            # a bad query or an unparsable response says nothing about the provider.
+            if is_retryable(exc):
+                self.breaker.record_failure()
+            else:
+                self.breaker.release_probe()
+            self.health.failures += 1
+            self.health.last_error = f"{type(exc).__name__}: {exc}"[:200]
+            raise
+        except BaseException:
+            # Deadlines and hedging cancel calls routinely; that says nothing about the
+            # provider, but a cancelled probe must free the slot or the circuit never closes.
+            self.breaker.release_probe()
+            raise
+        finally:
+            self.health.retries += max(retrying.statistics.get("attempt_number", 1) - 1, 0)
+            self.health.state = self.breaker.state
+        self.breaker.record_success()
+        self.health.successes += 1
+        self.health.state = self.breaker.state
+        return records
+
+    @classmethod
+    def from_config(cls, inner: SourceAdapter, config: ResilienceConfig) -> "ResilientAdapter":
+        rate = config.provider_rates.get(inner.name, config.rate_per_second)
+        return cls(
+            inner,
+            bucket=TokenBucket(rate, config.burst) if rate > 0 else None,
+            breaker=CircuitBreaker(config.failure_threshold, config.cooldown_seconds),
+            max_attempts=config.max_attempts,
+            backoff_base=config.backoff_base,
+            backoff_max=config.backoff_max,
+        )
+
+
+_COUNTERS = ("calls", "successes", "failures", "retries", "short_circuited", "throttled_seconds")
+
+
+def provider_health(
+    adapters: Iterable[SourceAdapter],
+    since: Optional[Dict[str, Dict[str, Any]]] = None,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Health of every resilient adapter, looking through wrappers such as the cache.
+    Counters are lifetime totals; pass an earlier report as `since` to get only what
+    happened after it, which is how a run on shared adapters reports its own health.
+    """
+    report: Dict[str, Dict[str, Any]] = {}
+    for adapter in adapters:
+        current: Optional[SourceAdapter] = adapter
+        while current is not None and not isinstance(current, ResilientAdapter):
+            current = getattr(current, "inner", None)
+        if current is not None:
+            report[current.name] = current.health.as_dict()
+    for name, health in report.items():
+        before = (since or {}).get(name)
+        if before is None:
+            continue
+        for counter in _COUNTERS:
+            health[counter] = round(health[counter] - before[counter], 3)
+        if not health["failures"]:
+            health["last_error"] = None
+    return report
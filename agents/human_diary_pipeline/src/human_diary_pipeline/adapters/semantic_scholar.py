@@ -5,15 +5,15 @@ Semantic Scholar search adapter.
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from ..utils.provenance import normalize
-from .base import DocumentRecord, SyncAdapter
+from .base import DocumentRecord, HttpAdapter
 
 
-class SemanticScholarAdapter(SyncAdapter):
+class SemanticScholarAdapter(HttpAdapter):
     name = "semantic_scholar"
     search_url = "https://api.semanticscholar.org/graph/v1/paper/search"
 
@@ -23,10 +23,10 @@ class SemanticScholarAdapter(SyncAdapter):
         *,
         max_results: int = 10,
         timeout: float = 10.0,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        super().__init__(max_results=max_results)
+        super().__init__(max_results=max_results, timeout=timeout, client=client)
         self.api_key = api_key
-        self.timeout = timeout
 
     def _parse_date(self, value: Optional[str]) -> Optional[dt.datetime]:
         if not value:
@@ -36,7 +36,7 @@ class SemanticScholarAdapter(SyncAdapter):
         except ValueError:
             return None
 
-    def search_sync(self, query: str) -> List[DocumentRecord]:
+    def build_request(self, query: str) -> Optional[Dict[str, Any]]:
         params = {
             "query": query,
             "limit": self.max_results,
@@ -45,14 +45,9 @@ class SemanticScholarAdapter(SyncAdapter):
         headers = {"accept": "application/json"}
         if self.api_key:
             headers["x-api-key"] = self.api_key
-        response = httpx.get(
-            self.search_url,
-            params=params,
-            headers=headers,
-            timeout=self.timeout,
-        )
-        response.raise_for_status()
-        payload = response.json()
+        return {"method": "GET", "url": self.search_url, "params": params, "headers": headers}
+
+    def parse_payload(self, payload: Any) -> List[DocumentRecord]:
         records: List[DocumentRecord] = []
         for paper in payload.get("data", []):
             record = DocumentRecord(
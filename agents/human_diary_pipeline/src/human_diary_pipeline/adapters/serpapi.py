@@ -5,15 +5,15 @@ SerpAPI News adapter.
 from __future__ import annotations
 
 import datetime as dt
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 import httpx
 
 from ..utils.provenance import normalize
-from .base import DocumentRecord, SyncAdapter
+from .base import DocumentRecord, HttpAdapter
 
 
-class SerpApiNewsAdapter(SyncAdapter):
+class SerpApiNewsAdapter(HttpAdapter):
     name = "serpapi_news"
     endpoint = "https://serpapi.com/search.json"
 
@@ -23,10 +23,10 @@ class SerpApiNewsAdapter(SyncAdapter):
         *,
         max_results: int = 10,
         timeout: float = 10.0,
+        client: Optional[httpx.AsyncClient] = None,
     ) -> None:
-        super().__init__(max_results=max_results)
+        super().__init__(max_results=max_results, timeout=timeout, client=client)
         self.api_key = api_key
-        self.timeout = timeout
 
     def _parse_time(self, raw: Optional[str]) -> Optional[dt.datetime]:
         if not raw:
@@ -36,18 +36,18 @@ class SerpApiNewsAdapter(SyncAdapter):
         except ValueError:
             return None
 
-    def search_sync(self, query: str) -> List[DocumentRecord]:
+    def build_request(self, query: str) -> Optional[Dict[str, Any]]:
         if not self.api_key:
-            return []
+            return None
         params = {
             "engine": "google_news",
             "q": query,
             "api_key": self.api_key,
             "num": self.max_results,
         }
-        response = httpx.get(self.endpoint, params=params, timeout=self.timeout)
-        response.raise_for_status()
-        payload = response.json()
+        return {"method": "GET", "url": self.endpoint, "params": params}
+
+    def parse_payload(self, payload: Any) -> List[DocumentRecord]:
         stories = payload.get("news_results", [])
         records: List[DocumentRecord] = []
         for story in stories[: self.max_results]:
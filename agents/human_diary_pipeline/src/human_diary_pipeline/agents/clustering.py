@@ -0,0 +1,156 @@
+"""
+Embedding-based clustering: vectorize records locally, then ask the LLM only to name each group.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import math
+from typing import Any, Dict, List, Sequence
+
+import numpy as np
+from langchain.chains import LLMChain
+from langchain.prompts import PromptTemplate
+
+from ..adapters.base import DocumentRecord
+from .llm import LLMFactory
+
+
+def auto_k(count: int, max_clusters: int) -> int:
+    """Rule-of-thumb cluster count, sqrt(n / 2), clamped to [1, max_clusters]."""
+    return max(1, min(max_clusters, count, round(math.sqrt(count / 2))))
+
+
+def spherical_kmeans(
+    vectors: np.ndarray,
+    k: int,
+    *,
+    iterations: int = 25,
+    seed: int = 0,
+) -> np.ndarray:
+    """
+    Cosine k-means with k-means++ seeding over L2-normalized rows; returns a label per row.
+    """
+    rng = np.random.default_rng(seed)
+    count = vectors.shape[0]
+    centroids = np.empty((k, vectors.shape[1]), dtype=vectors.dtype)
+    centroids[0] = vectors[rng.integers(count)]
+    closest = 1.0 - vectors @ centroids[0]
+    for index in range(1, k):
+        weights = np.clip(closest, 0.0, None)
+        total = weights.sum()
+        pick = rng.choice(count, p=weights / total) if total > 0 else rng.integers(count)
+        centroids[index] = vectors[pick]
+        closest = np.minimum(closest, 1.0 - vectors @ centroids[index])
+
+    labels = np.zeros(count, dtype=np.int64)
+    for step in range(iterations):
+        new_labels = np.argmax(vectors @ centroids.T, axis=1)
+        if step and np.array_equal(new_labels, labels):
+            break
+        labels = new_labels
+        for index in range(k):
+            members = vectors[labels == index]
+            if len(members):
+                centroid = members.sum(axis=0)
+                centroids[index] = centroid / (np.linalg.norm(centroid) or 1.0)
+    return labels
+
+
+def merge_close_clusters(vectors: np.ndarray, labels: np.ndarray, threshold: float) -> np.ndarray:
+    """Union clusters whose centroids have cosine similarity >= threshold; relabel densely."""
+    present = np.unique(labels)
+    centroids = np.stack([vectors[labels == label].mean(axis=0) for label in present])
+    centroids /= np.linalg.norm(centroids, axis=1, keepdims=True).clip(min=1e-12)
+    parent = list(range(len(present)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    similarity = centroids @ centroids.T
+    rows, cols = np.nonzero(np.triu(similarity >= threshold, k=1))
+    for row, col in zip(rows.tolist(), cols.tolist()):
+        parent[find(row)] = find(col)
+    roots = {label: find(index) for index, label in enumerate(present.tolist())}
+    dense = {root: position for position, root in enumerate(sorted(set(roots.values())))}
+    return np.array([dense[roots[label]] for label in labels.tolist()], dtype=np.int64)
+
+
+def document_line(record: DocumentRecord) -> str:
+    return f"- ({record.id}) [{record.source}] {record.title} :: {record.summary[:200]}"
+
+
+class EmbeddingClusterAgent:
+    """
+    Drop-in replacement for `ClusterAgent` that groups records with NumPy and spends one
+    small LLM call per cluster on its `label` and `rationale`.
+    """
+
+    def __init__(
+        self,
+        factory: LLMFactory,
+        *,
+        batch_size: int = 64,
+        max_clusters: int = 12,
+        merge_threshold: float = 0.85,
+        max_concurrency: int = 4,
+    ) -> None:
+        self.embeddings = factory.embeddings()
+        self.batch_size = batch_size
+        self.max_clusters = max_clusters
+        self.merge_threshold = merge_threshold
+        self._limit = asyncio.Semaphore(max_concurrency)
+        prompt = PromptTemplate(
+            template=(
+                "You receive a group of related news records:\n{documents}\n"
+                "Respond with a JSON object with a short thematic `label` and a one-sentence "
+                "`rationale` explaining what ties the records together.\n"
+            ),
+            input_variables=["documents"],
+        )
+        self.chain = LLMChain(llm=factory.writer_model(), prompt=prompt, verbose=False)
+
+    async def _embed(self, texts: Sequence[str]) -> np.ndarray:
+        async def embed_batch(batch: Sequence[str]) -> List[List[float]]:
+            async with self._limit:
+                return await self.embeddings.aembed_documents(list(batch))
+
+        batches = [texts[i : i + self.batch_size] for i in range(0, len(texts), self.batch_size)]
+        results = await asyncio.gather(*[embed_batch(batch) for batch in batches])
+        vectors = np.asarray([vector for batch in results for vector in batch], dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True).clip(min=1e-12)
+        return vectors
+
+    async def _describe(self, members: List[DocumentRecord]) -> Dict[str, Any]:
+        async with self._limit:
+            response = await self.chain.apredict(
+                documents="\n".join(document_line(record) for record in members)
+            )
+        try:
+            described = json.loads(response)
+        except json.JSONDecodeError:
+            described = {}
+        if not isinstance(described, dict):
+            described = {}
+        return {
+            "label": described.get("label") or members[0].title,
+            "rationale": described.get("rationale") or response,
+            "ids": [record.id for record in members],
+        }
+
+    async def run(self, records: Sequence[DocumentRecord]) -> Dict[str, Any]:
+        records = list(records)
+        if not records:
+            return {"clusters": [], "clean_documents": []}
+        vectors = await self._embed([f"{record.title}\n{record.summary}" for record in records])
+        labels = spherical_kmeans(vectors, auto_k(len(records), self.max_clusters))
+        labels = merge_close_clusters(vectors, labels, self.merge_threshold)
+        groups: Dict[int, List[DocumentRecord]] = {}
+        for record, label in zip(records, labels.tolist()):
+            groups.setdefault(label, []).append(record)
+        clusters = await asyncio.gather(*[self._describe(members) for members in groups.values()])
+        return {"clusters": list(clusters), "clean_documents": records}
@@ -4,29 +4,105 @@ Utility helpers for creating LangChain LLM instances.
 
 from __future__ import annotations
 
-from langchain_anthropic import ChatAnthropic
+from pathlib import Path
+from typing import List, Literal, Optional, Type
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.embeddings import Embeddings
 from langchain_core.language_models import BaseChatModel
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
 from ..config import RuntimeConfig
+from ..utils.embedding_store import CachedEmbeddings, EmbeddingStore
+from ..utils.metrics import TokenCountingHandler
+from ..utils.prompt_packing import PromptPacker
+from ..utils.replay import ReplayChatModel, ReplayEmbeddings
+from .llm_cache import ResponseCache
+
+EMBEDDING_MODEL = "text-embedding-3-large"
+
+Provider = Literal["openai", "anthropic"]
+
+
+def _chat_model_class(provider: Provider) -> Type[BaseChatModel]:
+    # Provider SDKs are imported on first model construction, not at module import.
+    if provider == "anthropic":
+        from langchain_anthropic import ChatAnthropic
+
+        return ChatAnthropic
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI
 
 
 class LLMFactory:
     def __init__(self, config: RuntimeConfig) -> None:
         self.config = config
+        self.replay_mode = config.replay.mode
+        self.callbacks: List[BaseCallbackHandler] = [TokenCountingHandler()]
+        self.response_cache: Optional[ResponseCache] = None
+        self._embeddings: Optional[Embeddings] = None
+        if self.replay_mode != "off":
+            # Fixture runs use the response cache as the recording itself, without eviction.
+            self.response_cache = ResponseCache(
+                config.replay.fixtures_dir / "llm",
+                max_entries=10**9,
+            )
+        elif config.cache.llm_enabled:
+            self.response_cache = ResponseCache(
+                config.cache.directory / "llm_responses",
+                max_entries=config.cache.llm_max_entries,
+            )
+
+    def _chat(self, provider: Provider, model: str, temperature: float) -> BaseChatModel:
+        cache = self.response_cache.for_model(model, temperature) if self.response_cache else None
+        model_cls: Type[BaseChatModel]
+        if self.replay_mode == "replay":
+            model_cls = ReplayChatModel
+        else:
+            model_cls = _chat_model_class(provider)
+        return model_cls(
+            model=model,
+            temperature=temperature,
+            cache=cache,
+            callbacks=self.callbacks,
+        )
 
     def planner_model(self) -> BaseChatModel:
         if self.config.api.anthropic_api_key:
-            return ChatAnthropic(model="claude-3-5-sonnet-20240620", temperature=0.2)
-        return ChatOpenAI(model="gpt-4o-mini", temperature=0.2)
+            return self._chat("anthropic", "claude-3-5-sonnet-20240620", 0.2)
+        return self._chat("openai", "gpt-4o-mini", 0.2)
 
     def writer_model(self) -> BaseChatModel:
-        return ChatOpenAI(model="gpt-4o-mini", temperature=0.5)
+        return self._chat("openai", "gpt-4o-mini", 0.5)
 
     def critic_model(self) -> BaseChatModel:
         if self.config.api.anthropic_api_key:
-            return ChatAnthropic(model="claude-3-haiku-20240307", temperature=0.1)
-        return ChatOpenAI(model="gpt-4o-mini", temperature=0.1)
+            return self._chat("anthropic", "claude-3-haiku-20240307", 0.1)
+        return self._chat("openai", "gpt-4o-mini", 0.1)
+
+    def packer(self, llm: BaseChatModel) -> PromptPacker:
+        """Prompt packer sized to the per-model budget from `RuntimeConfig.prompts`."""
+        model = getattr(llm, "model_name", None) or getattr(llm, "model", None) or "gpt-4o-mini"
+        prompts = self.config.prompts
+        return PromptPacker(model, prompts.budgets.get(model, prompts.default_budget))
+
+    def embeddings(self) -> Embeddings:
+        """Shared embeddings client, backed by the on-disk vector store when enabled."""
+        if self._embeddings is None:
+            embeddings: Embeddings
+            if self.replay_mode == "replay":
+                embeddings = ReplayEmbeddings()
+            else:
+                from langchain_openai import OpenAIEmbeddings
 
-    def embeddings(self) -> OpenAIEmbeddings:
-        return OpenAIEmbeddings(model="text-embedding-3-large")
+                embeddings = OpenAIEmbeddings(model=EMBEDDING_MODEL)
+            store_dir: Optional[Path] = None
+            if self.replay_mode != "off":
+                store_dir = self.config.replay.fixtures_dir / "embeddings"
+            elif self.config.cache.embeddings_enabled:
+                store_dir = self.config.cache.directory / "embeddings"
+            if store_dir is not None:
+                store = EmbeddingStore(store_dir, EMBEDDING_MODEL)
+                embeddings = CachedEmbeddings(embeddings, store)
+            self._embeddings = embeddings
+        return self._embeddings
@@ -0,0 +1,119 @@
+"""
+Content-addressed response cache for LangChain chat models.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.load import dumps, loads
+
+
+class ResponseCache:
+    """
+    File store of serialized generations, one JSON file per key, sharded by key prefix.
+
+    Hits refresh the file mtime so eviction drops the least recently used entries once
+    the store grows past `max_entries`.
+    """
+
+    def __init__(self, root: Path, *, max_entries: int = 20_000) -> None:
+        self.root = root
+        self.max_entries = max_entries
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._count = sum(1 for _ in self.root.glob("*/*.json"))
+
+    @staticmethod
+    def key(model: str, temperature: Optional[float], prompt: str, llm_string: str = "") -> str:
+        # `llm_string` carries the rest of the model's parameters (max_tokens, stop, ...),
+        # so changing any of them misses instead of returning another setting's answer.
+        digest = hashlib.sha256(prompt.encode("utf-8")).hexdigest()
+        params = hashlib.sha256(llm_string.encode("utf-8")).hexdigest()
+        material = f"{model}\x1f{temperature}\x1f{params}\x1f{digest}"
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        path = self._path(key)
+        try:
+            payload = path.read_text(encoding="utf-8")
+        except FileNotFoundError:
+            return None
+        os.utime(path)
+        return payload
+
+    def put(self, key: str, payload: str) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        existed = path.exists()
+        # Shard processes can write the same key at once, so each writer gets its own
+        # temp file and the last complete one wins.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+        ) as handle:
+            handle.write(payload)
+        try:
+            os.replace(handle.name, path)
+        except OSError:
+            Path(handle.name).unlink(missing_ok=True)
+            raise
+        if not existed:
+            self._count += 1
+        if self._count > self.max_entries * 1.1:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self.root.glob("*/*.json"), key=lambda item: item.stat().st_mtime)
+        overflow = len(entries) - self.max_entries
+        for path in entries[: max(overflow, 0)]:
+            path.unlink(missing_ok=True)
+        self._count = min(len(entries), self.max_entries)
+
+    def clear(self) -> None:
+        shutil.rmtree(self.root, ignore_errors=True)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._count = 0
+
+    def for_model(self, model: str, temperature: Optional[float]) -> "ModelResponseCache":
+        return ModelResponseCache(self, model=model, temperature=temperature)
+
+
+class ModelResponseCache(BaseCache):
+    """
+    LangChain cache view bound to one model name and temperature.
+    """
+
+    def __init__(self, store: ResponseCache, *, model: str, temperature: Optional[float]) -> None:
+        self.store = store
+        self.model = model
+        self.temperature = temperature
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        payload = self.store.get(
+            ResponseCache.key(self.model, self.temperature, prompt, llm_string)
+        )
+        if payload is None:
+            return None
+        generations = [loads(item) for item in json.loads(payload)]
+        # Tagged so token accounting can tell hits from provider calls.
+        for generation in generations:
+            generation.generation_info = {**(generation.generation_info or {}), "cached": True}
+        return generations
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        payload = json.dumps([dumps(generation) for generation in return_val])
+        self.store.put(
+            ResponseCache.key(self.model, self.temperature, prompt, llm_string), payload
+        )
+
+    def clear(self, **kwargs: Any) -> None:
+        self.store.clear()
@@ -4,16 +4,16 @@ Planner ↔ reviewer loop backed by BabyAGI.
 
 from __future__ import annotations
 
-from typing import Dict, List
+from typing import Any, Dict, List, Optional
 
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
-from langchain_experimental.agents.baby_agi import BabyAGI
-from langchain_community.vectorstores import DocArrayInMemorySearch
 
 from ..config import RuntimeConfig
 from .llm import LLMFactory
 
+_ANCHOR = "Humanity's Diary anchor memory."
+
 
 def _task_execution_chain(factory: LLMFactory) -> LLMChain:
     prompt = PromptTemplate(
@@ -29,21 +29,15 @@ def _task_execution_chain(factory: LLMFactory) -> LLMChain:
 
 
 class PlannerReviewerLoop:
+    """
+    BabyAGI planner plus a reviewer chain. The anchor embedding is computed on the first
+    `run` (or `warm`) and reused; each run gets its own vector store around it.
+    """
+
     def __init__(self, config: RuntimeConfig, factory: LLMFactory) -> None:
         self.config = config
         self.factory = factory
-        embeddings = factory.embeddings()
-        self.vectorstore = DocArrayInMemorySearch.from_texts(
-            ["Humanity's Diary anchor memory."],
-            embedding=embeddings,
-        )
-        self._baby_agi = BabyAGI.from_llm(
-            llm=factory.planner_model(),
-            vectorstore=self.vectorstore,
-            task_execution_chain=_task_execution_chain(factory),
-            verbose=False,
-            max_iterations=config.planner.max_iterations,
-        )
+        self._anchor: Optional[List[float]] = None
         review_prompt = PromptTemplate(
             template=(
                 "You are the Humanity's Diary reviewer.\n"
@@ -58,8 +52,40 @@ class PlannerReviewerLoop:
             verbose=False,
         )
 
+    def _anchor_embedding(self) -> List[float]:
+        if self._anchor is None:
+            self._anchor = self.factory.embeddings().embed_documents([_ANCHOR])[0]
+        return self._anchor
+
+    def _vectorstore(self) -> Any:
+        from langchain_community.vectorstores import DocArrayInMemorySearch
+
+        vectorstore = DocArrayInMemorySearch.from_params(self.factory.embeddings())
+        vectorstore.doc_index.index(
+            [vectorstore.doc_cls(text=_ANCHOR, embedding=self._anchor_embedding(), metadata={})]
+        )
+        return vectorstore
+
+    def _planner(self) -> Any:
+        # BabyAGI keeps its task list on the instance and writes task results into its
+        # vector store, so each run gets a fresh agent and store: concurrent editions and
+        # service jobs neither read each other's results nor grow one store forever.
+        from langchain_experimental.agents.baby_agi import BabyAGI
+
+        return BabyAGI.from_llm(
+            llm=self.factory.planner_model(),
+            vectorstore=self._vectorstore(),
+            task_execution_chain=_task_execution_chain(self.factory),
+            verbose=False,
+            max_iterations=self.config.planner.max_iterations,
+        )
+
+    def warm(self) -> None:
+        """Embed the anchor now (one embedding call) instead of on the first run."""
+        self._anchor_embedding()
+
     async def run(self, directive: str) -> Dict[str, List[Dict[str, str]]]:
-        result = await self._baby_agi.acall({"objective": directive})
+        result = await self._planner().acall({"objective": directive})
         task_list = result.get("task_list") or result.get("tasks") or []
         plan_lines = []
         structured_tasks: List[Dict[str, str]] = []
@@ -4,9 +4,12 @@ Publish + memory agents to export entries and store feedback.
 
 from __future__ import annotations
 
-import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional
+from typing import Any, Dict, Iterable, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from ..utils.memory_store import MemoryEntry, MemoryStore, entry_lede
 
 
 class PublishAgent:
@@ -20,33 +23,96 @@ class PublishAgent:
         revisions: Iterable[Dict[str, Any]],
         sensemaking: Iterable[Dict[str, Any]],
         review: Any,
+        edition: Optional[str] = None,
     ) -> Dict[str, Any]:
         revision_map = {revision.get("id"): revision for revision in revisions}
         winner = revision_map.get(selection.get("winner_id")) or next(iter(revision_map.values()), None)
         entry = _render_entry(winner, sensemaking)
-        output_path = self.output_dir / f"entry-{selection.get('winner_id', 'draft')}.md"
+        # Editions in a batch share winner ids like `draft-1`, so each gets its own folder.
+        output_dir = self.output_dir / edition if edition else self.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_path = output_dir / f"entry-{selection.get('winner_id', 'draft')}.md"
         output_path.write_text(entry)
         return {
             "published_entry": entry,
             "publish_path": str(output_path),
-            "publication_meta": {"review": review, "selection": selection},
+            "publication_meta": {"review": review, "selection": selection, "edition": edition},
         }
 
 
 class MemoryAgent:
-    def __init__(self, memory_path: Optional[Path] = None) -> None:
-        self.memory_path = memory_path or Path(".cache/newsroom_memory.jsonl")
-        self.memory_path.parent.mkdir(parents=True, exist_ok=True)
-
-    async def run(self, publication_payload: Dict[str, Any], planner_feedback: Any) -> Dict[str, Any]:
-        frame = {
-            "published_entry": publication_payload.get("published_entry"),
-            "metadata": publication_payload.get("publication_meta"),
-            "planner_feedback": planner_feedback,
-        }
-        with self.memory_path.open("a", encoding="utf-8") as handle:
-            handle.write(json.dumps(frame) + "\n")
-        return {"memory_write": str(self.memory_path)}
+    """
+    Records each published edition in the `MemoryStore`, tagged with its regions and
+    themes and embedded for similarity lookups, and compacts the store periodically.
+    """
+
+    def __init__(
+        self,
+        store: Optional[MemoryStore] = None,
+        *,
+        embeddings: Optional[Embeddings] = None,
+        legacy_path: Optional[Path] = None,
+        compact_every: int = 50,
+        full_text_days: Optional[int] = None,
+    ) -> None:
+        if store is None:
+            store = MemoryStore(Path(".cache/newsroom_memory.duckdb"))
+        self.store = store
+        self.embeddings = embeddings
+        self.compact_every = compact_every
+        self.full_text_days = full_text_days
+        legacy_path = legacy_path or Path(".cache/newsroom_memory.jsonl")
+        if legacy_path.exists() and not len(self.store):
+            self.store.import_jsonl(legacy_path)
+            legacy_path.rename(legacy_path.with_name(f"{legacy_path.name}.imported"))
+
+    async def run(
+        self,
+        publication_payload: Dict[str, Any],
+        planner_feedback: Any,
+        *,
+        sensemaking: Iterable[Dict[str, Any]] = (),
+        tasks: Iterable[Any] = (),
+        run_id: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        published = publication_payload.get("published_entry")
+        metadata = publication_payload.get("publication_meta") or {}
+        themes = [str(item["theme"]) for item in sensemaking if item.get("theme")]
+        regions = [
+            str(task["region"]) for task in tasks if isinstance(task, dict) and task.get("region")
+        ]
+        lede = entry_lede(published)
+        embedding = None
+        if self.embeddings is not None and published:
+            embedding = await self.embeddings.aembed_query(_embedding_text(lede, themes, published))
+        entry_id = self.store.add(
+            MemoryEntry(
+                published_entry=published,
+                metadata=metadata,
+                planner_feedback=planner_feedback,
+                edition=metadata.get("edition"),
+                winner_id=(metadata.get("selection") or {}).get("winner_id"),
+                lede=lede,
+                regions=regions,
+                themes=themes,
+                embedding=embedding,
+                run_id=run_id,
+            )
+        )
+        if self.compact_every and self.store.writes_since_compaction() >= self.compact_every:
+            self.store.compact(full_text_days=self.full_text_days)
+        return {"memory_write": str(self.store.path), "memory_entry_id": entry_id}
+
+    async def recall(self, text: str, *, k: int = 5, **filters: Any) -> List[Dict[str, Any]]:
+        """Past entries closest to `text`; `filters` are passed to `MemoryStore.similar`."""
+        if self.embeddings is None:
+            return []
+        return self.store.similar(await self.embeddings.aembed_query(text), k=k, **filters)
+
+
+def _embedding_text(lede: Optional[str], themes: List[str], entry: str) -> str:
+    # Lede and themes first: they carry the topic; the body is clipped to bound the cost.
+    return "\n".join([lede or "", ", ".join(themes), entry[:4000]])
 
 
 def _render_entry(revision: Optional[Dict[str, Any]], sensemaking: Iterable[Dict[str, Any]]) -> str:
@@ -56,8 +122,9 @@ def _render_entry(revision: Optional[Dict[str, Any]], sensemaking: Iterable[Dict
         f"- **{item.get('theme')}** ({item.get('impact')}/{item.get('uncertainty')}): {item.get('why_it_matters')}"
         for item in sensemaking
     )
+    lede = revision.get("lede", "Humanity's Diary")
     return (
-        f"# {revision.get('lede', \"Humanity's Diary\")}\n\n"
+        f"# {lede}\n\n"
         f"{revision.get('body', '')}\n\n"
         f"## Why it matters\n{bullets}\n"
     )
@@ -0,0 +1,163 @@
+"""
+Cleaner ranking: weighted recency / adapter score / source diversity, selected with
+per-domain heaps and an optional global cap, with a per-record explanation.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional, Tuple
+
+import numpy as np
+
+from ..adapters.base import DocumentRecord
+
+
+@dataclass(frozen=True)
+class RankingWeights:
+    """
+    `recency` is charged linearly per `age_unit_hours` of age, so with `score=1.0` a perfect
+    adapter score offsets one age unit. `diversity` is charged per record already kept from the
+    same domain and only decides which records survive the global cap. The defaults
+    (recency only) keep the newest records of each domain.
+    """
+
+    recency: float = 1.0
+    score: float = 0.0
+    diversity: float = 0.0
+    age_unit_hours: float = 24.0
+
+    def components(
+        self, timestamp: float, adapter_score: float, now: float
+    ) -> Tuple[float, float]:
+        # Undated records count as published at the epoch, i.e. last on recency.
+        age_units = (now - timestamp) / (self.age_unit_hours * 3600.0)
+        return -self.recency * age_units, self.score * adapter_score
+
+    def base_scores(self, timestamps: np.ndarray, scores: np.ndarray, now: float) -> np.ndarray:
+        ages = (now - timestamps) / (self.age_unit_hours * 3600.0)
+        return -self.recency * ages + self.score * scores
+
+
+def _record_timestamp(record: DocumentRecord) -> float:
+    return record.published_at.timestamp() if record.published_at else 0.0
+
+
+class DomainTopK:
+    """
+    Keep the best `k` records per domain in one pass: each domain has a min-heap of
+    `[base, -sequence, record, key]`, so a push costs O(log k) and ties go to the earlier
+    arrival. `select` then applies the diversity penalty and the global `max_total` cap
+    with one more heap, and annotates `metadata["ranking"]` on every kept record.
+    """
+
+    def __init__(
+        self,
+        k: int,
+        weights: Optional[RankingWeights] = None,
+        *,
+        max_total: Optional[int] = None,
+        now: Optional[float] = None,
+    ) -> None:
+        self.k = k
+        self.weights = weights or RankingWeights()
+        self.max_total = max_total
+        self.now = now if now is not None else time.time()
+        self.seen = 0
+        self.dropped_quota = 0
+        self._heaps: Dict[str, List[List[Any]]] = {}
+        self._entries: Dict[str, Tuple[str, List[Any]]] = {}
+        self._sequence = 0
+
+    def score(self, record: DocumentRecord) -> float:
+        recency, adapter = self.weights.components(
+            _record_timestamp(record), record.score or 0.0, self.now
+        )
+        return recency + adapter
+
+    def push(
+        self,
+        key: str,
+        record: DocumentRecord,
+        base: Optional[float] = None,
+    ) -> None:
+        """Offer `record`; a `key` already held is replaced in place (better duplicate)."""
+        base = self.score(record) if base is None else base
+        domain = record.domain or "unknown"
+        held = self._entries.get(key)
+        if held is not None:
+            heap = self._heaps[held[0]]
+            held[1][0], held[1][2] = base, record
+            heapq.heapify(heap)
+            return
+        self.seen += 1
+        self._sequence += 1
+        entry = [base, -self._sequence, record, key]
+        heap = self._heaps.setdefault(domain, [])
+        if len(heap) < self.k:
+            heapq.heappush(heap, entry)
+        elif entry[:2] > heap[0][:2]:
+            evicted = heapq.heapreplace(heap, entry)
+            del self._entries[evicted[3]]
+            self.dropped_quota += 1
+        else:
+            self.dropped_quota += 1
+            return
+        self._entries[key] = (domain, entry)
+
+    def holds(self, key: str) -> bool:
+        return key in self._entries
+
+    def select(self) -> Tuple[List[DocumentRecord], Dict[str, Any]]:
+        """
+        Kept records grouped by domain (domains ordered by their best record, best first
+        within a domain), plus a report of what was dropped and why.
+        """
+        weights = self.weights
+        ranked: List[Tuple[float, int, int, List[Any]]] = []
+        for heap in self._heaps.values():
+            for rank, entry in enumerate(sorted(heap, key=lambda item: item[:2], reverse=True)):
+                ranked.append((entry[0] - weights.diversity * rank, entry[1], rank, entry))
+        dropped_cap = 0
+        if self.max_total is not None and len(ranked) > self.max_total:
+            dropped_cap = len(ranked) - self.max_total
+            ranked = heapq.nlargest(self.max_total, ranked, key=lambda item: item[:2])
+
+        groups: Dict[str, List[Tuple[float, int, int, List[Any]]]] = {}
+        for item in ranked:
+            groups.setdefault(item[3][2].domain or "unknown", []).append(item)
+        ordered = sorted(
+            groups.values(),
+            key=lambda group: max(item[3][:2] for item in group),
+            reverse=True,
+        )
+        kept: List[DocumentRecord] = []
+        for group in ordered:
+            for total, _, rank, entry in sorted(group, key=lambda item: item[3][:2], reverse=True):
+                record = entry[2]
+                timestamp = _record_timestamp(record)
+                recency, adapter = weights.components(timestamp, record.score or 0.0, self.now)
+                record.metadata["ranking"] = {
+                    "score": round(total, 4),
+                    "recency": round(recency, 4),
+                    "adapter_score": round(adapter, 4),
+                    "diversity": round(-weights.diversity * rank, 4),
+                    "domain_rank": rank,
+                    "age_hours": (
+                        round((self.now - timestamp) / 3600.0, 2) if record.published_at else None
+                    ),
+                }
+                kept.append(record)
+        report = {
+            "considered": self.seen,
+            "kept": len(kept),
+            "dropped_domain_quota": self.dropped_quota,
+            "dropped_global_cap": dropped_cap,
+            "domains": len(groups),
+            "weights": asdict(weights),
+            "max_per_domain": self.k,
+            "max_total": self.max_total,
+        }
+        return kept, report
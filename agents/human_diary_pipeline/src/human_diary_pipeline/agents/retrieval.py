@@ -6,14 +6,25 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Any, Dict, Iterable, List
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Iterable, List, Optional
 
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 
+from ..adapters.archive import LocalArchiveAdapter
 from ..adapters.base import DocumentRecord, SourceAdapter
+from ..adapters.resilience import provider_health
 from ..utils import provenance
+from ..utils.prompt_packing import compact_json, map_reduce
+from .clustering import document_line
 from .llm import LLMFactory
+from .ranking import DomainTopK, RankingWeights
+from .scheduler import RetrievalScheduler, SearchOutcome
+
+
+# Applied to each adapter result right after retrieval, e.g. `utils.seen_index.IncrementalFilter`.
+RecordFilter = Callable[[str, List[DocumentRecord]], List[DocumentRecord]]
 
 
 def _task_to_query(task: Any) -> str:
@@ -26,43 +37,252 @@ def _task_to_query(task: Any) -> str:
 
 
 class RetrievalAgent:
-    def __init__(self, adapters: Iterable[SourceAdapter]) -> None:
-        self.adapters = list(adapters)
+    """
+    Fan planner tasks out to the adapters. `LocalArchiveAdapter`s form a first tier that is
+    searched for every task up front; the external adapters are only asked about tasks the
+    archive does not cover.
+    """
 
-    async def run(self, tasks: Iterable[Any]) -> Dict[str, Any]:
-        records: List[DocumentRecord] = []
-        for task in tasks:
-            query = _task_to_query(task)
-            results = await asyncio.gather(
-                *[adapter.search(query) for adapter in self.adapters],
-                return_exceptions=True,
+    def __init__(
+        self,
+        adapters: Iterable[SourceAdapter],
+        scheduler: Optional[RetrievalScheduler] = None,
+    ) -> None:
+        adapters = list(adapters)
+        self.local = [adapter for adapter in adapters if isinstance(adapter, LocalArchiveAdapter)]
+        self.adapters = [adapter for adapter in adapters if adapter not in self.local]
+        self.scheduler = scheduler or RetrievalScheduler()
+
+    async def _search_local(self, task_index: int, query: str) -> List[SearchOutcome]:
+        outcomes: List[SearchOutcome] = []
+        for adapter in self.local:
+            outcome = SearchOutcome(task_index=task_index, query=query, adapter=adapter.name)
+            started = time.perf_counter()
+            try:
+                outcome.records = await adapter.search(query)
+            except Exception as exc:
+                outcome.error = exc
+            outcome.elapsed = time.perf_counter() - started
+            outcomes.append(outcome)
+        return outcomes
+
+    async def stream(
+        self,
+        tasks: Iterable[Any],
+        completion: Optional[List[Dict[str, Any]]] = None,
+        record_filter: Optional[RecordFilter] = None,
+    ) -> AsyncIterator[SearchOutcome]:
+        """
+        Yield adapter outcomes as they land; append a summary to `completion` whenever
+        the last adapter for a task returns, or once the retrieval deadline cuts it short.
+        """
+        queries = [_task_to_query(task) for task in tasks]
+        remaining = [len(self.adapters)] * len(queries)
+        found = [0] * len(queries)
+        archived = [0] * len(queries)
+        failed: List[List[str]] = [[] for _ in queries]
+        completion = completion if completion is not None else []
+        started = time.perf_counter()
+
+        def summary(task_index: int, **extra: Any) -> Dict[str, Any]:
+            return {
+                "task_index": task_index,
+                "query": queries[task_index],
+                "documents": found[task_index],
+                "archive_documents": archived[task_index],
+                "fell_through": task_index in external,
+                "failed_providers": failed[task_index],
+                "elapsed": round(time.perf_counter() - started, 3),
+                **extra,
+            }
+
+        def accept(outcome: SearchOutcome) -> None:
+            if outcome.error is None and record_filter is not None:
+                outcome.records = record_filter(outcome.query, outcome.records)
+            if outcome.error is None:
+                found[outcome.task_index] += len(outcome.records)
+            else:
+                failed[outcome.task_index].append(outcome.adapter)
+
+        external: List[int] = list(range(len(queries)))
+        if self.local:
+            # Filtered before the coverage check, so already-seen archive hits don't count.
+            local = await asyncio.gather(
+                *[self._search_local(index, query) for index, query in enumerate(queries)]
             )
-            for result in results:
-                if isinstance(result, Exception):
-                    continue
-                records.extend(result)
-        return {"raw_documents": records}
+            external = []
+            for task_index, outcomes in enumerate(local):
+                for outcome in outcomes:
+                    accept(outcome)
+                    archived[task_index] += len(outcome.records)
+                covered = any(
+                    outcome.error is None and adapter.covers(outcome.records)
+                    for adapter, outcome in zip(self.local, outcomes)
+                )
+                if covered or not self.adapters:
+                    remaining[task_index] = 0
+                    completion.append(summary(task_index))
+                else:
+                    external.append(task_index)
+                for outcome in outcomes:
+                    yield outcome
+
+        async for outcome in self.scheduler.stream(
+            [queries[index] for index in external], self.adapters
+        ):
+            outcome.task_index = external[outcome.task_index]
+            accept(outcome)
+            remaining[outcome.task_index] -= 1
+            if remaining[outcome.task_index] == 0:
+                completion.append(summary(outcome.task_index))
+            yield outcome
+        # The scheduler stops early when the retrieval deadline expires; record what is
+        # missing so downstream nodes (and operators) can tell a partial edition apart.
+        for task_index, pending in enumerate(remaining):
+            if pending:
+                completion.append(summary(task_index, pending_providers=pending, partial=True))
+
+    async def run(
+        self,
+        tasks: Iterable[Any],
+        record_filter: Optional[RecordFilter] = None,
+    ) -> Dict[str, Any]:
+        completion: List[Dict[str, Any]] = []
+        records: List[DocumentRecord] = []
+        health = provider_health(self.adapters)
+        async for outcome in self.stream(tasks, completion, record_filter):
+            if outcome.error is None:
+                records.extend(outcome.records)
+        return {
+            "raw_documents": records,
+            "task_completion": completion,
+            "provider_health": provider_health(self.adapters, since=health),
+        }
+
+    async def run_streaming(
+        self,
+        tasks: Iterable[Any],
+        cleaner: "IncrementalCleaner",
+        record_filter: Optional[RecordFilter] = None,
+    ) -> Dict[str, Any]:
+        """Feed results straight into `cleaner` so the raw list is never materialized."""
+        completion: List[Dict[str, Any]] = []
+        health = provider_health(self.adapters)
+        async for outcome in self.stream(tasks, completion, record_filter):
+            if outcome.error is None:
+                cleaner.add(outcome.records)
+        clean_documents = cleaner.result()
+        return {
+            "clean_documents": clean_documents,
+            "cleaning_report": cleaner.report,
+            "task_completion": completion,
+            "provider_health": provider_health(self.adapters, since=health),
+        }
 
 
 class CleanerAgent:
-    def __init__(self, max_per_theme: int = 12) -> None:
+    """
+    Normalize, then keep the best `max_per_theme` records per domain (and at most
+    `max_documents` overall) under `RankingWeights`. Every kept record carries its
+    ranking breakdown in `metadata["ranking"]`, and `cleaning_report` says what was cut.
+    """
+
+    def __init__(
+        self,
+        max_per_theme: int = 12,
+        *,
+        near_duplicates: bool = True,
+        near_duplicate_threshold: float = 0.8,
+        weights: Optional[RankingWeights] = None,
+        max_documents: Optional[int] = None,
+    ) -> None:
         self.max_per_theme = max_per_theme
+        self.near_duplicates = near_duplicates
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.weights = weights or RankingWeights()
+        self.max_documents = max_documents
+
+    def selector(self) -> DomainTopK:
+        return DomainTopK(self.max_per_theme, self.weights, max_total=self.max_documents)
 
     async def run(self, records: Iterable[DocumentRecord]) -> Dict[str, Any]:
-        normalized = provenance.normalize(records)
-        normalized.sort(
-            key=lambda record: record.published_at.timestamp() if record.published_at else 0.0,
-            reverse=True,
+        batch = provenance.normalize_batch(
+            records,
+            near_duplicates=self.near_duplicates,
+            near_duplicate_threshold=self.near_duplicate_threshold,
         )
-        buckets = provenance.cluster_by_domain(normalized)
+        selector = self.selector()
+        # Normalization runs per record; only the base scores are computed over the batch
+        # columns in one step. The heap pass is O(n log k) instead of sorting everything.
+        bases = self.weights.base_scores(batch.timestamps, batch.scores, selector.now)
+        for index, (record, base) in enumerate(zip(batch.records, bases.tolist())):
+            selector.push(str(index), record, base)
+        curated, report = selector.select()
+        return {"clean_documents": curated, "cleaning_report": report}
+
+    def incremental(self) -> "IncrementalCleaner":
+        return IncrementalCleaner(
+            self.max_per_theme,
+            near_duplicates=self.near_duplicates,
+            near_duplicate_threshold=self.near_duplicate_threshold,
+            selector=self.selector(),
+        )
+
+
+class IncrementalCleaner:
+    """
+    Streaming counterpart of `CleanerAgent`: records are normalized and deduped as they
+    arrive and fed to the same `DomainTopK` selector, so memory stays bounded by the
+    output size (plus one best score per canonical URL). Near-duplicate merging runs once
+    over the selected set.
+
+    The result matches `CleanerAgent.run` except when a better-scored but older duplicate
+    replaces a retained record: records evicted before that point are not reconsidered.
+    """
+
+    def __init__(
+        self,
+        max_per_theme: int = 12,
+        *,
+        near_duplicates: bool = True,
+        near_duplicate_threshold: float = 0.8,
+        selector: Optional[DomainTopK] = None,
+    ) -> None:
+        self.max_per_theme = max_per_theme
+        self.near_duplicates = near_duplicates
+        self.near_duplicate_threshold = near_duplicate_threshold
+        self.selector = selector or DomainTopK(max_per_theme)
+        self._best_scores: Dict[str, float] = {}
+        self.report: Dict[str, Any] = {}
+
+    def add(self, records: Iterable[DocumentRecord]) -> None:
+        for record in provenance.enrich_provenance(records):
+            key = record.canonical_url or record.id
+            score = record.score or 0
+            if key in self._best_scores and score <= self._best_scores[key]:
+                continue
+            self._best_scores[key] = score
+            self.selector.push(key, record)
+
+    def result(self) -> List[DocumentRecord]:
+        kept, self.report = self.selector.select()
+        if self.near_duplicates:
+            kept = provenance.merge_near_duplicates(kept, threshold=self.near_duplicate_threshold)
         curated: List[DocumentRecord] = []
-        for _, bucket in buckets.items():
-            curated.extend(bucket[: self.max_per_theme])
-        return {"clean_documents": curated}
+        for bucket in provenance.cluster_by_domain(kept).values():
+            curated.extend(bucket)
+        self.report["kept"] = len(curated)
+        return curated
 
 
 class ClusterAgent:
-    def __init__(self, factory: LLMFactory) -> None:
+    """
+    Single-prompt LLM clustering. Record lists larger than the writer model's prompt
+    budget are clustered chunk by chunk in parallel, then merged by one reduce call.
+    """
+
+    def __init__(self, factory: LLMFactory, max_concurrency: int = 4) -> None:
+        self.max_concurrency = max_concurrency
         prompt = PromptTemplate(
             template=(
                 "You receive cleaned news records:\n{documents}\n"
@@ -71,16 +291,49 @@ class ClusterAgent:
             ),
             input_variables=["documents"],
         )
-        self.chain = LLMChain(llm=factory.writer_model(), prompt=prompt, verbose=False)
+        reduce_prompt = PromptTemplate(
+            template=(
+                "These theme groupings were produced for separate batches of the same "
+                "news records:\n{clusters}\n"
+                "Merge groups that describe the same theme. Respond with JSON list where "
+                "each entry has `label`, `rationale`, and `ids`.\n"
+            ),
+            input_variables=["clusters"],
+        )
+        llm = factory.writer_model()
+        self.packer = factory.packer(llm)
+        self.overhead = self.packer.tokens(prompt.template)
+        self.chain = LLMChain(llm=llm, prompt=prompt, verbose=False)
+        self.reduce_chain = LLMChain(llm=llm, prompt=reduce_prompt, verbose=False)
 
-    async def run(self, records: Iterable[DocumentRecord]) -> Dict[str, Any]:
-        doc_lines = [
-            f"- ({record.id}) [{record.source}] {record.title} :: {record.summary[:200]}"
-            for record in records
-        ]
-        response = await self.chain.apredict(documents="\n".join(doc_lines))
+    async def _cluster(self, records: List[DocumentRecord]) -> List[Dict[str, Any]]:
+        response = await self.chain.apredict(
+            documents="\n".join(document_line(record) for record in records)
+        )
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            return [{"label": "misc", "rationale": response, "ids": [r.id for r in records]}]
+
+    async def _merge(self, partials: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        combined = [cluster for partial in partials for cluster in partial]
+        payload = compact_json(combined)
+        if not self.packer.fits(payload, overhead=self.overhead):
+            return combined
+        response = await self.reduce_chain.apredict(clusters=payload)
         try:
-            clusters = json.loads(response)
+            merged = json.loads(response)
         except json.JSONDecodeError:
-            clusters = [{"label": "misc", "rationale": response, "ids": [r.id for r in records]}]
-        return {"clusters": clusters, "clean_documents": list(records)}
+            return combined
+        return merged if isinstance(merged, list) else combined
+
+    async def run(self, records: Iterable[DocumentRecord]) -> Dict[str, Any]:
+        records = list(records)
+        chunks = self.packer.pack(records, document_line, overhead=self.overhead)
+        if len(chunks) <= 1:
+            clusters = await self._cluster(records)
+        else:
+            clusters = await map_reduce(
+                chunks, self._cluster, self._merge, max_concurrency=self.max_concurrency
+            )
+        return {"clusters": clusters, "clean_documents": records}
@@ -0,0 +1,164 @@
+"""
+Concurrency scheduler that fans (task, adapter) searches out under global and per-provider caps.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import AsyncIterator, Deque, Dict, List, Mapping, Optional, Sequence, Tuple
+
+from ..adapters.base import DocumentRecord, SourceAdapter
+from ..config import RetrievalConfig
+from ..utils.metrics import record_adapter_call
+
+
+@dataclass
+class SearchOutcome:
+    task_index: int
+    query: str
+    adapter: str
+    records: List[DocumentRecord] = field(default_factory=list)
+    error: Optional[BaseException] = None
+    elapsed: float = 0.0
+    hedged: bool = False
+
+
+class LatencyTracker:
+    """Rolling window of successful call latencies per provider."""
+
+    def __init__(self, window: int = 200) -> None:
+        self.window = window
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def observe(self, provider: str, elapsed: float) -> None:
+        samples = self._samples.get(provider)
+        if samples is None:
+            samples = self._samples[provider] = deque(maxlen=self.window)
+        samples.append(elapsed)
+
+    def quantile(self, provider: str, q: float, min_samples: int = 1) -> Optional[float]:
+        samples = self._samples.get(provider)
+        if not samples or len(samples) < min_samples:
+            return None
+        ordered = sorted(samples)
+        return ordered[min(int(q * len(ordered)), len(ordered) - 1)]
+
+
+class RetrievalScheduler:
+    """
+    Issue every (task, adapter) search at once, bounded by a global in-flight cap and a
+    per-provider cap, and yield outcomes in completion order.
+
+    With a `deadline`, the stream simply ends when it expires and unfinished searches are
+    cancelled. With `hedge_quantile`, a search still running past that quantile of its
+    provider's recent latency gets one backup request and the first answer wins.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = 16,
+        max_per_provider: int = 4,
+        provider_limits: Optional[Mapping[str, int]] = None,
+        deadline: Optional[float] = None,
+        hedge_quantile: Optional[float] = None,
+        hedge_min_samples: int = 20,
+    ) -> None:
+        self.max_in_flight = max_in_flight
+        self.max_per_provider = max_per_provider
+        self.provider_limits = dict(provider_limits or {})
+        self.deadline = deadline
+        self.hedge_quantile = hedge_quantile
+        self.hedge_min_samples = hedge_min_samples
+        self.latency = LatencyTracker()
+
+    @classmethod
+    def from_config(cls, config: RetrievalConfig) -> "RetrievalScheduler":
+        return cls(
+            max_in_flight=config.max_in_flight,
+            max_per_provider=config.max_in_flight_per_provider,
+            provider_limits=config.provider_limits,
+            deadline=config.deadline_seconds,
+            hedge_quantile=config.hedge_quantile if config.hedging else None,
+            hedge_min_samples=config.hedge_min_samples,
+        )
+
+    def _hedge_after(self, provider: str) -> Optional[float]:
+        if self.hedge_quantile is None:
+            return None
+        return self.latency.quantile(provider, self.hedge_quantile, self.hedge_min_samples)
+
+    async def _search(
+        self,
+        adapter: SourceAdapter,
+        query: str,
+    ) -> Tuple[List[DocumentRecord], bool]:
+        hedge_after = self._hedge_after(adapter.name)
+        if hedge_after is None:
+            return await adapter.search(query), False
+        primary = asyncio.ensure_future(adapter.search(query))
+        done, _ = await asyncio.wait({primary}, timeout=hedge_after)
+        if done:
+            return primary.result(), False
+        backup = asyncio.ensure_future(adapter.search(query))
+        racers = {primary, backup}
+        try:
+            while racers:
+                done, racers = await asyncio.wait(racers, return_when=asyncio.FIRST_COMPLETED)
+                for finished in done:
+                    if not finished.cancelled() and finished.exception() is None:
+                        return finished.result(), finished is backup
+        finally:
+            for racer in (primary, backup):
+                racer.cancel()
+        # Both racers failed: report the primary's error, as an unhedged call would.
+        for racer in (primary, backup):
+            if not racer.cancelled():
+                raise racer.exception()
+        raise asyncio.CancelledError()
+
+    async def stream(
+        self,
+        queries: Sequence[str],
+        adapters: Sequence[SourceAdapter],
+    ) -> AsyncIterator[SearchOutcome]:
+        global_limit = asyncio.Semaphore(self.max_in_flight)
+        provider_limits: Dict[str, asyncio.Semaphore] = {
+            adapter.name: asyncio.Semaphore(
+                self.provider_limits.get(adapter.name, self.max_per_provider)
+            )
+            for adapter in adapters
+        }
+
+        async def run_one(task_index: int, query: str, adapter: SourceAdapter) -> SearchOutcome:
+            outcome = SearchOutcome(task_index=task_index, query=query, adapter=adapter.name)
+            async with provider_limits[adapter.name], global_limit:
+                started = time.perf_counter()
+                try:
+                    outcome.records, outcome.hedged = await self._search(adapter, query)
+                except Exception as exc:
+                    outcome.error = exc
+                outcome.elapsed = time.perf_counter() - started
+            if outcome.error is None:
+                self.latency.observe(adapter.name, outcome.elapsed)
+            record_adapter_call(outcome.elapsed, error=outcome.error is not None)
+            return outcome
+
+        pending = [
+            asyncio.ensure_future(run_one(task_index, query, adapter))
+            for task_index, query in enumerate(queries)
+            for adapter in adapters
+        ]
+        try:
+            for next_done in asyncio.as_completed(pending, timeout=self.deadline):
+                try:
+                    outcome = await next_done
+                except asyncio.TimeoutError:
+                    return
+                yield outcome
+        finally:
+            for future in pending:
+                future.cancel()
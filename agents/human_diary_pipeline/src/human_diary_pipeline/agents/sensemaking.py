@@ -11,11 +11,18 @@ from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 
 from ..adapters.base import DocumentRecord
+from ..utils.prompt_packing import compact_json, map_reduce
 from .llm import LLMFactory
 
 
 class SenseMakingAgent:
-    def __init__(self, factory: LLMFactory) -> None:
+    """
+    Turn clusters into bullets. When the cluster list overflows the prompt budget it is
+    split into parallel map calls, and one reduce call folds overlapping themes together.
+    """
+
+    def __init__(self, factory: LLMFactory, max_concurrency: int = 4) -> None:
+        self.max_concurrency = max_concurrency
         prompt = PromptTemplate(
             template=(
                 "You are a newsroom sense-maker.\n"
@@ -27,7 +34,41 @@ class SenseMakingAgent:
             ),
             input_variables=["clusters"],
         )
-        self.chain = LLMChain(llm=factory.writer_model(), prompt=prompt, verbose=False)
+        reduce_prompt = PromptTemplate(
+            template=(
+                "These sense-making bullets were written for separate batches of clusters:\n"
+                "{bullets}\n\n"
+                "Merge bullets that cover the same theme and keep every citation. Respond "
+                "with a JSON list using the same keys.\n"
+            ),
+            input_variables=["bullets"],
+        )
+        llm = factory.writer_model()
+        self.packer = factory.packer(llm)
+        self.overhead = self.packer.tokens(prompt.template)
+        self.chain = LLMChain(llm=llm, prompt=prompt, verbose=False)
+        self.reduce_chain = LLMChain(llm=llm, prompt=reduce_prompt, verbose=False)
+
+    async def _bullets(self, cluster_lines: List[str]) -> List[Dict[str, Any]]:
+        response = await self.chain.apredict(clusters="\n".join(cluster_lines))
+        try:
+            return json.loads(response)
+        except json.JSONDecodeError:
+            return [
+                {"theme": "general", "summary": response, "impact": "Med", "uncertainty": "Med"}
+            ]
+
+    async def _merge(self, partials: List[List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        combined = [bullet for partial in partials for bullet in partial]
+        payload = compact_json(combined)
+        if not self.packer.fits(payload, overhead=self.overhead):
+            return combined
+        response = await self.reduce_chain.apredict(bullets=payload)
+        try:
+            merged = json.loads(response)
+        except json.JSONDecodeError:
+            return combined
+        return merged if isinstance(merged, list) else combined
 
     async def run(
         self,
@@ -46,9 +87,11 @@ class SenseMakingAgent:
             cluster_lines.append(
                 f"* {cluster.get('label')}: {cluster.get('rationale')} :: refs={refs}"
             )
-        response = await self.chain.apredict(clusters="\n".join(cluster_lines))
-        try:
-            bullets = json.loads(response)
-        except json.JSONDecodeError:
-            bullets = [{"theme": "general", "summary": response, "impact": "Med", "uncertainty": "Med"}]
+        chunks = self.packer.pack(cluster_lines, overhead=self.overhead)
+        if len(chunks) <= 1:
+            bullets = await self._bullets(cluster_lines)
+        else:
+            bullets = await map_reduce(
+                chunks, self._bullets, self._merge, max_concurrency=self.max_concurrency
+            )
         return {"sensemaking": bullets}
@@ -4,18 +4,26 @@ Draft → critic → revision → selector agents.
 
 from __future__ import annotations
 
+import asyncio
 import json
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from langchain.chains import LLMChain
 from langchain.prompts import PromptTemplate
 
+from ..utils.prompt_packing import compact_json, map_reduce
 from .llm import LLMFactory
 
 
 class DraftAgent:
-    def __init__(self, factory: LLMFactory, variants: int = 2) -> None:
+    """
+    Write narrative variants from the sense-making bullets. Bullet sets over the prompt
+    budget are first condensed chunk by chunk in parallel; the draft call is the reduce.
+    """
+
+    def __init__(self, factory: LLMFactory, variants: int = 2, max_concurrency: int = 4) -> None:
         self.variants = variants
+        self.max_concurrency = max_concurrency
         prompt = PromptTemplate(
             template=(
                 "You are the lead writer for Humanity's Diary.\n"
@@ -25,22 +33,57 @@ class DraftAgent:
             ),
             input_variables=["directive", "bullets"],
         )
-        self.chain = LLMChain(llm=factory.writer_model(), prompt=prompt, verbose=False)
-
-    async def run(self, directive: str, bullets: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-        response = await self.chain.apredict(
-            directive=directive,
-            bullets=json.dumps(list(bullets), indent=2),
+        condense_prompt = PromptTemplate(
+            template=(
+                "Planner directive:\n{directive}\nSense-making bullets:\n{bullets}\n\n"
+                "Condense these into the fewest bullets that keep every theme, impact rating, "
+                "and citation relevant to the directive. Respond with a JSON list using the "
+                "same keys."
+            ),
+            input_variables=["directive", "bullets"],
+        )
+        llm = factory.writer_model()
+        self.packer = factory.packer(llm)
+        self.chain = LLMChain(llm=llm, prompt=prompt, verbose=False)
+        self.condense_chain = LLMChain(llm=llm, prompt=condense_prompt, verbose=False)
+
+    async def _condense(self, directive: str, bullets: List[Dict[str, Any]]) -> List[Any]:
+        response = await self.condense_chain.apredict(
+            directive=directive, bullets=compact_json(bullets)
         )
+        try:
+            condensed = json.loads(response)
+        except json.JSONDecodeError:
+            return bullets
+        return condensed if isinstance(condensed, list) else bullets
+
+    async def _draft(self, directive: str, bullets: List[Any]) -> Dict[str, Any]:
+        response = await self.chain.apredict(directive=directive, bullets=compact_json(bullets))
         try:
             variants = json.loads(response)
         except json.JSONDecodeError:
             variants = [{"id": "draft-1", "lede": "", "body": response, "provenance_notes": ""}]
         return {"drafts": variants}
 
+    async def run(self, directive: str, bullets: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        bullets = list(bullets)
+        overhead = self.packer.tokens(self.chain.prompt.template + directive)
+        chunks = self.packer.pack(bullets, compact_json, overhead=overhead)
+        if len(chunks) <= 1:
+            return await self._draft(directive, bullets)
+
+        async def condense(chunk: List[Dict[str, Any]]) -> List[Any]:
+            return await self._condense(directive, chunk)
+
+        async def draft(partials: List[List[Any]]) -> Dict[str, Any]:
+            return await self._draft(directive, [bullet for part in partials for bullet in part])
+
+        return await map_reduce(chunks, condense, draft, max_concurrency=self.max_concurrency)
+
 
 class CriticAgent:
-    def __init__(self, factory: LLMFactory) -> None:
+    def __init__(self, factory: LLMFactory, max_concurrency: int = 4) -> None:
+        self._limit = asyncio.Semaphore(max_concurrency)
         prompt = PromptTemplate(
             template=(
                 "Review the following draft variant for factuality, balance, and narrative clarity.\n"
@@ -52,21 +95,24 @@ class CriticAgent:
         )
         self.chain = LLMChain(llm=factory.critic_model(), prompt=prompt, verbose=False)
 
+    async def critique(self, draft: Dict[str, Any]) -> Dict[str, Any]:
+        async with self._limit:
+            response = await self.chain.apredict(draft=compact_json(draft))
+        try:
+            critique = json.loads(response)
+        except json.JSONDecodeError:
+            critique = {"scores": {"factuality": 0.6, "balance": 0.6, "story": 0.6}, "revision_notes": response}
+        critique["id"] = draft.get("id")
+        return critique
+
     async def run(self, drafts: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
-        critiques: List[Dict[str, Any]] = []
-        for draft in drafts:
-            response = await self.chain.apredict(draft=json.dumps(draft, indent=2))
-            try:
-                critique = json.loads(response)
-            except json.JSONDecodeError:
-                critique = {"scores": {"factuality": 0.6, "balance": 0.6, "story": 0.6}, "revision_notes": response}
-            critique["id"] = draft.get("id")
-            critiques.append(critique)
-        return {"critiques": critiques}
+        critiques = await asyncio.gather(*[self.critique(draft) for draft in drafts])
+        return {"critiques": list(critiques)}
 
 
 class RevisionAgent:
-    def __init__(self, factory: LLMFactory) -> None:
+    def __init__(self, factory: LLMFactory, max_concurrency: int = 4) -> None:
+        self._limit = asyncio.Semaphore(max_concurrency)
         prompt = PromptTemplate(
             template=(
                 "You are revising a newsroom draft.\nDraft:\n{draft}\nCritique:\n{critique}\n"
@@ -82,24 +128,58 @@ class RevisionAgent:
         critiques: Iterable[Dict[str, Any]],
     ) -> Dict[str, Any]:
         critique_map = {critique.get("id"): critique for critique in critiques}
-        revised: List[Dict[str, Any]] = []
-        for draft in drafts:
-            critique = critique_map.get(draft.get("id"))
+        revised = await asyncio.gather(
+            *[self.revise(draft, critique_map.get(draft.get("id"))) for draft in drafts]
+        )
+        return {"revisions": list(revised)}
+
+    async def revise(
+        self,
+        draft: Dict[str, Any],
+        critique: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        async with self._limit:
             response = await self.chain.apredict(
-                draft=json.dumps(draft, indent=2),
-                critique=json.dumps(critique or {}, indent=2),
+                draft=compact_json(draft),
+                critique=compact_json(critique or {}),
             )
-            try:
-                revision = json.loads(response)
-            except json.JSONDecodeError:
-                revision = {**draft, "body": response}
-            revision["id"] = draft.get("id")
-            revised.append(revision)
-        return {"revisions": revised}
+        try:
+            revision = json.loads(response)
+        except json.JSONDecodeError:
+            revision = {**draft, "body": response}
+        revision["id"] = draft.get("id")
+        return revision
+
+
+async def critique_and_revise(
+    drafts: Iterable[Dict[str, Any]],
+    critic: CriticAgent,
+    reviser: RevisionAgent,
+) -> Dict[str, Any]:
+    """
+    Pipeline critique → revision per draft so each revision starts as soon as its own
+    critique lands rather than after every critique.
+    """
+
+    async def one(draft: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        critique = await critic.critique(draft)
+        return critique, await reviser.revise(draft, critique)
+
+    pairs = await asyncio.gather(*[one(draft) for draft in drafts])
+    return {
+        "critiques": [critique for critique, _ in pairs],
+        "revisions": [revision for _, revision in pairs],
+    }
 
 
 class SelectorAgent:
-    def __init__(self, factory: LLMFactory) -> None:
+    """
+    Pick the winning revision. When the revisions and critiques overflow the critic's
+    prompt budget, finalists are picked per chunk in parallel and then judged together.
+    """
+
+    def __init__(self, factory: LLMFactory, max_concurrency: int = 4) -> None:
+        self.max_concurrency = max_concurrency
         prompt = PromptTemplate(
             template=(
                 "Select the best version for publication.\n"
@@ -110,21 +190,51 @@ class SelectorAgent:
             ),
             input_variables=["directive", "revisions", "critiques"],
         )
-        self.chain = LLMChain(llm=factory.critic_model(), prompt=prompt, verbose=False)
+        llm = factory.critic_model()
+        self.packer = factory.packer(llm)
+        self.chain = LLMChain(llm=llm, prompt=prompt, verbose=False)
 
-    async def run(
+    async def _select(
         self,
         directive: str,
-        revisions: Iterable[Dict[str, Any]],
-        critiques: Iterable[Dict[str, Any]],
+        pairs: List[Tuple[Dict[str, Any], Dict[str, Any]]],
     ) -> Dict[str, Any]:
         response = await self.chain.apredict(
             directive=directive,
-            revisions=json.dumps(list(revisions), indent=2),
-            critiques=json.dumps(list(critiques), indent=2),
+            revisions=compact_json([revision for revision, _ in pairs]),
+            critiques=compact_json([critique for _, critique in pairs]),
         )
         try:
-            decision = json.loads(response)
+            return json.loads(response)
         except json.JSONDecodeError:
-            decision = {"winner_id": "draft-1", "justification": response}
+            fallback = pairs[0][0].get("id") if pairs else "draft-1"
+            return {"winner_id": fallback or "draft-1", "justification": response}
+
+    async def run(
+        self,
+        directive: str,
+        revisions: Iterable[Dict[str, Any]],
+        critiques: Iterable[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        critique_map = {critique.get("id"): critique for critique in critiques}
+        pairs = [
+            (revision, critique_map.get(revision.get("id"), {})) for revision in revisions
+        ]
+        overhead = self.packer.tokens(self.chain.prompt.template + directive)
+        chunks = self.packer.pack(pairs, compact_json, overhead=overhead)
+        if len(chunks) <= 1:
+            return {"selection": await self._select(directive, pairs)}
+
+        by_id = {revision.get("id"): (revision, critique) for revision, critique in pairs}
+
+        async def semifinal(chunk: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Any:
+            decision = await self._select(directive, chunk)
+            return by_id.get(decision.get("winner_id"), chunk[0])
+
+        async def final(finalists: List[Tuple[Dict[str, Any], Dict[str, Any]]]) -> Any:
+            return await self._select(directive, finalists)
+
+        decision = await map_reduce(
+            chunks, semifinal, final, max_concurrency=self.max_concurrency
+        )
         return {"selection": decision}
@@ -6,12 +6,14 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import datetime as dt
 import json
+import uuid
+from contextlib import AsyncExitStack
 from pathlib import Path
 from typing import Any, Dict
 
 from .config import load_runtime_config
-from .pipelines.newsroom import build_default_newsroom
 
 
 def _parse_args() -> argparse.Namespace:
@@ -26,46 +28,348 @@ def _parse_args() -> argparse.Namespace:
         "--output",
         type=Path,
         default=None,
-        help="Optional file path to dump the final state snapshot (JSON).",
+        help=(
+            "File to dump the final state snapshot (JSON). In batch mode, the directory for "
+            "per-edition state and batch.json (defaults to BatchConfig.output_dir); under "
+            "--serve, the directory for per-job results (ServiceConfig.output_dir)."
+        ),
     )
     parser.add_argument(
         "--stream",
         action="store_true",
         help="Stream state updates as the LangGraph executes.",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--cache",
+        choices=["use", "bypass", "warm"],
+        default=None,
+        help=(
+            "Retrieval cache mode: `use` serves fresh hits, `bypass` skips the cache, "
+            "`warm` refetches everything and refreshes the cache."
+        ),
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help=(
+            "Skip documents covered by earlier editions (seen index plus per-query "
+            "published_at watermarks); the index is updated after publishing."
+        ),
+    )
+    parser.add_argument(
+        "--no-archive",
+        action="store_true",
+        help="Skip the local document archive and ask external providers for every task.",
+    )
+    parser.add_argument(
+        "--run-id",
+        type=str,
+        default=None,
+        help="Checkpoint thread id for this run. Generated when omitted.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue the checkpointed run given by --run-id from its last completed node.",
+    )
+    parser.add_argument(
+        "--metrics-jsonl",
+        type=Path,
+        default=None,
+        help="Append structured per-node metric events to this JSONL file.",
+    )
+    parser.add_argument(
+        "--metrics-prom",
+        type=Path,
+        default=None,
+        help="Write Prometheus-format node metrics to this text file after the run.",
+    )
+    parser.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve Prometheus metrics on http://127.0.0.1:PORT/metrics while running.",
+    )
+    parser.add_argument(
+        "--batch",
+        type=Path,
+        default=None,
+        metavar="FILE",
+        help=(
+            "Run every edition in FILE concurrently through one workflow. FILE is JSONL "
+            '({"edition": ..., "plan": ...}) or one `name: directive` per line.'
+        ),
+    )
+    parser.add_argument(
+        "--regions",
+        action="store_true",
+        help="Batch one edition per PlannerConfig.regions entry, scoped from --plan.",
+    )
+    parser.add_argument(
+        "--batch-concurrency",
+        type=int,
+        default=None,
+        help="Maximum editions in flight at once (defaults to BatchConfig.max_concurrency).",
+    )
+    parser.add_argument(
+        "--sharded",
+        action="store_true",
+        help=(
+            "Run retrieval through sense-making in worker processes, one shard per region "
+            "(see HUMAN_DIARY_SHARD_BY), and merge before writing."
+        ),
+    )
+    parser.add_argument(
+        "--shard-workers",
+        type=int,
+        default=None,
+        help="Worker processes for --sharded (defaults to one per shard, up to the CPU count).",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help=(
+            "Run as a daemon with a warm workflow, taking jobs over a local HTTP API "
+            "(POST /jobs, GET /jobs/ID, GET /jobs/ID/result, GET /health) until interrupted."
+        ),
+    )
+    parser.add_argument(
+        "--serve-port",
+        type=int,
+        default=None,
+        help="TCP port on 127.0.0.1 for --serve (defaults to ServiceConfig.port).",
+    )
+    parser.add_argument(
+        "--serve-socket",
+        type=Path,
+        default=None,
+        metavar="PATH",
+        help="Serve the --serve API on a Unix socket instead of TCP.",
+    )
+    parser.add_argument(
+        "--serve-workers",
+        type=int,
+        default=None,
+        help="Jobs in flight at once under --serve (defaults to ServiceConfig.workers).",
+    )
+    parser.add_argument(
+        "--inbox",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Also queue job files dropped into DIR while serving.",
+    )
+    fixtures = parser.add_mutually_exclusive_group()
+    fixtures.add_argument(
+        "--record",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Capture adapter HTTP responses, LLM completions and embeddings into DIR.",
+    )
+    fixtures.add_argument(
+        "--replay",
+        type=Path,
+        default=None,
+        metavar="DIR",
+        help="Serve adapters, LLMs and embeddings from fixtures in DIR; no network access.",
+    )
+    args = parser.parse_args()
+    if args.resume and not args.run_id:
+        parser.error("--resume requires --run-id")
+    if args.batch and args.regions:
+        parser.error("--batch and --regions are mutually exclusive")
+    if args.resume and (args.batch or args.regions or args.sharded):
+        parser.error("--resume applies to a single, unsharded run")
+    if args.sharded and (args.batch or args.regions):
+        parser.error("--sharded cannot be combined with --batch or --regions")
+    serve_options = (args.serve_port, args.serve_socket, args.serve_workers, args.inbox)
+    if not args.serve and any(option is not None for option in serve_options):
+        parser.error("--serve-port, --serve-socket, --serve-workers and --inbox need --serve")
+    if args.serve and (args.batch or args.regions or args.sharded or args.resume or args.run_id):
+        parser.error("--serve takes jobs over its API; drop the single-run options")
+    return args
 
 
-async def _run_async(plan: str | None, output: Path | None, stream: bool) -> Dict[str, Any]:
+async def _run_async(args: argparse.Namespace) -> Dict[str, Any]:
+    # Imported here so `--help` and argument errors return without loading LangGraph,
+    # LangChain or any provider SDK.
+    from .graph.instrumentation import (
+        JsonlEventSink,
+        NewsroomMetrics,
+        PrometheusEndpoint,
+        PrometheusTextfile,
+    )
+    from .pipelines.batch import load_editions, open_runtime, region_editions, run_batch
+    from .pipelines.checkpoint import encode_state
+    from .pipelines.sharded import run_sharded
+    from .pipelines.service import serve
+
     config = load_runtime_config()
-    if plan:
-        planner_directive = plan
-    else:
-        planner_directive = config.planner.default_plan
-
-    workflow = build_default_newsroom(config, planner_directive=planner_directive)
-    if stream:
-        final_state: Dict[str, Any] = {}
-        async for event in workflow.astream({}):
-            node = event.get("node")
-            if node:
-                print(f"[node:{node}]")  # noqa: T201 - CLI feedback
-            if "state" in event:
-                final_state = event["state"]
-        result = final_state
-    else:
-        result = await workflow.ainvoke({})
-
-    if output:
-        output.parent.mkdir(parents=True, exist_ok=True)
-        output.write_text(json.dumps(result, indent=2))
+    if args.cache:
+        config = config.model_copy(
+            update={"cache": config.cache.model_copy(update={"retrieval_mode": args.cache})}
+        )
+    if args.incremental:
+        config = config.model_copy(
+            update={"incremental": config.incremental.model_copy(update={"enabled": True})}
+        )
+    if args.no_archive:
+        config = config.model_copy(
+            update={"archive": config.archive.model_copy(update={"enabled": False})}
+        )
+    if args.record or args.replay:
+        replay = config.replay.model_copy(
+            update={
+                "mode": "record" if args.record else "replay",
+                "fixtures_dir": args.record or args.replay,
+            }
+        )
+        config = config.model_copy(update={"replay": replay})
+    if args.serve:
+        overrides = {
+            "port": args.serve_port,
+            "socket": args.serve_socket,
+            "workers": args.serve_workers,
+            "inbox": args.inbox,
+            "output_dir": args.output,
+        }
+        service = config.service.model_copy(
+            update={key: value for key, value in overrides.items() if value is not None}
+        )
+        config = config.model_copy(update={"service": service})
+    planner_directive = args.plan or config.planner.default_plan
+    editions = None
+    if args.batch:
+        editions = load_editions(args.batch)
+    elif args.regions:
+        editions = region_editions(config, planner_directive)
+    if args.record:
+        args.record.mkdir(parents=True, exist_ok=True)
+        recorded: Dict[str, Any] = {"plan": planner_directive}
+        if editions is not None:
+            recorded["editions"] = [vars(edition) for edition in editions]
+        (args.record / "run.json").write_text(json.dumps(recorded, indent=2))
+    run_id = args.run_id or f"{dt.date.today().isoformat()}-{uuid.uuid4().hex[:8]}"
+    graph_config = {"configurable": {"thread_id": run_id}}
+
+    metrics = NewsroomMetrics()
+    if args.metrics_jsonl:
+        metrics.sinks.append(JsonlEventSink(args.metrics_jsonl))
+    if args.metrics_prom:
+        metrics.sinks.append(PrometheusTextfile(args.metrics_prom))
+
+    async with AsyncExitStack() as stack:
+        if args.metrics_port:
+            endpoint = PrometheusEndpoint(metrics, args.metrics_port)
+            stack.callback(endpoint.close)
+        if args.sharded:
+            print(f"[run:{run_id} sharded]")
+            result = await run_sharded(
+                config,
+                run_id=run_id,
+                planner_directive=planner_directive,
+                metrics=metrics,
+                max_workers=args.shard_workers,
+            )
+            for shard in result["shards"]:
+                print(
+                    f"[shard:{shard['shard']} tasks={shard['tasks']} docs={shard['documents']}"
+                    f" {shard['elapsed']:.1f}s transfer={shard['result_bytes']}B"
+                    f"{' error=' + shard['error'] if shard['error'] else ''}]"
+                )
+            if args.output:
+                args.output.parent.mkdir(parents=True, exist_ok=True)
+                args.output.write_text(json.dumps(encode_state(result), indent=2, default=str))
+            return result
+        runtime = await stack.enter_async_context(
+            open_runtime(
+                config,
+                metrics=metrics,
+                planner_directive=planner_directive,
+                warm=args.serve and config.service.warm,
+            )
+        )
+        if args.serve:
+            await serve(runtime)
+            return {}
+        adapters, checkpointer, workflow = runtime.adapters, runtime.checkpointer, runtime.workflow
+        if editions is not None:
+            print(f"[batch:{run_id} editions={len(editions)}]")
+            summaries = await run_batch(
+                runtime,
+                editions,
+                run_prefix=run_id,
+                output_dir=args.output,
+                max_concurrency=args.batch_concurrency,
+            )
+            for summary in summaries:
+                print(
+                    f"[edition:{summary['edition']} {summary['status']}"
+                    f" {summary['elapsed']:.1f}s {summary.get('publish_path') or ''}]"
+                )
+            return {"batch": summaries}
+        graph_input: Dict[str, Any] | None = {}
+        if args.resume:
+            if checkpointer is None:
+                raise SystemExit("--resume needs checkpoints enabled (HUMAN_DIARY_CHECKPOINTS).")
+            snapshot = await workflow.aget_state(graph_config)
+            if not snapshot.values:
+                raise SystemExit(f"No checkpoint found for run id {run_id!r}.")
+            graph_input = None
+        print(f"[run:{run_id}]")
+
+        if args.stream:
+            result = {}
+            async for mode, chunk in workflow.astream(
+                graph_input,
+                graph_config,
+                stream_mode=["updates", "values"],
+            ):
+                if mode == "values":
+                    result = chunk
+                    continue
+                for node in chunk:
+                    node_metrics = metrics.runs.get(run_id, {}).get(node)
+                    summary = ""
+                    if node_metrics is not None:
+                        summary = (
+                            f" wall={node_metrics.wall_seconds:.2f}s"
+                            f" llm={node_metrics.llm_calls} cached={node_metrics.llm_cache_hits}"
+                            f" tokens={node_metrics.prompt_tokens}/{node_metrics.completion_tokens}"
+                            f" docs={node_metrics.documents_in}->{node_metrics.documents_out}"
+                        )
+                    print(f"[node:{node}{summary}]")  # noqa: T201 - CLI feedback
+        else:
+            result = await workflow.ainvoke(graph_input, graph_config)
+        metrics.finish_run(run_id)
+        if args.stream and adapters.cache is not None:
+            print(f"[cache:{json.dumps(adapters.cache.stats())}]")
+        if args.stream:
+            for provider, health in (result.get("provider_health") or {}).items():
+                print(
+                    f"[provider:{provider} state={health['state']}"
+                    f" ok={health['successes']} failed={health['failures']}"
+                    f" retries={health['retries']} skipped={health['short_circuited']}]"
+                )
+            completion = result.get("task_completion") or []
+            if any(entry.get("archive_documents") for entry in completion):
+                local = sum(1 for entry in completion if not entry.get("fell_through"))
+                print(f"[archive: {local}/{len(completion)} tasks answered locally]")
+            incremental_stats = (result.get("seen_updates") or {}).get("stats")
+            if incremental_stats:
+                print(f"[incremental:{json.dumps(incremental_stats)}]")
+
+    if args.output:
+        args.output.parent.mkdir(parents=True, exist_ok=True)
+        args.output.write_text(json.dumps(encode_state(result), indent=2, default=str))
 
     return result
 
 
 def main() -> None:
     args = _parse_args()
-    asyncio.run(_run_async(plan=args.plan, output=args.output, stream=args.stream))
+    asyncio.run(_run_async(args))
 
 
 if __name__ == "__main__":
@@ -4,12 +4,17 @@ Centralized configuration management for the newsroom pipeline.
 
 from __future__ import annotations
 
+import json
+import os
 from functools import lru_cache
-from typing import List, Optional
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional, Type, TypeVar, Union, get_args, get_origin
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, Field
 
+SectionT = TypeVar("SectionT", bound=BaseModel)
+
 
 class ApiConfig(BaseModel):
     openai_api_key: Optional[str] = Field(default=None, alias="OPENAI_API_KEY")
@@ -35,14 +40,219 @@ class PlannerConfig(BaseModel):
     max_iterations: int = Field(12, alias="HUMAN_DIARY_MAX_ITERATIONS")
 
 
+class HttpConfig(BaseModel):
+    http2: bool = Field(True, alias="HUMAN_DIARY_HTTP2")
+    max_connections: int = Field(32, alias="HUMAN_DIARY_HTTP_MAX_CONNECTIONS")
+    max_keepalive_connections: int = Field(16, alias="HUMAN_DIARY_HTTP_MAX_KEEPALIVE")
+    keepalive_expiry: float = Field(30.0, alias="HUMAN_DIARY_HTTP_KEEPALIVE_EXPIRY")
+    max_connections_per_host: int = Field(8, alias="HUMAN_DIARY_HTTP_MAX_PER_HOST")
+
+
+class RetrievalConfig(BaseModel):
+    streaming: bool = Field(False, alias="HUMAN_DIARY_STREAMING_RETRIEVAL")
+    max_in_flight: int = Field(16, alias="HUMAN_DIARY_RETRIEVAL_MAX_IN_FLIGHT")
+    max_in_flight_per_provider: int = Field(4, alias="HUMAN_DIARY_RETRIEVAL_MAX_PER_PROVIDER")
+    provider_limits: Dict[str, int] = Field(
+        default_factory=dict,
+        alias="HUMAN_DIARY_RETRIEVAL_PROVIDER_LIMITS",
+    )
+    deadline_seconds: Optional[float] = Field(90.0, alias="HUMAN_DIARY_RETRIEVAL_DEADLINE")
+    adapter_timeouts: Dict[str, float] = Field(
+        default_factory=dict,
+        alias="HUMAN_DIARY_ADAPTER_TIMEOUTS",
+    )
+    hedging: bool = Field(False, alias="HUMAN_DIARY_RETRIEVAL_HEDGING")
+    hedge_quantile: float = Field(0.95, alias="HUMAN_DIARY_HEDGE_QUANTILE")
+    hedge_min_samples: int = Field(20, alias="HUMAN_DIARY_HEDGE_MIN_SAMPLES")
+
+
+class ArchiveConfig(BaseModel):
+    enabled: bool = Field(True, alias="HUMAN_DIARY_ARCHIVE")
+    path: Path = Field(Path(".cache/archive.sqlite"), alias="HUMAN_DIARY_ARCHIVE_PATH")
+    max_results: int = Field(8, alias="HUMAN_DIARY_ARCHIVE_MAX_RESULTS")
+    min_results: int = Field(5, alias="HUMAN_DIARY_ARCHIVE_MIN_RESULTS")
+    max_age_seconds: float = Field(12 * 3600.0, alias="HUMAN_DIARY_ARCHIVE_MAX_AGE")
+    retention_days: float = Field(180.0, alias="HUMAN_DIARY_ARCHIVE_RETENTION_DAYS")
+
+
+class ResilienceConfig(BaseModel):
+    enabled: bool = Field(True, alias="HUMAN_DIARY_RESILIENCE")
+    rate_per_second: float = Field(5.0, alias="HUMAN_DIARY_PROVIDER_RATE")
+    burst: int = Field(5, alias="HUMAN_DIARY_PROVIDER_BURST")
+    provider_rates: Dict[str, float] = Field(
+        default_factory=dict, alias="HUMAN_DIARY_PROVIDER_RATES"
+    )
+    max_attempts: int = Field(3, alias="HUMAN_DIARY_RETRY_ATTEMPTS")
+    backoff_base: float = Field(0.5, alias="HUMAN_DIARY_RETRY_BACKOFF")
+    backoff_max: float = Field(8.0, alias="HUMAN_DIARY_RETRY_BACKOFF_MAX")
+    failure_threshold: int = Field(5, alias="HUMAN_DIARY_BREAKER_THRESHOLD")
+    cooldown_seconds: float = Field(60.0, alias="HUMAN_DIARY_BREAKER_COOLDOWN")
+
+
+class CleanerConfig(BaseModel):
+    max_per_theme: int = Field(12, alias="HUMAN_DIARY_MAX_PER_THEME")
+    near_duplicates: bool = Field(True, alias="HUMAN_DIARY_NEAR_DUPLICATES")
+    near_duplicate_threshold: float = Field(0.8, alias="HUMAN_DIARY_NEAR_DUPLICATE_THRESHOLD")
+    max_documents: Optional[int] = Field(None, alias="HUMAN_DIARY_CLEANER_MAX_DOCUMENTS")
+    recency_weight: float = Field(1.0, alias="HUMAN_DIARY_RANK_RECENCY")
+    score_weight: float = Field(0.0, alias="HUMAN_DIARY_RANK_SCORE")
+    diversity_weight: float = Field(0.0, alias="HUMAN_DIARY_RANK_DIVERSITY")
+    age_unit_hours: float = Field(24.0, alias="HUMAN_DIARY_RANK_AGE_UNIT_HOURS")
+
+
+class ClusteringConfig(BaseModel):
+    mode: Literal["embedding", "llm"] = Field("embedding", alias="HUMAN_DIARY_CLUSTERING")
+    batch_size: int = Field(64, alias="HUMAN_DIARY_EMBED_BATCH_SIZE")
+    max_clusters: int = Field(12, alias="HUMAN_DIARY_MAX_CLUSTERS")
+    merge_threshold: float = Field(0.85, alias="HUMAN_DIARY_CLUSTER_MERGE_THRESHOLD")
+    max_concurrency: int = Field(4, alias="HUMAN_DIARY_CLUSTER_MAX_CONCURRENCY")
+
+
+class WritingConfig(BaseModel):
+    variants: int = Field(2, alias="HUMAN_DIARY_DRAFT_VARIANTS")
+    max_concurrency: int = Field(4, alias="HUMAN_DIARY_WRITING_MAX_CONCURRENCY")
+    pipeline_revisions: bool = Field(True, alias="HUMAN_DIARY_PIPELINE_REVISIONS")
+
+
+class PromptConfig(BaseModel):
+    default_budget: int = Field(12_000, alias="HUMAN_DIARY_PROMPT_BUDGET")
+    budgets: Dict[str, int] = Field(default_factory=dict, alias="HUMAN_DIARY_PROMPT_BUDGETS")
+    max_concurrency: int = Field(4, alias="HUMAN_DIARY_MAP_MAX_CONCURRENCY")
+
+
+class CacheConfig(BaseModel):
+    directory: Path = Field(Path(".cache"), alias="HUMAN_DIARY_CACHE_DIR")
+    retrieval_mode: Literal["use", "bypass", "warm"] = Field(
+        "use",
+        alias="HUMAN_DIARY_RETRIEVAL_CACHE",
+    )
+    retrieval_ttl_seconds: float = Field(6 * 3600.0, alias="HUMAN_DIARY_RETRIEVAL_CACHE_TTL")
+    retrieval_ttls: Dict[str, float] = Field(
+        default_factory=lambda: {"semantic_scholar": 7 * 24 * 3600.0},
+        alias="HUMAN_DIARY_RETRIEVAL_CACHE_TTLS",
+    )
+    retrieval_max_entries: int = Field(50_000, alias="HUMAN_DIARY_RETRIEVAL_CACHE_MAX_ENTRIES")
+    retrieval_empty_ttl_seconds: float = Field(
+        300.0, alias="HUMAN_DIARY_RETRIEVAL_CACHE_EMPTY_TTL"
+    )
+    llm_enabled: bool = Field(True, alias="HUMAN_DIARY_LLM_CACHE")
+    llm_max_entries: int = Field(20_000, alias="HUMAN_DIARY_LLM_CACHE_MAX_ENTRIES")
+    embeddings_enabled: bool = Field(True, alias="HUMAN_DIARY_EMBEDDING_CACHE")
+    payload_directory: Optional[Path] = Field(None, alias="HUMAN_DIARY_PAYLOAD_DIR")
+    payload_max_entries: int = Field(4096, alias="HUMAN_DIARY_PAYLOAD_MAX_ENTRIES")
+
+
+class BatchConfig(BaseModel):
+    max_concurrency: int = Field(3, alias="HUMAN_DIARY_BATCH_CONCURRENCY")
+    output_dir: Path = Field(Path("artifacts/editions"), alias="HUMAN_DIARY_BATCH_OUTPUT_DIR")
+
+
+class ShardingConfig(BaseModel):
+    shard_by: Literal["region", "count"] = Field("region", alias="HUMAN_DIARY_SHARD_BY")
+    shards: int = Field(4, alias="HUMAN_DIARY_SHARDS")
+    max_workers: Optional[int] = Field(None, alias="HUMAN_DIARY_SHARD_WORKERS")
+
+
+class ServiceConfig(BaseModel):
+    host: str = Field("127.0.0.1", alias="HUMAN_DIARY_SERVICE_HOST")
+    port: int = Field(8765, alias="HUMAN_DIARY_SERVICE_PORT")
+    socket: Optional[Path] = Field(None, alias="HUMAN_DIARY_SERVICE_SOCKET")
+    workers: int = Field(2, alias="HUMAN_DIARY_SERVICE_WORKERS")
+    inbox: Optional[Path] = Field(None, alias="HUMAN_DIARY_SERVICE_INBOX")
+    poll_seconds: float = Field(2.0, alias="HUMAN_DIARY_SERVICE_POLL_SECONDS")
+    output_dir: Path = Field(Path("artifacts/jobs"), alias="HUMAN_DIARY_SERVICE_OUTPUT_DIR")
+    max_history: int = Field(500, alias="HUMAN_DIARY_SERVICE_MAX_HISTORY")
+    warm: bool = Field(True, alias="HUMAN_DIARY_SERVICE_WARM")
+
+
+class IncrementalConfig(BaseModel):
+    enabled: bool = Field(False, alias="HUMAN_DIARY_INCREMENTAL")
+    path: Path = Field(Path(".cache/seen_index.sqlite"), alias="HUMAN_DIARY_SEEN_INDEX_PATH")
+    overlap_seconds: float = Field(3600.0, alias="HUMAN_DIARY_WATERMARK_OVERLAP")
+    retention_days: float = Field(30.0, alias="HUMAN_DIARY_SEEN_RETENTION_DAYS")
+
+
+class MemoryConfig(BaseModel):
+    path: Path = Field(Path(".cache/newsroom_memory.duckdb"), alias="HUMAN_DIARY_MEMORY_PATH")
+    legacy_path: Path = Field(
+        Path(".cache/newsroom_memory.jsonl"),
+        alias="HUMAN_DIARY_MEMORY_LEGACY_PATH",
+    )
+    embeddings: bool = Field(True, alias="HUMAN_DIARY_MEMORY_EMBEDDINGS")
+    compact_every: int = Field(50, alias="HUMAN_DIARY_MEMORY_COMPACT_EVERY")
+    full_text_days: Optional[int] = Field(365, alias="HUMAN_DIARY_MEMORY_FULL_TEXT_DAYS")
+
+
+class CheckpointConfig(BaseModel):
+    enabled: bool = Field(True, alias="HUMAN_DIARY_CHECKPOINTS")
+    path: Path = Field(
+        Path(".cache/newsroom_checkpoints.sqlite"),
+        alias="HUMAN_DIARY_CHECKPOINT_PATH",
+    )
+
+
+class ReplayConfig(BaseModel):
+    mode: Literal["off", "record", "replay"] = Field("off", alias="HUMAN_DIARY_REPLAY_MODE")
+    fixtures_dir: Path = Field(Path("fixtures"), alias="HUMAN_DIARY_FIXTURES_DIR")
+
+
 class RuntimeConfig(BaseModel):
     api: ApiConfig
     planner: PlannerConfig
+    http: HttpConfig = Field(default_factory=HttpConfig)
+    retrieval: RetrievalConfig = Field(default_factory=RetrievalConfig)
+    resilience: ResilienceConfig = Field(default_factory=ResilienceConfig)
+    archive: ArchiveConfig = Field(default_factory=ArchiveConfig)
+    cleaner: CleanerConfig = Field(default_factory=CleanerConfig)
+    clustering: ClusteringConfig = Field(default_factory=ClusteringConfig)
+    writing: WritingConfig = Field(default_factory=WritingConfig)
+    prompts: PromptConfig = Field(default_factory=PromptConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    checkpoint: CheckpointConfig = Field(default_factory=CheckpointConfig)
+    incremental: IncrementalConfig = Field(default_factory=IncrementalConfig)
+    memory: MemoryConfig = Field(default_factory=MemoryConfig)
+    batch: BatchConfig = Field(default_factory=BatchConfig)
+    sharding: ShardingConfig = Field(default_factory=ShardingConfig)
+    service: ServiceConfig = Field(default_factory=ServiceConfig)
+    replay: ReplayConfig = Field(default_factory=ReplayConfig)
+
+
+def _env_value(raw: str, annotation: Any) -> Any:
+    # Lists and dicts come as JSON (lists may also be comma separated); pydantic coerces
+    # everything else from the string. An empty value clears an Optional field.
+    if get_origin(annotation) is Union:
+        if raw == "" and type(None) in get_args(annotation):
+            return None
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        annotation = args[0] if len(args) == 1 else annotation
+    origin = get_origin(annotation) or annotation
+    if origin in (list, dict):
+        try:
+            return json.loads(raw)
+        except ValueError:
+            if origin is dict:
+                raise
+            return [item.strip() for item in raw.split(",") if item.strip()]
+    return raw
+
+
+def _from_env(section: Type[SectionT]) -> SectionT:
+    """Build a config section from the environment variables named by its field aliases."""
+    values: Dict[str, Any] = {}
+    for name, field in section.model_fields.items():
+        alias = field.alias or name
+        if alias in os.environ:
+            values[alias] = _env_value(os.environ[alias], field.annotation)
+    return section.model_validate(values)
 
 
 @lru_cache(maxsize=1)
 def load_runtime_config() -> RuntimeConfig:
     load_dotenv(override=False)
-    api = ApiConfig()
-    planner = PlannerConfig()
-    return RuntimeConfig(api=api, planner=planner)
+    # Only the HUMAN_DIARY_* sections are read here; `ApiConfig` stays as it always was.
+    sections = {
+        name: _from_env(field.annotation)
+        for name, field in RuntimeConfig.model_fields.items()
+        if name != "api"
+    }
+    return RuntimeConfig(api=ApiConfig(), **sections)
@@ -0,0 +1,17 @@
+"""
+LangGraph runtime instrumentation for the newsroom workflow.
+"""
+
+from .instrumentation import (
+    JsonlEventSink,
+    NewsroomMetrics,
+    PrometheusEndpoint,
+    PrometheusTextfile,
+)
+
+__all__ = [
+    "JsonlEventSink",
+    "NewsroomMetrics",
+    "PrometheusEndpoint",
+    "PrometheusTextfile",
+]
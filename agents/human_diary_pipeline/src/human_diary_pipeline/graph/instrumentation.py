@@ -0,0 +1,197 @@
+"""
+Per-node tracing for the newsroom graph, exported as JSONL events and Prometheus text.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import threading
+import time
+from dataclasses import replace
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Mapping, Protocol, Sequence
+
+from langchain_core.runnables import RunnableConfig
+
+from ..adapters.base import DocumentRecord
+from ..utils.metrics import NodeMetrics, current_node
+
+NodeFn = Callable[[Any], Awaitable[Any]]
+
+_NUMERIC_FIELDS = [name for name in NodeMetrics.__dataclass_fields__ if name != "node"]
+
+
+class EventSink(Protocol):
+    def emit(self, event: Mapping[str, Any]) -> None:
+        ...
+
+    def publish(self, metrics: "NewsroomMetrics") -> None:
+        ...
+
+
+def _count_documents(payload: Any) -> int:
+    if not isinstance(payload, Mapping):
+        return 0
+    return sum(
+        len(value)
+        for value in payload.values()
+        if isinstance(value, list) and value and isinstance(value[0], DocumentRecord)
+    )
+
+
+class NewsroomMetrics:
+    """
+    Collects `NodeMetrics` per run (keyed by the LangGraph thread id) and fans events out
+    to sinks. One instance can be shared by a compiled workflow across many runs:
+    `finish_run` folds a run into per-node `totals` and drops it, so only in-flight runs
+    are kept (and exported with a `run_id` label).
+    """
+
+    def __init__(self, sinks: Iterable[EventSink] = ()) -> None:
+        self.sinks: List[EventSink] = list(sinks)
+        self.runs: Dict[str, Dict[str, NodeMetrics]] = {}
+        self.totals: Dict[str, NodeMetrics] = {}
+        self.finished_runs = 0
+        self._lock = threading.Lock()
+
+    def instrument(self, name: str, fn: NodeFn, reads: Sequence[str] = ()) -> NodeFn:
+        # Nodes that need the run (e.g. its thread id) take `config` like LangGraph nodes do.
+        wants_config = "config" in inspect.signature(fn).parameters
+
+        async def node(state: Any, config: RunnableConfig) -> Any:
+            run_id = str((config.get("configurable") or {}).get("thread_id", "default"))
+            metrics = NodeMetrics(node=name)
+            metrics.documents_in = sum(len(state.get(key) or []) for key in reads)
+            with self._lock:
+                self.runs.setdefault(run_id, {})[name] = metrics
+            self.emit({"event": "node_start", "run_id": run_id, "node": name})
+            token = current_node.set(metrics)
+            started = time.perf_counter()
+            try:
+                update = await (fn(state, config) if wants_config else fn(state))
+            except Exception as exc:
+                metrics.errors += 1
+                self.emit(
+                    {
+                        "event": "node_error",
+                        "run_id": run_id,
+                        "error": repr(exc),
+                        **metrics.as_dict(),
+                    }
+                )
+                raise
+            finally:
+                metrics.wall_seconds = time.perf_counter() - started
+                current_node.reset(token)
+            metrics.documents_out = _count_documents(update)
+            self.emit({"event": "node_end", "run_id": run_id, **metrics.as_dict()})
+            return update
+
+        node.__name__ = f"{name}_node"
+        return node
+
+    def emit(self, event: Mapping[str, Any]) -> None:
+        stamped = {"ts": time.time(), **event}
+        for sink in self.sinks:
+            sink.emit(stamped)
+
+    def finish_run(self, run_id: str) -> None:
+        with self._lock:
+            nodes = self.runs.pop(run_id, {})
+            for name, metrics in nodes.items():
+                total = self.totals.setdefault(name, NodeMetrics(node=name))
+                for field in _NUMERIC_FIELDS:
+                    setattr(total, field, getattr(total, field) + getattr(metrics, field))
+            self.finished_runs += 1
+        totals = {
+            "wall_seconds": sum(metrics.wall_seconds for metrics in nodes.values()),
+            "llm_calls": sum(metrics.llm_calls for metrics in nodes.values()),
+            "prompt_tokens": sum(metrics.prompt_tokens for metrics in nodes.values()),
+            "completion_tokens": sum(metrics.completion_tokens for metrics in nodes.values()),
+        }
+        self.emit({"event": "run_end", "run_id": run_id, **totals})
+        for sink in self.sinks:
+            sink.publish(self)
+
+    def prometheus_text(self) -> str:
+        lines: List[str] = []
+        with self._lock:
+            runs = {run_id: dict(nodes) for run_id, nodes in self.runs.items()}
+            totals = {name: replace(metrics) for name, metrics in self.totals.items()}
+            finished = self.finished_runs
+        lines.append("# TYPE newsroom_runs_finished_total counter")
+        lines.append(f"newsroom_runs_finished_total {finished}")
+        for field in _NUMERIC_FIELDS:
+            metric = f"newsroom_node_{field}_total"
+            lines.append(f"# TYPE {metric} counter")
+            for name, metrics in totals.items():
+                lines.append(f'{metric}{{node="{name}"}} {getattr(metrics, field)}')
+        for field in _NUMERIC_FIELDS:
+            metric = f"newsroom_node_{field}"
+            lines.append(f"# TYPE {metric} gauge")
+            for run_id, nodes in runs.items():
+                for name, metrics in nodes.items():
+                    value = getattr(metrics, field)
+                    lines.append(f'{metric}{{run_id="{run_id}",node="{name}"}} {value}')
+        return "\n".join(lines) + "\n"
+
+
+class JsonlEventSink:
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def emit(self, event: Mapping[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(event, default=str) + "\n")
+
+    def publish(self, metrics: NewsroomMetrics) -> None:
+        return None
+
+
+class PrometheusTextfile:
+    """Rewrite a Prometheus text file after each run (node_exporter textfile collector)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    def emit(self, event: Mapping[str, Any]) -> None:
+        return None
+
+    def publish(self, metrics: NewsroomMetrics) -> None:
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(metrics.prometheus_text(), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+
+class PrometheusEndpoint:
+    """Serve live metrics on `http://host:port/metrics` from a daemon thread."""
+
+    def __init__(self, metrics: NewsroomMetrics, port: int, host: str = "127.0.0.1") -> None:
+        source = metrics
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.rstrip("/") != "/metrics":
+                    self.send_error(404)
+                    return
+                body = source.prometheus_text().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                return None
+
+        self._server = ThreadingHTTPServer((host, port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
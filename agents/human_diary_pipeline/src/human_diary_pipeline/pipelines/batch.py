@@ -0,0 +1,183 @@
+"""
+Batch mode: run many newsroom editions concurrently through one compiled workflow.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import json
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional
+
+from ..adapters.registry import AdapterSuite, build_adapter_suite
+from ..config import RuntimeConfig
+from ..graph.instrumentation import NewsroomMetrics
+from .checkpoint import encode_state, open_checkpointer
+from .newsroom import build_default_newsroom
+
+
+@dataclass
+class Edition:
+    name: str
+    directive: str
+
+
+def is_edition_name(name: object) -> bool:
+    """Editions name publish and output folders, so a name must be one plain path component."""
+    return isinstance(name, str) and bool(name) and Path(name).name == name and name[0] != "."
+
+
+def load_editions(path: Path) -> List[Edition]:
+    """
+    Read editions from a JSONL file of `{"edition": ..., "plan": ...}` objects, or from
+    plain text with one directive per line (optionally `name: directive`).
+    """
+    editions: List[Edition] = []
+    for index, line in enumerate(path.read_text(encoding="utf-8").splitlines()):
+        line = line.strip()
+        where = f"{path}:{index + 1}"
+        if not line or line.startswith("#"):
+            continue
+        if line.startswith("{"):
+            try:
+                entry = json.loads(line)
+            except ValueError as exc:
+                raise ValueError(f"{where}: invalid JSON ({exc})") from exc
+            if not isinstance(entry, dict) or not isinstance(entry.get("plan"), str):
+                raise ValueError(f"{where}: expected an object with a string `plan`")
+            name = entry.get("edition") or f"edition-{index + 1}"
+            edition = Edition(name=name, directive=entry["plan"])
+        else:
+            name, sep, directive = line.partition(":")
+            if sep and name.strip() and " " not in name.strip():
+                edition = Edition(name=name.strip(), directive=directive.strip())
+            else:
+                edition = Edition(name=f"edition-{index + 1}", directive=line)
+        if not is_edition_name(edition.name):
+            raise ValueError(f"{where}: edition name {edition.name!r} must be a plain name")
+        editions.append(edition)
+    names = [edition.name for edition in editions]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate edition names in {path}: {', '.join(duplicates)}")
+    return editions
+
+
+def region_editions(config: RuntimeConfig, directive: Optional[str] = None) -> List[Edition]:
+    """One edition per `PlannerConfig.regions` entry, scoping the directive to the region."""
+    base = directive or config.planner.default_plan
+    return [
+        Edition(name=region, directive=f"{base} Focus on the {region} region.")
+        for region in config.planner.regions
+    ]
+
+
+@dataclass
+class NewsroomRuntime:
+    """Adapter suite, checkpointer, metrics and compiled workflow shared across runs."""
+
+    config: RuntimeConfig
+    adapters: AdapterSuite
+    metrics: NewsroomMetrics
+    workflow: Any
+    checkpointer: Any = None
+
+
+@asynccontextmanager
+async def open_runtime(
+    config: RuntimeConfig,
+    *,
+    metrics: Optional[NewsroomMetrics] = None,
+    planner_directive: Optional[str] = None,
+    warm: bool = False,
+) -> AsyncIterator[NewsroomRuntime]:
+    """
+    Open the shared adapter suite and checkpointer and compile the workflow. With `warm`,
+    agents and LLM clients are built up front (in a thread, as the planner embeds).
+    """
+    metrics = metrics or NewsroomMetrics()
+    async with AsyncExitStack() as stack:
+        adapters = await stack.enter_async_context(build_adapter_suite(config))
+        checkpointer = None
+        if config.checkpoint.enabled:
+            checkpointer = await stack.enter_async_context(
+                open_checkpointer(config.checkpoint.path)
+            )
+        build = functools.partial(
+            build_default_newsroom,
+            config,
+            planner_directive=planner_directive,
+            adapters=adapters.values(),
+            checkpointer=checkpointer,
+            metrics=metrics,
+            warm=warm,
+        )
+        workflow = await asyncio.to_thread(build) if warm else build()
+        yield NewsroomRuntime(config, adapters, metrics, workflow, checkpointer)
+
+
+async def run_edition(runtime: NewsroomRuntime, edition: Edition, run_id: str) -> Dict[str, Any]:
+    graph_config = {"configurable": {"thread_id": run_id}}
+    graph_input = {"planner_directive": edition.directive, "edition": edition.name}
+    try:
+        return await runtime.workflow.ainvoke(graph_input, graph_config)
+    finally:
+        runtime.metrics.finish_run(run_id)
+
+
+async def run_batch(
+    runtime: NewsroomRuntime,
+    editions: Iterable[Edition],
+    *,
+    run_prefix: str,
+    output_dir: Optional[Path] = None,
+    max_concurrency: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Run every edition concurrently, at most `max_concurrency` at a time. A failed edition
+    is reported in the summary and does not cancel the others.
+    """
+    editions = list(editions)
+    limit = asyncio.Semaphore(max_concurrency or runtime.config.batch.max_concurrency)
+    output_dir = output_dir or runtime.config.batch.output_dir
+
+    async def one(edition: Edition) -> Dict[str, Any]:
+        run_id = f"{run_prefix}-{edition.name}"
+        summary: Dict[str, Any] = {"edition": edition.name, "run_id": run_id}
+        async with limit:
+            started = time.perf_counter()
+            try:
+                state = await run_edition(runtime, edition, run_id)
+            except Exception as exc:
+                summary.update(status="error", error=f"{type(exc).__name__}: {exc}")
+                state = None
+            summary["elapsed"] = round(time.perf_counter() - started, 3)
+        if state is not None:
+            edition_dir = output_dir / edition.name
+            edition_dir.mkdir(parents=True, exist_ok=True)
+            state_path = edition_dir / "state.json"
+            state_path.write_text(json.dumps(encode_state(state), indent=2, default=str))
+            summary.update(
+                status="ok",
+                publish_path=state.get("publish_path"),
+                state_path=str(state_path),
+            )
+        return summary
+
+    summaries = await asyncio.gather(*[one(edition) for edition in editions])
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / "batch.json").write_text(
+        json.dumps(
+            {
+                "run_prefix": run_prefix,
+                "editions": [asdict(edition) for edition in editions],
+                "results": summaries,
+            },
+            indent=2,
+        )
+    )
+    return list(summaries)
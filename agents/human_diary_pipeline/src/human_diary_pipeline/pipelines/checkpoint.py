@@ -0,0 +1,65 @@
+"""
+Durable LangGraph checkpoints so interrupted newsroom runs can resume.
+"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Tuple
+
+import aiosqlite
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+from langgraph.checkpoint.sqlite.aio import AsyncSqliteSaver
+
+from ..adapters.base import DocumentRecord
+
+_RECORD_TAG = "__document_record__"
+
+
+def encode_state(value: Any) -> Any:
+    """Replace `DocumentRecord` instances with tagged plain dicts, recursively."""
+    if isinstance(value, DocumentRecord):
+        return {_RECORD_TAG: value.as_dict()}
+    if isinstance(value, dict):
+        return {key: encode_state(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [encode_state(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(encode_state(item) for item in value)
+    return value
+
+
+def decode_state(value: Any) -> Any:
+    """Inverse of `encode_state`."""
+    if isinstance(value, dict):
+        if len(value) == 1 and _RECORD_TAG in value:
+            return DocumentRecord.from_dict(value[_RECORD_TAG])
+        return {key: decode_state(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [decode_state(item) for item in value]
+    if isinstance(value, tuple):
+        return tuple(decode_state(item) for item in value)
+    return value
+
+
+class NewsroomSerializer(JsonPlusSerializer):
+    """
+    Checkpoint serializer that stores `DocumentRecord` as plain data instead of relying
+    on dataclass reconstruction.
+    """
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        return super().dumps_typed(encode_state(obj))
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        return decode_state(super().loads_typed(data))
+
+
+@asynccontextmanager
+async def open_checkpointer(path: Path) -> AsyncIterator[AsyncSqliteSaver]:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    async with aiosqlite.connect(str(path)) as conn:
+        saver = AsyncSqliteSaver(conn, serde=NewsroomSerializer())
+        await saver.setup()
+        yield saver
@@ -4,27 +4,57 @@ LangGraph orchestration that mirrors the Humanity's Diary agent stack.
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, TypedDict
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Generic,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypedDict,
+    TypeVar,
+)
 
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
 
-from ..adapters.base import DocumentRecord
-from ..adapters.registry import adapter_list
+from ..adapters.base import DocumentRecord, SourceAdapter
+from ..agents.clustering import EmbeddingClusterAgent
 from ..agents.llm import LLMFactory
 from ..agents.planner import PlannerReviewerLoop
 from ..agents.publish import MemoryAgent, PublishAgent
+from ..agents.ranking import RankingWeights
 from ..agents.retrieval import CleanerAgent, ClusterAgent, RetrievalAgent
+from ..agents.scheduler import RetrievalScheduler
 from ..agents.sensemaking import SenseMakingAgent
-from ..agents.writing import CriticAgent, DraftAgent, RevisionAgent, SelectorAgent
+from ..agents.writing import (
+    CriticAgent,
+    DraftAgent,
+    RevisionAgent,
+    SelectorAgent,
+    critique_and_revise,
+)
 from ..config import RuntimeConfig
+from ..graph.instrumentation import NewsroomMetrics
+from ..utils.memory_store import MemoryStore
+from ..utils.seen_index import IncrementalFilter, SeenIndex
 
 
 class NewsroomState(TypedDict, total=False):
     planner_directive: str
+    edition: str
     tasks: List[Any]
     review: Any
     raw_documents: List[DocumentRecord]
+    task_completion: List[Dict[str, Any]]
+    seen_updates: Dict[str, Any]
+    provider_health: Dict[str, Dict[str, Any]]
     clean_documents: List[DocumentRecord]
+    cleaning_report: Dict[str, Any]
     clusters: List[Dict[str, Any]]
     sensemaking: List[Dict[str, Any]]
     drafts: List[Dict[str, Any]]
@@ -33,25 +63,140 @@ class NewsroomState(TypedDict, total=False):
     selection: Dict[str, Any]
     publication: Dict[str, Any]
     memory_write: str
+    memory_entry_id: str
+
+
+NodeFn = Callable[..., Awaitable[NewsroomState]]
+
+T = TypeVar("T")
+
+
+class _Deferred(Generic[T]):
+    """Build an agent on first node execution so compiling the graph does no I/O."""
+
+    def __init__(self, build: Callable[[], T]) -> None:
+        self._build = build
+        self._value: Optional[T] = None
+
+    def __call__(self) -> T:
+        if self._value is None:
+            self._value = self._build()
+        return self._value
+
+
+def _with_run_config(
+    fn: Callable[[NewsroomState, RunnableConfig], Awaitable[NewsroomState]],
+) -> NodeFn:
+    """LangGraph hands the run's config only to a parameter named `config`; adapt `fn`."""
+
+    async def node(state: NewsroomState, config: RunnableConfig) -> NewsroomState:
+        return await fn(state, config)
+
+    return node
+
+
+# State keys whose documents a node consumes, for the documents_in metric.
+_DOCUMENT_INPUTS: Dict[str, Tuple[str, ...]] = {
+    "cleaner": ("raw_documents",),
+    "cluster": ("clean_documents",),
+    "sense": ("clean_documents",),
+}
 
 
 def build_default_newsroom(
     config: RuntimeConfig,
     *,
+    adapters: Iterable[SourceAdapter],
     planner_directive: str | None = None,
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    metrics: Optional[NewsroomMetrics] = None,
+    start_after: Optional[str] = None,
+    stop_after: Optional[str] = None,
+    warm: bool = False,
 ):
-    factory = LLMFactory(config)
-    planner = PlannerReviewerLoop(config, factory)
-    retriever = RetrievalAgent(adapter_list(config))
-    cleaner = CleanerAgent()
-    cluster_agent = ClusterAgent(factory)
-    sense_maker = SenseMakingAgent(factory)
-    draft_agent = DraftAgent(factory)
-    critic = CriticAgent(factory)
-    revision = RevisionAgent(factory)
-    selector = SelectorAgent(factory)
-    publisher = PublishAgent()
-    memory = MemoryAgent()
+    """
+    Compile the newsroom graph over `adapters`, which the caller owns and closes (normally
+    the values of an `AdapterSuite` opened with `async with`). `start_after` / `stop_after`
+    name stages to cut the graph to a contiguous slice, e.g. retrieval through sense-making
+    for a shard worker. `warm` builds every agent (and the planner's anchor embedding) now,
+    for long-lived services.
+    """
+    factory = _Deferred(lambda: LLMFactory(config))
+    planner = _Deferred(lambda: PlannerReviewerLoop(config, factory()))
+
+    sources = list(adapters)
+
+    def build_retriever() -> RetrievalAgent:
+        return RetrievalAgent(sources, scheduler=RetrievalScheduler.from_config(config.retrieval))
+
+    retriever = _Deferred(build_retriever)
+    cleaning = config.cleaner
+    cleaner = _Deferred(
+        lambda: CleanerAgent(
+            cleaning.max_per_theme,
+            near_duplicates=cleaning.near_duplicates,
+            near_duplicate_threshold=cleaning.near_duplicate_threshold,
+            weights=RankingWeights(
+                recency=cleaning.recency_weight,
+                score=cleaning.score_weight,
+                diversity=cleaning.diversity_weight,
+                age_unit_hours=cleaning.age_unit_hours,
+            ),
+            max_documents=cleaning.max_documents,
+        )
+    )
+    clustering = config.clustering
+    writing = config.writing
+    prompts = config.prompts
+
+    def build_cluster_agent() -> Any:
+        if clustering.mode == "embedding":
+            return EmbeddingClusterAgent(
+                factory(),
+                batch_size=clustering.batch_size,
+                max_clusters=clustering.max_clusters,
+                merge_threshold=clustering.merge_threshold,
+                max_concurrency=clustering.max_concurrency,
+            )
+        return ClusterAgent(factory(), max_concurrency=prompts.max_concurrency)
+
+    cluster_agent = _Deferred(build_cluster_agent)
+    sense_maker = _Deferred(
+        lambda: SenseMakingAgent(factory(), max_concurrency=prompts.max_concurrency)
+    )
+    draft_agent = _Deferred(
+        lambda: DraftAgent(
+            factory(),
+            variants=writing.variants,
+            max_concurrency=prompts.max_concurrency,
+        )
+    )
+    critic = _Deferred(lambda: CriticAgent(factory(), max_concurrency=writing.max_concurrency))
+    revision = _Deferred(
+        lambda: RevisionAgent(factory(), max_concurrency=writing.max_concurrency)
+    )
+    selector = _Deferred(lambda: SelectorAgent(factory(), max_concurrency=prompts.max_concurrency))
+    publisher = _Deferred(PublishAgent)
+    memory_config = config.memory
+    memory = _Deferred(
+        lambda: MemoryAgent(
+            MemoryStore(memory_config.path),
+            embeddings=factory().embeddings() if memory_config.embeddings else None,
+            legacy_path=memory_config.legacy_path,
+            compact_every=memory_config.compact_every,
+            full_text_days=memory_config.full_text_days,
+        )
+    )
+    incremental = config.incremental
+    seen_index = _Deferred(lambda: SeenIndex(incremental.path))
+
+    def record_filter() -> Any:
+        return seen_index().filter(incremental.overlap_seconds) if incremental.enabled else None
+
+    def with_seen_updates(result: NewsroomState, active: Any) -> NewsroomState:
+        if active is not None:
+            result["seen_updates"] = active.updates()
+        return result
 
     workflow = StateGraph(NewsroomState)
 
@@ -61,79 +206,162 @@ def build_default_newsroom(
             or planner_directive
             or config.planner.default_plan
         )
-        plan = await planner.run(directive)
+        plan = await planner().run(directive)
         return plan
 
     async def retrieval_node(state: NewsroomState) -> NewsroomState:
         tasks = state.get("tasks") or []
-        return await retriever.run(tasks)
+        active = record_filter()
+        return with_seen_updates(await retriever().run(tasks, active), active)
+
+    def archive(result: NewsroomState) -> NewsroomState:
+        # Cleaned documents feed the local archive tier for later runs.
+        documents = result.get("clean_documents") or []
+        for adapter in retriever().local:
+            adapter.archive.add(documents)
+            adapter.archive.prune(config.archive.retention_days * 86400)
+        return result
 
     async def cleaner_node(state: NewsroomState) -> NewsroomState:
-        return await cleaner.run(state.get("raw_documents") or [])
+        return archive(await cleaner().run(state.get("raw_documents") or []))
+
+    async def retrieve_clean_node(state: NewsroomState) -> NewsroomState:
+        active = record_filter()
+        result = await retriever().run_streaming(
+            state.get("tasks") or [], cleaner().incremental(), active
+        )
+        return archive(with_seen_updates(result, active))
 
     async def cluster_node(state: NewsroomState) -> NewsroomState:
-        return await cluster_agent.run(state.get("clean_documents") or [])
+        return await cluster_agent().run(state.get("clean_documents") or [])
 
     async def sense_node(state: NewsroomState) -> NewsroomState:
-        return await sense_maker.run(
+        return await sense_maker().run(
             state.get("clusters") or [],
             state.get("clean_documents") or [],
         )
 
     async def draft_node(state: NewsroomState) -> NewsroomState:
-        return await draft_agent.run(
+        return await draft_agent().run(
             directive=state.get("planner_directive", ""),
             bullets=state.get("sensemaking") or [],
         )
 
     async def critic_node(state: NewsroomState) -> NewsroomState:
-        return await critic.run(state.get("drafts") or [])
+        return await critic().run(state.get("drafts") or [])
 
     async def revision_node(state: NewsroomState) -> NewsroomState:
-        return await revision.run(state.get("drafts") or [], state.get("critiques") or [])
+        return await revision().run(state.get("drafts") or [], state.get("critiques") or [])
+
+    async def critique_revise_node(state: NewsroomState) -> NewsroomState:
+        return await critique_and_revise(state.get("drafts") or [], critic(), revision())
 
     async def selector_node(state: NewsroomState) -> NewsroomState:
-        return await selector.run(
+        return await selector().run(
             directive=state.get("planner_directive", ""),
             revisions=state.get("revisions") or [],
             critiques=state.get("critiques") or [],
         )
 
     async def publish_node(state: NewsroomState) -> NewsroomState:
-        publication = await publisher.run(
+        publication = await publisher().run(
             selection=state.get("selection") or {},
             revisions=state.get("revisions") or [],
             sensemaking=state.get("sensemaking") or [],
             review=state.get("review"),
+            edition=state.get("edition"),
         )
         return {"publication": publication, **publication}
 
-    async def memory_node(state: NewsroomState) -> NewsroomState:
-        return await memory.run(state.get("publication") or {}, state.get("review"))
-
-    workflow.add_node("planner", planner_node)
-    workflow.add_node("retriever", retrieval_node)
-    workflow.add_node("cleaner", cleaner_node)
-    workflow.add_node("cluster", cluster_node)
-    workflow.add_node("sense", sense_node)
-    workflow.add_node("draft", draft_node)
-    workflow.add_node("critic", critic_node)
-    workflow.add_node("revision", revision_node)
-    workflow.add_node("selector", selector_node)
-    workflow.add_node("publish", publish_node)
-    workflow.add_node("memory", memory_node)
-
-    workflow.add_edge(START, "planner")
-    workflow.add_edge("planner", "retriever")
-    workflow.add_edge("retriever", "cleaner")
-    workflow.add_edge("cleaner", "cluster")
-    workflow.add_edge("cluster", "sense")
-    workflow.add_edge("sense", "draft")
-    workflow.add_edge("draft", "critic")
-    workflow.add_edge("critic", "revision")
-    workflow.add_edge("revision", "selector")
-    workflow.add_edge("selector", "publish")
-    workflow.add_edge("publish", "memory")
-    workflow.add_edge("memory", END)
-
-    return workflow.compile()
+    async def memory_node(state: NewsroomState, run_config: RunnableConfig) -> NewsroomState:
+        thread_id = (run_config.get("configurable") or {}).get("thread_id")
+        result = await memory().run(
+            state.get("publication") or {},
+            state.get("review"),
+            sensemaking=state.get("sensemaking") or [],
+            tasks=state.get("tasks") or [],
+            run_id=str(thread_id) if thread_id is not None else None,
+        )
+        # Commit only once the edition is out, so an interrupted run re-covers its stories.
+        if incremental.enabled and state.get("seen_updates"):
+            index = seen_index()
+            updates = IncrementalFilter.restrict_updates(
+                state["seen_updates"], state.get("clean_documents") or []
+            )
+            index.commit(updates, edition=state.get("edition"))
+            index.prune(incremental.retention_days * 86400)
+        return result
+
+    stages: List[Tuple[str, NodeFn]] = [("planner", planner_node)]
+    if config.retrieval.streaming:
+        stages.append(("retrieve_clean", retrieve_clean_node))
+    else:
+        stages.extend([("retriever", retrieval_node), ("cleaner", cleaner_node)])
+    stages.extend(
+        [
+            ("cluster", cluster_node),
+            ("sense", sense_node),
+            ("draft", draft_node),
+        ]
+    )
+    if writing.pipeline_revisions:
+        stages.append(("critique_revise", critique_revise_node))
+    else:
+        stages.extend([("critic", critic_node), ("revision", revision_node)])
+    stages.extend(
+        [
+            ("selector", selector_node),
+            ("publish", publish_node),
+            ("memory", _with_run_config(memory_node)),
+        ]
+    )
+
+    names = [name for name, _ in stages]
+    for bound in (start_after, stop_after):
+        if bound is not None and bound not in names:
+            raise ValueError(f"Unknown stage {bound!r}; expected one of {names}")
+    if stop_after is not None:
+        stages = stages[: names.index(stop_after) + 1]
+    if start_after is not None:
+        stages = stages[names.index(start_after) + 1 :]
+    if not stages:
+        raise ValueError(f"No stages between {start_after!r} and {stop_after!r}")
+
+    def has_new_documents(state: NewsroomState) -> str:
+        return "continue" if state.get("clean_documents") else "stop"
+
+    previous = START
+    for name, node in stages:
+        if metrics is not None:
+            node = metrics.instrument(name, node, reads=_DOCUMENT_INPUTS.get(name, ()))
+        workflow.add_node(name, node)
+        if incremental.enabled and previous in ("cleaner", "retrieve_clean"):
+            # Nothing new since the last edition: skip clustering and writing entirely.
+            workflow.add_conditional_edges(
+                previous, has_new_documents, {"continue": name, "stop": END}
+            )
+        else:
+            workflow.add_edge(previous, name)
+        previous = name
+    workflow.add_edge(previous, END)
+
+    if warm:
+        for agent in (
+            planner,
+            retriever,
+            cleaner,
+            cluster_agent,
+            sense_maker,
+            draft_agent,
+            critic,
+            revision,
+            selector,
+            publisher,
+            memory,
+        ):
+            agent()
+        planner().warm()
+        if incremental.enabled:
+            seen_index()
+
+    return workflow.compile(checkpointer=checkpointer)
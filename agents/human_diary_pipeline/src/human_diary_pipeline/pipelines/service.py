@@ -0,0 +1,367 @@
+"""
+Daemon mode: one warm newsroom runtime fed from a priority job queue, with a local
+HTTP / Unix-socket API and an optional drop directory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import datetime as dt
+import itertools
+import json
+import signal
+import time
+import uuid
+from dataclasses import asdict, dataclass, field
+from http import HTTPStatus
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from ..config import ServiceConfig
+from .batch import Edition, NewsroomRuntime, is_edition_name, load_editions, run_edition
+from .checkpoint import encode_state
+
+_MAX_BODY = 1 << 20
+
+
+@dataclass
+class Job:
+    id: str
+    directive: str
+    edition: str
+    priority: int = 0
+    source: str = "api"
+    status: str = "queued"
+    submitted_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    run_id: Optional[str] = None
+    error: Optional[str] = None
+    publish_path: Optional[str] = None
+    state_path: Optional[str] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in ("ok", "error", "interrupted")
+
+    def summary(self) -> Dict[str, Any]:
+        summary = asdict(self)
+        if self.started_at is not None:
+            summary["queued_seconds"] = round(self.started_at - self.submitted_at, 3)
+        if self.started_at is not None and self.finished_at is not None:
+            summary["elapsed"] = round(self.finished_at - self.started_at, 3)
+        return summary
+
+
+class JobRejected(ValueError):
+    """A submission the service cannot accept (missing directive, bad priority, ...)."""
+
+
+class NewsroomService:
+    """
+    Run submitted jobs through one `NewsroomRuntime` with at most `workers` in flight.
+    Higher `priority` runs first, ties in submission order. Each finished job writes
+    `state.json` and `job.json` under `output_dir/<job id>/`; only the last `max_history`
+    finished jobs are kept in memory.
+    """
+
+    def __init__(self, runtime: NewsroomRuntime, config: Optional[ServiceConfig] = None) -> None:
+        self.runtime = runtime
+        self.config = config or runtime.config.service
+        self.output_dir = self.config.output_dir
+        self.jobs: Dict[str, Job] = {}
+        self.started_at = time.time()
+        self._queue: asyncio.PriorityQueue[Tuple[int, int, str]] = asyncio.PriorityQueue()
+        self._sequence = itertools.count()
+        self._workers: List[asyncio.Task[None]] = []
+        self._running: Set[str] = set()
+
+    def submit(
+        self,
+        directive: Optional[str] = None,
+        *,
+        edition: Optional[str] = None,
+        priority: int = 0,
+        source: str = "api",
+    ) -> Job:
+        directive = directive or self.runtime.config.planner.default_plan
+        if not isinstance(directive, str) or not directive.strip():
+            raise JobRejected("`plan` must be a non-empty string")
+        if isinstance(priority, bool) or not isinstance(priority, int):
+            raise JobRejected("`priority` must be an integer")
+        if edition is not None and not is_edition_name(edition):
+            raise JobRejected("`edition` must be a plain name")
+        job_id = uuid.uuid4().hex[:12]
+        job = Job(
+            id=job_id,
+            directive=directive,
+            edition=edition or job_id,
+            priority=priority,
+            source=source,
+        )
+        self.jobs[job_id] = job
+        self._queue.put_nowait((-priority, next(self._sequence), job_id))
+        return job
+
+    def result(self, job_id: str) -> Optional[Dict[str, Any]]:
+        job = self.jobs.get(job_id)
+        if job is None or job.state_path is None:
+            return None
+        return json.loads(Path(job.state_path).read_text(encoding="utf-8"))
+
+    def health(self) -> Dict[str, Any]:
+        counts: Dict[str, int] = {}
+        for job in self.jobs.values():
+            counts[job.status] = counts.get(job.status, 0) + 1
+        return {
+            "status": "ok",
+            "uptime": round(time.time() - self.started_at, 1),
+            "workers": self.config.workers,
+            "queued": self._queue.qsize(),
+            "running": len(self._running),
+            "jobs": counts,
+        }
+
+    def start(self) -> None:
+        self._workers = [
+            asyncio.create_task(self._work(), name=f"newsroom-worker-{index}")
+            for index in range(self.config.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Cancel the workers; jobs cut short are marked `interrupted`."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _work(self) -> None:
+        while True:
+            _, _, job_id = await self._queue.get()
+            try:
+                await self._run(self.jobs[job_id])
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job: Job) -> None:
+        job.status = "running"
+        job.started_at = time.time()
+        job.run_id = f"{dt.date.today().isoformat()}-{job.id}"
+        edition = Edition(name=job.edition, directive=job.directive)
+        self._running.add(job.id)
+        state = None
+        try:
+            state = await run_edition(self.runtime, edition, job.run_id)
+        except asyncio.CancelledError:
+            job.status = "interrupted"
+            raise
+        except Exception as exc:
+            job.status, job.error = "error", f"{type(exc).__name__}: {exc}"
+        finally:
+            self._running.discard(job.id)
+            job.finished_at = time.time()
+            try:
+                self._write_result(job, state)
+            except Exception as exc:
+                job.status, job.state_path = "error", None
+                job.error = f"writing results failed: {type(exc).__name__}: {exc}"
+            self._forget_old()
+
+    def _write_result(self, job: Job, state: Optional[Dict[str, Any]]) -> None:
+        job_dir = self.output_dir / job.id
+        job_dir.mkdir(parents=True, exist_ok=True)
+        if state is not None:
+            state_path = job_dir / "state.json"
+            state_path.write_text(json.dumps(encode_state(state), indent=2, default=str))
+            job.status, job.state_path = "ok", str(state_path)
+            job.publish_path = state.get("publish_path")
+        (job_dir / "job.json").write_text(json.dumps(job.summary(), indent=2))
+
+    def _forget_old(self) -> None:
+        finished = [job for job in self.jobs.values() if job.finished]
+        for job in finished[: max(0, len(finished) - self.config.max_history)]:
+            del self.jobs[job.id]
+
+    def route(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        parts = [part for part in path.split("/") if part]
+        if parts == ["health"] and method == "GET":
+            return 200, self.health()
+        if parts == ["jobs"]:
+            if method == "GET":
+                return 200, {"jobs": [job.summary() for job in self.jobs.values()]}
+            if method == "POST":
+                try:
+                    payload = json.loads(body or b"{}")
+                    if not isinstance(payload, dict):
+                        raise JobRejected("body must be a JSON object")
+                    job = self.submit(
+                        payload.get("plan"),
+                        edition=payload.get("edition"),
+                        priority=payload.get("priority", 0),
+                    )
+                except ValueError as exc:
+                    return 400, {"error": str(exc)}
+                return 202, job.summary()
+            return 405, {"error": f"{method} not allowed"}
+        if len(parts) in (2, 3) and parts[0] == "jobs" and parts[2:] in ([], ["result"]):
+            if method != "GET":
+                return 405, {"error": f"{method} not allowed"}
+            job = self.jobs.get(parts[1])
+            if job is None:
+                return 404, {"error": f"unknown job {parts[1]!r}"}
+            if len(parts) == 2:
+                return 200, job.summary()
+            if not job.finished:
+                return 409, {"error": f"job is {job.status}", "status": job.status}
+            state = self.result(job.id)
+            if state is None:
+                return 404, {"error": job.error or "no result", "status": job.status}
+            return 200, state
+        return 404, {"error": f"no route for {path}"}
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Minimal HTTP/1.1: one JSON request and response per connection."""
+        request = None
+        try:
+            method, target, _ = (await reader.readline()).decode("latin-1").split(" ", 2)
+            headers: Dict[str, str] = {}
+            while True:
+                line = await reader.readline()
+                if line in (b"\r\n", b"\n", b""):
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                headers[name.strip().lower()] = value.strip()
+            length = int(headers.get("content-length") or 0)
+            if length > _MAX_BODY:
+                status, payload = 413, {"error": "request body too large"}
+            else:
+                body = await reader.readexactly(length) if length else b""
+                request = (method.upper(), urlsplit(target).path, body)
+        except (ValueError, asyncio.IncompleteReadError):
+            status, payload = 400, {"error": "malformed request"}
+        if request is not None:
+            try:
+                status, payload = self.route(*request)
+            except Exception as exc:  # e.g. a truncated state.json behind /result
+                status, payload = 500, {"error": f"{type(exc).__name__}: {exc}"}
+        data = json.dumps(payload, default=str).encode("utf-8")
+        head = (
+            f"HTTP/1.1 {status} {HTTPStatus(status).phrase}\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(data)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode("latin-1") + data)
+            await writer.drain()
+        finally:
+            writer.close()
+
+    def accept_inbox_file(self, path: Path) -> List[Job]:
+        """
+        Queue the jobs in a dropped file: `.json` holds one `{"plan", "edition", "priority"}`
+        object or a list of them; anything else is read like a `--batch` file.
+        """
+        if path.suffix == ".json":
+            entries = json.loads(path.read_text(encoding="utf-8"))
+            entries = entries if isinstance(entries, list) else [entries]
+            if not all(isinstance(entry, dict) for entry in entries):
+                raise JobRejected("expected a JSON object or a list of objects")
+        else:
+            entries = [
+                {"plan": edition.directive, "edition": edition.name}
+                for edition in load_editions(path)
+            ]
+        source = f"inbox:{path.name}"
+        return [
+            self.submit(
+                entry.get("plan"),
+                edition=entry.get("edition"),
+                priority=entry.get("priority", 0),
+                source=source,
+            )
+            for entry in entries
+        ]
+
+    async def watch_inbox(self, inbox: Path) -> None:
+        """Poll `inbox`, moving each file to `accepted/` or `rejected/` (with a `.error` note)."""
+        accepted, rejected = inbox / "accepted", inbox / "rejected"
+        for directory in (inbox, accepted, rejected):
+            directory.mkdir(parents=True, exist_ok=True)
+        while True:
+            for path in _inbox_files(inbox):
+                # A file can be renamed or removed by someone else mid-scan; the next
+                # poll picks up whatever is left, so one bad entry never stops the watcher.
+                try:
+                    self._take_inbox_file(path, accepted, rejected)
+                except OSError:
+                    continue
+            await asyncio.sleep(self.config.poll_seconds)
+
+    def _take_inbox_file(self, path: Path, accepted: Path, rejected: Path) -> None:
+        try:
+            jobs = self.accept_inbox_file(path)
+        except (OSError, ValueError, KeyError) as exc:
+            if not path.exists():
+                return
+            path.replace(rejected / path.name)
+            note = rejected / f"{path.name}.error"
+            note.write_text(f"{type(exc).__name__}: {exc}\n")
+            return
+        path.replace(accepted / path.name)
+        (accepted / f"{path.name}.jobs").write_text("\n".join(job.id for job in jobs) + "\n")
+
+
+def _inbox_files(inbox: Path) -> List[Path]:
+    """
+    Files ready to queue, oldest first. Writers should drop files via rename; dotfiles are
+    still being written, and files that vanish while listing are skipped.
+    """
+    stamped: List[Tuple[float, Path]] = []
+    for path in inbox.iterdir():
+        if path.name.startswith("."):
+            continue
+        try:
+            if path.is_file():
+                stamped.append((path.stat().st_mtime, path))
+        except OSError:
+            continue
+    return [path for _, path in sorted(stamped)]
+
+
+async def serve(runtime: NewsroomRuntime, config: Optional[ServiceConfig] = None) -> None:
+    """Run the service until SIGINT / SIGTERM."""
+    service = NewsroomService(runtime, config)
+    config = service.config
+    if config.socket is not None:
+        config.socket.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(service.handle, path=str(config.socket))
+        address = f"unix:{config.socket}"
+    else:
+        server = await asyncio.start_server(service.handle, config.host, config.port)
+        address = f"http://{config.host}:{config.port}"
+    service.start()
+    watcher = asyncio.create_task(service.watch_inbox(config.inbox)) if config.inbox else None
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(signum, stopping.set)
+        except NotImplementedError:  # Windows event loops
+            pass
+    print(
+        f"[serve:{address} workers={config.workers}"
+        f"{' inbox=' + str(config.inbox) if config.inbox else ''}]"
+    )
+    try:
+        await stopping.wait()
+    finally:
+        server.close()
+        await server.wait_closed()
+        if watcher is not None:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+        await service.stop()
+        if config.socket is not None:
+            config.socket.unlink(missing_ok=True)
@@ -0,0 +1,338 @@
+"""
+Process-pool execution: shard planner tasks by region, run retrieval through sense-making
+in worker processes, and merge the shards before the writing stages.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import multiprocessing
+import os
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from ..adapters.base import DocumentRecord
+from ..config import RuntimeConfig
+from ..graph.instrumentation import NewsroomMetrics
+from ..utils import provenance
+from ..utils.metrics import NodeMetrics
+from ..utils.seen_index import IncrementalFilter
+from .batch import open_runtime
+from .newsroom import build_default_newsroom
+
+# Column order for documents on the wire; `published_at` travels as ISO-8601 text.
+_RECORD_FIELDS = (
+    "id",
+    "title",
+    "summary",
+    "url",
+    "source",
+    "published_at",
+    "score",
+    "metadata",
+    "domain",
+    "canonical_url",
+    "payload_ref",
+)
+
+
+def pack(payload: Dict[str, Any]) -> bytes:
+    """Compact JSON (no whitespace) compressed with zlib."""
+    text = json.dumps(payload, separators=(",", ":"), ensure_ascii=False, default=str)
+    return zlib.compress(text.encode("utf-8"), 6)
+
+
+def unpack(data: bytes) -> Dict[str, Any]:
+    return json.loads(zlib.decompress(data).decode("utf-8"))
+
+
+def records_to_columns(records: Sequence[DocumentRecord]) -> Dict[str, List[Any]]:
+    """Columnar layout: one list per field, so keys are written once per shard, not per record."""
+    columns: Dict[str, List[Any]] = {name: [] for name in _RECORD_FIELDS}
+    for record in records:
+        row = record.as_dict()
+        for name in _RECORD_FIELDS:
+            columns[name].append(row[name])
+    return columns
+
+
+def columns_to_records(columns: Dict[str, List[Any]]) -> List[DocumentRecord]:
+    count = len(columns.get("id") or [])
+    return [
+        DocumentRecord.from_dict({name: columns[name][index] for name in _RECORD_FIELDS})
+        for index in range(count)
+    ]
+
+
+def shard_tasks(
+    tasks: Iterable[Any],
+    *,
+    shard_by: str = "region",
+    shards: int = 4,
+) -> Dict[str, List[Any]]:
+    """
+    Group planner tasks by `region` (tasks without one share a `global` shard) or
+    round-robin. Region sharding falls back to round-robin when the plan names fewer than
+    two regions, since one shard would run everything serially.
+    """
+    tasks = list(tasks)
+    groups: Dict[str, List[Any]] = {}
+    if shard_by == "region":
+        for task in tasks:
+            region = task.get("region") if isinstance(task, dict) else None
+            key = str(region).strip().lower() if region else "global"
+            groups.setdefault(key, []).append(task)
+        if len(groups.keys() - {"global"}) >= 2:
+            return groups
+        groups = {}
+    for index, task in enumerate(tasks):
+        groups.setdefault(f"shard-{index % max(shards, 1)}", []).append(task)
+    return groups
+
+
+@dataclass
+class ShardResult:
+    shard: str
+    clean_documents: List[DocumentRecord] = field(default_factory=list)
+    clusters: List[Dict[str, Any]] = field(default_factory=list)
+    sensemaking: List[Dict[str, Any]] = field(default_factory=list)
+    task_completion: List[Dict[str, Any]] = field(default_factory=list)
+    provider_health: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    seen_updates: Dict[str, Any] = field(default_factory=dict)
+    node_metrics: List[Dict[str, Any]] = field(default_factory=list)
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+
+async def _run_shard_async(request: Dict[str, Any]) -> Dict[str, Any]:
+    config = RuntimeConfig.model_validate(request["config"])
+    shard = request["shard"]
+    run_id = f"{request['run_id']}-{shard}"
+    metrics = NewsroomMetrics()
+    # Workers skip checkpoints: the coordinator owns the run and re-runs a failed shard whole.
+    config = config.model_copy(
+        update={"checkpoint": config.checkpoint.model_copy(update={"enabled": False})}
+    )
+    async with open_runtime(config, metrics=metrics) as runtime:
+        workflow = build_default_newsroom(
+            config,
+            adapters=runtime.adapters.values(),
+            metrics=metrics,
+            start_after="planner",
+            stop_after="sense",
+        )
+        state = await workflow.ainvoke(
+            {"planner_directive": request["directive"], "tasks": request["tasks"]},
+            {"configurable": {"thread_id": run_id}},
+        )
+    return {
+        "shard": shard,
+        "documents": records_to_columns(state.get("clean_documents") or []),
+        "clusters": state.get("clusters") or [],
+        "sensemaking": state.get("sensemaking") or [],
+        "task_completion": state.get("task_completion") or [],
+        "provider_health": state.get("provider_health") or {},
+        "seen_updates": state.get("seen_updates") or {},
+        "node_metrics": [node.as_dict() for node in metrics.runs.get(run_id, {}).values()],
+    }
+
+
+def run_shard(payload: bytes) -> bytes:
+    """Process-pool entry point: packed request in, packed shard result out."""
+    request = unpack(payload)
+    started = time.perf_counter()
+    try:
+        result = asyncio.run(_run_shard_async(request))
+    except Exception as exc:
+        result = {"shard": request["shard"], "error": f"{type(exc).__name__}: {exc}"}
+    result["elapsed"] = round(time.perf_counter() - started, 3)
+    return pack(result)
+
+
+def _decode_result(data: bytes) -> ShardResult:
+    payload = unpack(data)
+    shard = payload["shard"]
+    # Adapter ids such as `perplexity-0` repeat across shards, so namespace them first.
+    records = columns_to_records(payload.get("documents") or {})
+    ids = {record.id for record in records}
+    for record in records:
+        record.id = f"{shard}:{record.id}"
+        for alternate in record.metadata.get("alternate_sources") or []:
+            alternate["id"] = f"{shard}:{alternate['id']}"
+    clusters = [
+        {**cluster, "ids": [f"{shard}:{id_}" for id_ in cluster.get("ids") or []]}
+        for cluster in payload.get("clusters") or []
+    ]
+    # Bullets may cite record ids; anything else (e.g. a URL) is left as it is.
+    sensemaking = [
+        {
+            **bullet,
+            "citations": [
+                f"{shard}:{citation}" if citation in ids else citation
+                for citation in bullet.get("citations") or []
+            ],
+        }
+        for bullet in payload.get("sensemaking") or []
+    ]
+    return ShardResult(
+        shard=shard,
+        clean_documents=records,
+        clusters=clusters,
+        sensemaking=sensemaking,
+        task_completion=[
+            {**entry, "shard": shard} for entry in payload.get("task_completion") or []
+        ],
+        provider_health=payload.get("provider_health") or {},
+        seen_updates=payload.get("seen_updates") or {},
+        node_metrics=payload.get("node_metrics") or [],
+        elapsed=payload.get("elapsed", 0.0),
+        error=payload.get("error"),
+    )
+
+
+def merge_shards(
+    results: Sequence[ShardResult],
+    *,
+    near_duplicates: bool = True,
+    near_duplicate_threshold: float = 0.8,
+) -> Dict[str, Any]:
+    """
+    Merge shard outputs with the same exact and near-duplicate rules as the cleaner, then
+    point cluster ids at the surviving records and fold clusters and bullets that share
+    a label or theme.
+    """
+    records = provenance.enrich_provenance(
+        record for result in results for record in result.clean_documents
+    )
+    deduped = provenance.dedupe(records)
+    survivor_by_key = {provenance.dedupe_key(record): record.id for record in deduped}
+    merged = (
+        provenance.merge_near_duplicates(deduped, threshold=near_duplicate_threshold)
+        if near_duplicates
+        else deduped
+    )
+    folded: Dict[str, str] = {}
+    for record in merged:
+        for alternate in record.metadata.get("alternate_sources") or []:
+            folded[alternate["id"]] = record.id
+    alias = {}
+    for record in records:
+        survivor = survivor_by_key[provenance.dedupe_key(record)]
+        alias[record.id] = folded.get(survivor, survivor)
+
+    clusters: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for cluster in result.clusters:
+            label = str(cluster.get("label") or "misc")
+            key = label.strip().lower()
+            target = clusters.get(key)
+            if target is None:
+                target = clusters[key] = {**cluster, "label": label, "ids": [], "shards": []}
+            elif cluster.get("rationale") and cluster["rationale"] != target.get("rationale"):
+                target["rationale"] = f"{target.get('rationale') or ''} {cluster['rationale']}"
+            for id_ in cluster.get("ids") or []:
+                resolved = alias.get(id_, id_)
+                if resolved not in target["ids"]:
+                    target["ids"].append(resolved)
+            target["shards"].append(result.shard)
+
+    bullets: Dict[str, Dict[str, Any]] = {}
+    for result in results:
+        for bullet in result.sensemaking:
+            theme = str(bullet.get("theme") or "general").strip().lower()
+            existing = bullets.get(theme)
+            if existing is None:
+                existing = bullets[theme] = {**bullet, "citations": []}
+            for citation in bullet.get("citations") or []:
+                resolved = alias.get(citation, citation)
+                if resolved not in existing["citations"]:
+                    existing["citations"].append(resolved)
+
+    return {
+        "clean_documents": merged,
+        "clusters": list(clusters.values()),
+        "sensemaking": list(bullets.values()),
+        "task_completion": [entry for result in results for entry in result.task_completion],
+        "provider_health": {result.shard: result.provider_health for result in results},
+        "seen_updates": IncrementalFilter.merge_updates(result.seen_updates for result in results),
+    }
+
+
+async def run_sharded(
+    config: RuntimeConfig,
+    *,
+    run_id: str,
+    planner_directive: Optional[str] = None,
+    metrics: Optional[NewsroomMetrics] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Any]:
+    """
+    Plan in-process, fan shards out to a process pool, merge, then write in-process.
+    Returns the final state plus a `shards` summary. Sharded runs are not checkpointed.
+    """
+    metrics = metrics or NewsroomMetrics()
+    directive = planner_directive or config.planner.default_plan
+    sharding = config.sharding
+    # Planning and writing never touch the adapters, so the coordinator opens none.
+    planner = build_default_newsroom(config, adapters=[], metrics=metrics, stop_after="planner")
+    writer = build_default_newsroom(config, adapters=[], metrics=metrics, start_after="sense")
+    graph_config = {"configurable": {"thread_id": run_id}}
+
+    plan = await planner.ainvoke({"planner_directive": directive}, graph_config)
+    groups = shard_tasks(
+        plan.get("tasks") or [], shard_by=sharding.shard_by, shards=sharding.shards
+    )
+    config_payload = config.model_dump(mode="json", by_alias=True)
+    workers = max_workers or sharding.max_workers or min(len(groups), os.cpu_count() or 1)
+    loop = asyncio.get_running_loop()
+    # Spawned workers start clean instead of inheriting the loop, sockets and threads.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max(workers, 1), mp_context=context) as pool:
+        requests = {
+            shard: pack(
+                {
+                    "config": config_payload,
+                    "run_id": run_id,
+                    "shard": shard,
+                    "directive": plan.get("planner_directive", directive),
+                    "tasks": tasks,
+                }
+            )
+            for shard, tasks in groups.items()
+        }
+        packed = await asyncio.gather(
+            *[loop.run_in_executor(pool, run_shard, request) for request in requests.values()]
+        )
+    results = [_decode_result(data) for data in packed]
+    for result in results:
+        # Shard runs are complete: fold them into the totals rather than keep them live.
+        shard_run = f"{run_id}-{result.shard}"
+        metrics.runs[shard_run] = {
+            entry["node"]: NodeMetrics(**entry) for entry in result.node_metrics
+        }
+        metrics.finish_run(shard_run)
+
+    merged = merge_shards(
+        [result for result in results if result.error is None],
+        near_duplicates=config.cleaner.near_duplicates,
+        near_duplicate_threshold=config.cleaner.near_duplicate_threshold,
+    )
+    state = await writer.ainvoke({**plan, **merged}, graph_config)
+    metrics.finish_run(run_id)
+    state["shards"] = [
+        {
+            "shard": result.shard,
+            "tasks": len(groups.get(result.shard, [])),
+            "documents": len(result.clean_documents),
+            "elapsed": result.elapsed,
+            "request_bytes": len(requests[result.shard]),
+            "result_bytes": len(data),
+            "error": result.error,
+        }
+        for result, data in zip(results, packed)
+    ]
+    return state
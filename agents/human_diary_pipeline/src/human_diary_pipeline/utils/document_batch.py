@@ -0,0 +1,89 @@
+"""
+Columnar view over document records, used to score cleaned records in vectorized steps.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from ..adapters.base import DocumentRecord
+
+
+def string_codes(values: Sequence[Optional[str]], missing: str) -> tuple[np.ndarray, List[str]]:
+    """Small-integer code per distinct string, assigned in first-seen order, plus the table."""
+    keys = [value or missing for value in values]
+    table = {key: code for code, key in enumerate(dict.fromkeys(keys))}
+    codes = np.fromiter(map(table.__getitem__, keys), dtype=np.int32, count=len(keys))
+    return codes, list(table)
+
+
+class DocumentBatch:
+    """
+    Parallel arrays over a list of `DocumentRecord`s: float64 `timestamps` (0 when unknown)
+    and `scores`, and int32 codes into the `domains` / `sources` tables. The records stay
+    the row objects, so selections (`take`) are index arrays and nothing is copied.
+    """
+
+    __slots__ = (
+        "records",
+        "timestamps",
+        "scores",
+        "domain_codes",
+        "domains",
+        "source_codes",
+        "sources",
+    )
+
+    def __init__(
+        self,
+        records: List[DocumentRecord],
+        timestamps: np.ndarray,
+        scores: np.ndarray,
+        domain_codes: np.ndarray,
+        domains: List[str],
+        source_codes: np.ndarray,
+        sources: List[str],
+    ) -> None:
+        self.records = records
+        self.timestamps = timestamps
+        self.scores = scores
+        self.domain_codes = domain_codes
+        self.domains = domains
+        self.source_codes = source_codes
+        self.sources = sources
+
+    @classmethod
+    def from_records(cls, records: Iterable[DocumentRecord]) -> "DocumentBatch":
+        records = list(records)
+        count = len(records)
+        timestamps = np.fromiter(
+            (record.published_at.timestamp() if record.published_at else 0.0 for record in records),
+            dtype=np.float64,
+            count=count,
+        )
+        scores = np.fromiter(
+            (record.score or 0.0 for record in records), dtype=np.float64, count=count
+        )
+        domain_codes, domains = string_codes([record.domain for record in records], "unknown")
+        source_codes, sources = string_codes([record.source for record in records], "unknown")
+        return cls(records, timestamps, scores, domain_codes, domains, source_codes, sources)
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def take(self, indices: np.ndarray) -> "DocumentBatch":
+        indices = np.asarray(indices, dtype=np.intp)
+        return DocumentBatch(
+            [self.records[index] for index in indices],
+            self.timestamps[indices],
+            self.scores[indices],
+            self.domain_codes[indices],
+            self.domains,
+            self.source_codes[indices],
+            self.sources,
+        )
+
+    def to_records(self) -> List[DocumentRecord]:
+        return list(self.records)
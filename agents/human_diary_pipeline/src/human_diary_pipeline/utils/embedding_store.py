@@ -0,0 +1,178 @@
+"""
+On-disk embedding store: a memory-mapped float32 matrix plus an append-only key index.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import re
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process lock, so one writer at a time
+    fcntl = None  # type: ignore[assignment]
+
+
+class EmbeddingStore:
+    """
+    Vectors for one embedding model, keyed by a content hash of the embedded text.
+
+    Rows are appended to `<model>.f32` and indexed by `<model>.idx` (`key<TAB>row` lines).
+    The matrix is written before the index, so a crash can only leave unindexed rows.
+    Sharded workers share one directory: appends hold an exclusive lock on `<model>.lock`
+    and first read whatever other processes indexed since, so row numbers never collide.
+    """
+
+    def __init__(self, directory: Path, model: str) -> None:
+        slug = re.sub(r"[^\w.-]", "_", model)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.model = model
+        self.matrix_path = directory / f"{slug}.f32"
+        self.index_path = directory / f"{slug}.idx"
+        self.lock_path = directory / f"{slug}.lock"
+        self.dim: Optional[int] = None
+        self._rows: Dict[str, int] = {}
+        self._matrix: Optional[np.memmap] = None
+        self._index_offset = 0
+        self.refresh()
+
+    @staticmethod
+    def key(text: str) -> str:
+        return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        with self.lock_path.open("a") as handle:
+            if fcntl is not None:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def refresh(self) -> None:
+        """Pick up index lines appended since the last read, by this or another process."""
+        if not self.index_path.exists() or self.index_path.stat().st_size == self._index_offset:
+            return
+        with self.index_path.open("rb") as handle:
+            handle.seek(self._index_offset)
+            data = handle.read()
+        # Only complete lines; a partial one is finished by its writer under the lock.
+        end = data.rfind(b"\n") + 1
+        lines = data[:end].decode("utf-8").splitlines()
+        if self._index_offset == 0 and lines:
+            header = lines.pop(0).split("\t")
+            if len(header) != 2 or header[0] != "dim":
+                return
+            self.dim = int(header[1])
+        self._index_offset += end
+        for line in lines:
+            key, _, row = line.partition("\t")
+            if row:
+                self._rows[key] = int(row)
+        self._remap()
+
+    def _remap(self) -> None:
+        if not self.dim or not self.matrix_path.exists():
+            self._matrix = None
+            return
+        count = self.matrix_path.stat().st_size // (4 * self.dim)
+        self._rows = {key: row for key, row in self._rows.items() if row < count}
+        self._matrix = (
+            np.memmap(self.matrix_path, dtype=np.float32, mode="r", shape=(count, self.dim))
+            if count
+            else None
+        )
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        row = self._rows.get(key)
+        if row is None or self._matrix is None:
+            return None
+        return self._matrix[row]
+
+    def put_many(self, keys: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        if all(key in self._rows for key in keys):
+            return
+        with self._locked():
+            self.refresh()
+            fresh = [(key, vector) for key, vector in zip(keys, vectors) if key not in self._rows]
+            if not fresh:
+                return
+            block = np.asarray([vector for _, vector in fresh], dtype=np.float32)
+            if self.dim is None:
+                self.dim = int(block.shape[1])
+                with self.index_path.open("w", encoding="utf-8") as handle:
+                    handle.write(f"dim\t{self.dim}\n")
+                self._index_offset = self.index_path.stat().st_size
+            row_bytes = 4 * self.dim
+            size = self.matrix_path.stat().st_size if self.matrix_path.exists() else 0
+            start = size // row_bytes
+            with self.matrix_path.open("ab") as handle:
+                # Drop a torn row left by a crashed writer so new rows stay aligned.
+                if size % row_bytes:
+                    handle.truncate(start * row_bytes)
+                handle.write(block.tobytes())
+            with self.index_path.open("a", encoding="utf-8") as handle:
+                for offset, (key, _) in enumerate(fresh):
+                    handle.write(f"{key}\t{start + offset}\n")
+            self.refresh()
+
+
+class CachedEmbeddings(Embeddings):
+    """
+    `Embeddings` wrapper that serves vectors from an `EmbeddingStore` and sends only
+    the misses to the wrapped model, in batches.
+    """
+
+    def __init__(self, inner: Embeddings, store: EmbeddingStore, *, batch_size: int = 64) -> None:
+        self.inner = inner
+        self.store = store
+        self.batch_size = batch_size
+
+    def _misses(self, texts: Sequence[str]) -> Dict[str, str]:
+        self.store.refresh()
+        misses: Dict[str, str] = {}
+        for text in texts:
+            key = self.store.key(text)
+            if key not in self.store:
+                misses.setdefault(key, text)
+        return misses
+
+    def _batches(self, misses: Dict[str, str]) -> List[List[str]]:
+        keys = list(misses)
+        return [keys[i : i + self.batch_size] for i in range(0, len(keys), self.batch_size)]
+
+    def _collect(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self.store.get(self.store.key(text)).tolist() for text in texts]
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        misses = self._misses(texts)
+        for batch in self._batches(misses):
+            self.store.put_many(batch, self.inner.embed_documents([misses[key] for key in batch]))
+        return self._collect(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        misses = self._misses(texts)
+        for batch in self._batches(misses):
+            vectors = await self.inner.aembed_documents([misses[key] for key in batch])
+            self.store.put_many(batch, vectors)
+        return self._collect(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        return self.embed_documents([text])[0]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        return (await self.aembed_documents([text]))[0]
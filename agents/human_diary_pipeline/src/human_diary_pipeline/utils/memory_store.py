@@ -0,0 +1,360 @@
+"""
+DuckDB-backed newsroom memory: one row per published edition, with indexed lookups by date,
+region, theme and winner id, and cosine-similarity search over entry embeddings.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+import duckdb
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS entries ("
+    " id VARCHAR PRIMARY KEY,"
+    " created_at TIMESTAMP NOT NULL,"
+    " edition_date DATE NOT NULL,"
+    " edition VARCHAR,"
+    " winner_id VARCHAR,"
+    " lede VARCHAR,"
+    " published_entry VARCHAR,"
+    " metadata JSON,"
+    " planner_feedback JSON,"
+    " embedding FLOAT[])",
+    # Regions and themes are many-per-entry, so they live in a tag table of their own.
+    "CREATE TABLE IF NOT EXISTS entry_tags ("
+    " entry_id VARCHAR NOT NULL,"
+    " kind VARCHAR NOT NULL,"
+    " value VARCHAR NOT NULL)",
+    "CREATE TABLE IF NOT EXISTS meta (key VARCHAR PRIMARY KEY, value VARCHAR)",
+    # Added after the first release; older files gain the column on open.
+    "ALTER TABLE entries ADD COLUMN IF NOT EXISTS run_id VARCHAR",
+    "CREATE INDEX IF NOT EXISTS entries_date ON entries (edition_date)",
+    "CREATE INDEX IF NOT EXISTS entries_winner ON entries (winner_id)",
+    "CREATE INDEX IF NOT EXISTS tags_lookup ON entry_tags (kind, value)",
+    "CREATE INDEX IF NOT EXISTS tags_entry ON entry_tags (entry_id)",
+)
+
+_COLUMNS = (
+    "id",
+    "created_at",
+    "edition_date",
+    "edition",
+    "winner_id",
+    "lede",
+    "published_entry",
+    "metadata",
+    "planner_feedback",
+    "run_id",
+)
+
+
+def _tag(value: Any) -> str:
+    return str(value).strip().lower()
+
+
+@dataclass
+class MemoryEntry:
+    published_entry: Optional[str]
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    planner_feedback: Any = None
+    edition: Optional[str] = None
+    winner_id: Optional[str] = None
+    lede: Optional[str] = None
+    regions: List[str] = field(default_factory=list)
+    themes: List[str] = field(default_factory=list)
+    embedding: Optional[Sequence[float]] = None
+    run_id: Optional[str] = None
+    created_at: dt.datetime = field(default_factory=dt.datetime.utcnow)
+    id: str = field(default_factory=lambda: uuid.uuid4().hex)
+
+    @property
+    def edition_date(self) -> dt.date:
+        return self.created_at.date()
+
+
+class MemoryStore:
+    """
+    Newsroom memory in a single DuckDB file.
+
+    Filters on date, winner id and tags are index lookups; similarity is a brute-force
+    `list_cosine_similarity` scan, narrowed by the same filters, which stays well under a
+    millisecond per thousand editions.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = self._open()
+
+    def _open(self) -> duckdb.DuckDBPyConnection:
+        conn = duckdb.connect(str(self.path))
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        return conn
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT count(*) FROM entries").fetchone()[0]
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def add(self, entry: MemoryEntry, *, count_write: bool = True) -> str:
+        """Insert `entry`; `count_write=False` leaves the compaction counter alone."""
+        embedding = list(entry.embedding) if entry.embedding is not None else None
+        tags = [("region", _tag(region)) for region in dict.fromkeys(entry.regions) if region]
+        tags += [("theme", _tag(theme)) for theme in dict.fromkeys(entry.themes) if theme]
+        self._conn.execute("BEGIN TRANSACTION")
+        try:
+            self._conn.execute(
+                f"INSERT INTO entries ({', '.join(_COLUMNS)}, embedding)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    entry.id,
+                    entry.created_at,
+                    entry.edition_date,
+                    entry.edition,
+                    entry.winner_id,
+                    entry.lede,
+                    entry.published_entry,
+                    json.dumps(entry.metadata, default=str),
+                    json.dumps(entry.planner_feedback, default=str),
+                    entry.run_id,
+                    embedding,
+                ],
+            )
+            if tags:
+                self._conn.executemany(
+                    "INSERT INTO entry_tags VALUES (?, ?, ?)",
+                    [(entry.id, kind, value) for kind, value in tags],
+                )
+            if count_write:
+                self._conn.execute(
+                    "INSERT INTO meta VALUES ('writes_since_compaction', '1') ON CONFLICT (key)"
+                    " DO UPDATE SET value = CAST(CAST(meta.value AS INTEGER) + 1 AS VARCHAR)"
+                )
+            self._conn.execute("COMMIT")
+        except Exception:
+            self._conn.execute("ROLLBACK")
+            raise
+        return entry.id
+
+    def writes_since_compaction(self) -> int:
+        row = self._conn.execute(
+            "SELECT value FROM meta WHERE key = 'writes_since_compaction'"
+        ).fetchone()
+        return int(row[0]) if row else 0
+
+    def _where(
+        self,
+        *,
+        since: Optional[dt.date],
+        until: Optional[dt.date],
+        region: Optional[str],
+        theme: Optional[str],
+        winner_id: Optional[str],
+        edition: Optional[str],
+    ) -> tuple[str, List[Any]]:
+        clauses: List[str] = []
+        params: List[Any] = []
+        if since is not None:
+            clauses.append("e.edition_date >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("e.edition_date <= ?")
+            params.append(until)
+        if winner_id is not None:
+            clauses.append("e.winner_id = ?")
+            params.append(winner_id)
+        if edition is not None:
+            clauses.append("e.edition = ?")
+            params.append(edition)
+        for kind, value in (("region", region), ("theme", theme)):
+            if value is not None:
+                clauses.append(
+                    "e.id IN (SELECT entry_id FROM entry_tags WHERE kind = ? AND value = ?)"
+                )
+                params.extend([kind, _tag(value)])
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def _rows(self, query: str, params: List[Any]) -> List[Dict[str, Any]]:
+        cursor = self._conn.execute(query, params)
+        names = [column[0] for column in cursor.description]
+        rows = [dict(zip(names, row)) for row in cursor.fetchall()]
+        if not rows:
+            return rows
+        placeholders = ",".join("?" * len(rows))
+        tags: Dict[str, Dict[str, List[str]]] = {}
+        for entry_id, kind, value in self._conn.execute(
+            f"SELECT entry_id, kind, value FROM entry_tags WHERE entry_id IN ({placeholders})",
+            [row["id"] for row in rows],
+        ).fetchall():
+            tags.setdefault(entry_id, {}).setdefault(kind, []).append(value)
+        for row in rows:
+            row["metadata"] = json.loads(row["metadata"]) if row.get("metadata") else {}
+            if row.get("planner_feedback") is not None:
+                row["planner_feedback"] = json.loads(row["planner_feedback"])
+            row["regions"] = tags.get(row["id"], {}).get("region", [])
+            row["themes"] = tags.get(row["id"], {}).get("theme", [])
+        return rows
+
+    def search(
+        self,
+        *,
+        since: Optional[dt.date] = None,
+        until: Optional[dt.date] = None,
+        region: Optional[str] = None,
+        theme: Optional[str] = None,
+        winner_id: Optional[str] = None,
+        edition: Optional[str] = None,
+        limit: int = 20,
+    ) -> List[Dict[str, Any]]:
+        """Newest entries matching every given filter (e.g. `theme="climate", since=...`)."""
+        where, params = self._where(
+            since=since,
+            until=until,
+            region=region,
+            theme=theme,
+            winner_id=winner_id,
+            edition=edition,
+        )
+        columns = ", ".join(f"e.{column}" for column in _COLUMNS)
+        return self._rows(
+            f"SELECT {columns} FROM entries e{where} ORDER BY e.created_at DESC LIMIT ?",
+            [*params, limit],
+        )
+
+    def similar(
+        self,
+        embedding: Sequence[float],
+        *,
+        k: int = 5,
+        min_score: Optional[float] = None,
+        since: Optional[dt.date] = None,
+        until: Optional[dt.date] = None,
+        region: Optional[str] = None,
+        theme: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """Top-`k` entries by cosine similarity to `embedding`, each with a `score`."""
+        where, params = self._where(
+            since=since,
+            until=until,
+            region=region,
+            theme=theme,
+            winner_id=None,
+            edition=None,
+        )
+        where = f"{where} AND" if where else " WHERE"
+        where += " e.embedding IS NOT NULL AND len(e.embedding) = ?"
+        params.append(len(embedding))
+        columns = ", ".join(f"e.{column}" for column in _COLUMNS)
+        query = (
+            f"SELECT * FROM (SELECT {columns},"
+            " list_cosine_similarity(e.embedding, ?::FLOAT[]) AS score"
+            f" FROM entries e{where})"
+        )
+        params.insert(0, list(embedding))
+        if min_score is not None:
+            query += " WHERE score >= ?"
+            params.append(min_score)
+        return self._rows(f"{query} ORDER BY score DESC LIMIT ?", [*params, k])
+
+    def compact(self, *, full_text_days: Optional[int] = None) -> Dict[str, int]:
+        """
+        Keep only the newest entry per run id (a resumed or replayed thread writes again;
+        entries without a run id, such as imports, are never superseded), drop entry text
+        and feedback older than `full_text_days` (ledes, tags and embeddings stay
+        searchable), then rewrite the file so DuckDB returns the freed blocks.
+        """
+        stats = {"superseded": 0, "trimmed": 0}
+        conn = self._conn
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            superseded = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT id FROM (SELECT id, row_number() OVER ("
+                    " PARTITION BY run_id ORDER BY created_at DESC) AS rank"
+                    " FROM entries WHERE run_id IS NOT NULL) WHERE rank > 1"
+                ).fetchall()
+            ]
+            if superseded:
+                placeholders = ",".join("?" * len(superseded))
+                conn.execute(
+                    f"DELETE FROM entry_tags WHERE entry_id IN ({placeholders})", superseded
+                )
+                conn.execute(f"DELETE FROM entries WHERE id IN ({placeholders})", superseded)
+            stats["superseded"] = len(superseded)
+            if full_text_days is not None:
+                cutoff = dt.date.today() - dt.timedelta(days=full_text_days)
+                stats["trimmed"] = conn.execute(
+                    "UPDATE entries SET published_entry = NULL, planner_feedback = NULL"
+                    " WHERE edition_date < ? AND published_entry IS NOT NULL",
+                    [cutoff],
+                ).fetchone()[0]
+            conn.execute("UPDATE meta SET value = '0' WHERE key = 'writes_since_compaction'")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        self._rewrite()
+        return stats
+
+    def _rewrite(self) -> None:
+        staging = self.path.with_name(f"{self.path.name}.compact")
+        if staging.exists():
+            staging.unlink()
+        name = self._conn.execute("SELECT current_database()").fetchone()[0]
+        self._conn.execute(f"ATTACH '{staging}' AS compacted")
+        self._conn.execute(f'COPY FROM DATABASE "{name}" TO compacted')
+        self._conn.execute("DETACH compacted")
+        self._conn.close()
+        os.replace(staging, self.path)
+        wal = self.path.with_name(f"{self.path.name}.wal")
+        if wal.exists():
+            wal.unlink()
+        self._conn = self._open()
+
+    def import_jsonl(self, path: Path) -> int:
+        """
+        Load the append-only `newsroom_memory.jsonl` written by older releases. Lines carry
+        no timestamp, so they are dated by the file's modification time, in file order.
+        """
+        if not path.exists():
+            return 0
+        written = dt.datetime.utcfromtimestamp(path.stat().st_mtime)
+        count = 0
+        with path.open(encoding="utf-8") as handle:
+            lines = [line for line in handle if line.strip()]
+        for offset, line in enumerate(lines):
+            frame = json.loads(line)
+            metadata = frame.get("metadata") or {}
+            entry = frame.get("published_entry")
+            self.add(
+                MemoryEntry(
+                    published_entry=entry,
+                    metadata=metadata,
+                    planner_feedback=frame.get("planner_feedback"),
+                    edition=metadata.get("edition"),
+                    winner_id=(metadata.get("selection") or {}).get("winner_id"),
+                    lede=entry_lede(entry),
+                    created_at=written - dt.timedelta(microseconds=len(lines) - offset),
+                ),
+                count_write=False,
+            )
+            count += 1
+        return count
+
+
+def entry_lede(entry: Optional[str]) -> Optional[str]:
+    """First `# ` heading of a rendered entry."""
+    for line in (entry or "").splitlines():
+        if line.startswith("# "):
+            return line[2:].strip()
+    return None
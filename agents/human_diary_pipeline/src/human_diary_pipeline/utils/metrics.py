@@ -0,0 +1,157 @@
+"""
+Context-local metrics recording for newsroom nodes.
+
+The graph layer opens a `NodeMetrics` for each node execution; adapters, the retrieval
+scheduler and LLM callbacks report into whichever node is currently running.
+"""
+
+from __future__ import annotations
+
+import json
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import LLMResult
+
+
+@dataclass
+class NodeMetrics:
+    node: str
+    wall_seconds: float = 0.0
+    llm_calls: int = 0
+    llm_cache_hits: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    adapter_calls: int = 0
+    adapter_seconds: float = 0.0
+    adapter_errors: int = 0
+    errors: int = 0
+    documents_in: int = 0
+    documents_out: int = 0
+
+    def as_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+current_node: ContextVar[Optional[NodeMetrics]] = ContextVar("newsroom_node", default=None)
+
+
+def record_adapter_call(seconds: float, *, error: bool = False) -> None:
+    metrics = current_node.get()
+    if metrics is None:
+        return
+    metrics.adapter_calls += 1
+    metrics.adapter_seconds += seconds
+    if error:
+        metrics.adapter_errors += 1
+
+
+@lru_cache(maxsize=16)
+def _encoding(model: str) -> Any:
+    import tiktoken
+
+    try:
+        try:
+            return tiktoken.encoding_for_model(model)
+        except KeyError:
+            return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def count_tokens(text: str, model: str = "gpt-4o-mini") -> int:
+    """Token count via tiktoken; roughly 4 characters per token when no encoding can load."""
+    encoding = _encoding(model)
+    if encoding is None:
+        return (len(text) + 3) // 4
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def _model_name(kwargs: Dict[str, Any]) -> str:
+    params = kwargs.get("invocation_params") or {}
+    return params.get("model") or params.get("model_name") or "gpt-4o-mini"
+
+
+def _is_cached(response: LLMResult) -> bool:
+    return any(
+        (generation.generation_info or {}).get("cached")
+        for generations in response.generations
+        for generation in generations
+    )
+
+
+class TokenCountingHandler(BaseCallbackHandler):
+    """
+    Count LLM calls and prompt/completion tokens (via tiktoken) against the running node.
+    Callbacks start before the response cache is checked, so a call is only counted once
+    it ends (or fails) without a cached generation; hits go to `llm_cache_hits`.
+    """
+
+    run_inline = True
+
+    def __init__(self) -> None:
+        self._pending: Dict[Any, Tuple[str, int]] = {}
+
+    def _count_call(self, metrics: NodeMetrics, run_id: Any) -> str:
+        model, prompt_tokens = self._pending.pop(run_id, ("gpt-4o-mini", 0))
+        metrics.llm_calls += 1
+        metrics.prompt_tokens += prompt_tokens
+        return model
+
+    def on_chat_model_start(
+        self,
+        serialized: Dict[str, Any],
+        messages: List[List[BaseMessage]],
+        *,
+        run_id: Any,
+        **kwargs: Any,
+    ) -> None:
+        if current_node.get() is None:
+            return
+        model = _model_name(kwargs)
+        tokens = 0
+        for batch in messages:
+            for message in batch:
+                content = message.content
+                text = content if isinstance(content, str) else json.dumps(content, default=str)
+                tokens += count_tokens(text, model)
+        self._pending[run_id] = (model, tokens)
+
+    def on_llm_start(
+        self,
+        serialized: Dict[str, Any],
+        prompts: List[str],
+        *,
+        run_id: Any,
+        **kwargs: Any,
+    ) -> None:
+        if current_node.get() is None:
+            return
+        model = _model_name(kwargs)
+        self._pending[run_id] = (model, sum(count_tokens(prompt, model) for prompt in prompts))
+
+    def on_llm_end(self, response: LLMResult, *, run_id: Any, **kwargs: Any) -> None:
+        metrics = current_node.get()
+        if metrics is None or run_id not in self._pending:
+            self._pending.pop(run_id, None)
+            return
+        if _is_cached(response):
+            self._pending.pop(run_id)
+            metrics.llm_cache_hits += 1
+            return
+        model = self._count_call(metrics, run_id)
+        for generations in response.generations:
+            for generation in generations:
+                metrics.completion_tokens += count_tokens(generation.text, model)
+
+    def on_llm_error(self, error: BaseException, *, run_id: Any, **kwargs: Any) -> None:
+        metrics = current_node.get()
+        if metrics is None or run_id not in self._pending:
+            self._pending.pop(run_id, None)
+            return
+        # The provider was called (the cache never raises), so the attempt counts.
+        self._count_call(metrics, run_id)
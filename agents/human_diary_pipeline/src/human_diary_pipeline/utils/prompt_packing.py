@@ -0,0 +1,79 @@
+"""
+Token-budgeted prompt packing and map-reduce helpers for oversized LLM inputs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from typing import Any, Awaitable, Callable, List, Optional, Sequence, TypeVar
+
+from .metrics import count_tokens
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def compact_json(value: Any) -> str:
+    """JSON without indentation or padding; noticeably cheaper in tokens than `indent=2`."""
+    return json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+class PromptPacker:
+    """
+    Count tokens for one model and split inputs into chunks that fit its prompt budget.
+    """
+
+    def __init__(self, model: str, budget: int) -> None:
+        self.model = model
+        self.budget = budget
+
+    def tokens(self, text: str) -> int:
+        return count_tokens(text, self.model)
+
+    def fits(self, text: str, *, overhead: int = 0) -> bool:
+        return self.tokens(text) + overhead <= self.budget
+
+    def pack(
+        self,
+        items: Sequence[T],
+        render: Callable[[T], str] = str,
+        *,
+        overhead: int = 0,
+    ) -> List[List[T]]:
+        """
+        Greedily group items, in order, so each group's rendered lines fit the budget.
+        An item that is too large on its own still gets a group of its own.
+        """
+        room = max(self.budget - overhead, 1)
+        chunks: List[List[T]] = []
+        current: List[T] = []
+        used = 0
+        for item in items:
+            cost = self.tokens(render(item)) + 1
+            if current and used + cost > room:
+                chunks.append(current)
+                current, used = [], 0
+            current.append(item)
+            used += cost
+        if current:
+            chunks.append(current)
+        return chunks
+
+
+async def map_reduce(
+    chunks: Sequence[T],
+    map_fn: Callable[[T], Awaitable[R]],
+    reduce_fn: Callable[[List[R]], Awaitable[Any]],
+    *,
+    max_concurrency: Optional[int] = None,
+) -> Any:
+    """Run `map_fn` over chunks in parallel (optionally bounded), then one `reduce_fn`."""
+    limit = asyncio.Semaphore(max_concurrency or len(chunks) or 1)
+
+    async def bounded(chunk: T) -> R:
+        async with limit:
+            return await map_fn(chunk)
+
+    partials = await asyncio.gather(*[bounded(chunk) for chunk in chunks])
+    return await reduce_fn(list(partials))
@@ -5,56 +5,246 @@ Utilities for provenance normalization and deduplication.
 from __future__ import annotations
 
 import hashlib
+import re
+import sys
+import zlib
 from collections import defaultdict
-from typing import Dict, Iterable, List
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 from urllib.parse import urlparse
 
+import numpy as np
+
 from ..adapters.base import DocumentRecord
+from .document_batch import DocumentBatch, string_codes
 
+_WORD = re.compile(r"\w+")
+_MINHASH_PRIME = (1 << 31) - 1
 
-def canonical_url(url: str | None) -> str | None:
-    if not url:
-        return None
+
+@lru_cache(maxsize=65_536)
+def _canonicalize(url: str) -> Tuple[str, Optional[str]]:
+    # One parse yields both the canonical URL and its domain; the same links recur across
+    # adapters, normalize calls and runs, so results are memoized.
     parsed = urlparse(url)
     netloc = parsed.netloc.lower()
     path = parsed.path.rstrip("/")
-    return f"{parsed.scheme}://{netloc}{path}"
+    return f"{parsed.scheme}://{netloc}{path}", sys.intern(netloc) if netloc else None
+
+
+def canonical_url(url: str | None) -> str | None:
+    if not url:
+        return None
+    return _canonicalize(url)[0]
 
 
 def enrich_provenance(records: Iterable[DocumentRecord]) -> List[DocumentRecord]:
     enriched: List[DocumentRecord] = []
     for record in records:
-        canon = canonical_url(record.url)
-        domain = urlparse(canon).netloc if canon else None
-        record.metadata.setdefault("domain", domain)
-        record.metadata.setdefault("canonical_url", canon or record.url)
+        # Already-enriched records (canonical_url set) are left as they are.
+        if record.canonical_url is None and record.url:
+            canon, domain = _canonicalize(record.url)
+            record.canonical_url = canon
+            if record.domain is None:
+                record.domain = domain
         enriched.append(record)
     return enriched
 
 
+def dedupe_key(record: DocumentRecord) -> str:
+    return record.canonical_url or canonical_url(record.url) or record.id
+
+
+def _dedupe_indices(records: Sequence[DocumentRecord], scores: np.ndarray) -> np.ndarray:
+    # Sort rows by dedupe key code, then best score, then position: the head of each key
+    # run is the winner (earliest row on ties). Codes follow first appearance, so the
+    # winners already come out in the order a dict-based pass would keep them.
+    count = len(records)
+    if not count:
+        return np.zeros(0, dtype=np.intp)
+    codes, _ = string_codes([dedupe_key(record) for record in records], "")
+    order = np.lexsort((np.arange(count), -scores, codes))
+    ordered = codes[order]
+    return order[np.flatnonzero(np.r_[True, ordered[1:] != ordered[:-1]])]
+
+
+def _scores(records: Sequence[DocumentRecord]) -> np.ndarray:
+    return np.fromiter(
+        (record.score or 0.0 for record in records), dtype=np.float64, count=len(records)
+    )
+
+
 def dedupe(records: Iterable[DocumentRecord]) -> List[DocumentRecord]:
-    best_by_key: Dict[str, DocumentRecord] = {}
-    for record in records:
-        key = record.metadata.get("canonical_url") or canonical_url(record.url) or record.id
-        existing = best_by_key.get(key)
-        if not existing or (record.score or 0) > (existing.score or 0):
-            best_by_key[key] = record
-    return list(best_by_key.values())
+    records = list(records)
+    return [records[index] for index in _dedupe_indices(records, _scores(records))]
 
 
 def cluster_by_domain(records: Iterable[DocumentRecord]) -> Dict[str, List[DocumentRecord]]:
     buckets: Dict[str, List[DocumentRecord]] = defaultdict(list)
     for record in records:
-        domain = record.metadata.get("domain") or "unknown"
-        buckets[domain].append(record)
+        buckets[record.domain or "unknown"].append(record)
     return buckets
 
 
 def provenance_hash(record: DocumentRecord) -> str:
-    payload = record.metadata.get("canonical_url") or record.url or record.id
+    payload = record.canonical_url or record.url or record.id
     return hashlib.sha1(payload.encode("utf-8")).hexdigest()
 
 
-def normalize(records: Iterable[DocumentRecord]) -> List[DocumentRecord]:
-    enriched = enrich_provenance(records)
-    return dedupe(enriched)
+def _shingle_hashes(text: str, size: int = 3) -> np.ndarray:
+    tokens = _WORD.findall(text.lower())
+    if len(tokens) > size:
+        grams = {" ".join(tokens[i : i + size]) for i in range(len(tokens) - size + 1)}
+    else:
+        grams = set(tokens)
+    hashes = [zlib.crc32(gram.encode("utf-8")) & _MINHASH_PRIME for gram in grams]
+    return np.fromiter(hashes, dtype=np.uint64, count=len(hashes))
+
+
+def minhash_signatures(
+    texts: Sequence[str],
+    *,
+    num_perm: int = 64,
+    seed: int = 1,
+) -> np.ndarray:
+    """
+    MinHash signatures over word 3-gram shingles, one row per text.
+
+    Texts without tokens get an all-max row so they never collide with anything.
+    """
+    rng = np.random.default_rng(seed)
+    a = rng.integers(1, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+    b = rng.integers(0, _MINHASH_PRIME, size=num_perm, dtype=np.uint64)
+    signatures = np.full((len(texts), num_perm), _MINHASH_PRIME, dtype=np.uint64)
+    for row, text in enumerate(texts):
+        hashes = _shingle_hashes(text)
+        if hashes.size:
+            signatures[row] = ((hashes[:, None] * a + b) % _MINHASH_PRIME).min(axis=0)
+    return signatures
+
+
+def near_duplicate_groups(
+    records: Sequence[DocumentRecord],
+    *,
+    threshold: float = 0.8,
+    num_perm: int = 64,
+    bands: int = 16,
+) -> List[List[int]]:
+    """
+    Group indices of records whose title + summary are near-identical.
+
+    LSH banding proposes candidates (each record is only compared to its bucket's first
+    member), and candidates are kept when the estimated Jaccard similarity reaches
+    `threshold`, so the cost stays close to linear in the number of records.
+    """
+    texts = [f"{record.title} {record.summary}" for record in records]
+    signatures = minhash_signatures(texts, num_perm=num_perm)
+    rows = num_perm // bands
+    parent = list(range(len(records)))
+
+    def find(index: int) -> int:
+        while parent[index] != index:
+            parent[index] = parent[parent[index]]
+            index = parent[index]
+        return index
+
+    empty = (signatures == _MINHASH_PRIME).all(axis=1)
+    for band in range(bands):
+        buckets: Dict[bytes, int] = {}
+        block = signatures[:, band * rows : (band + 1) * rows]
+        for index in range(len(records)):
+            if empty[index]:
+                continue
+            key = block[index].tobytes()
+            anchor = buckets.setdefault(key, index)
+            if anchor == index or find(anchor) == find(index):
+                continue
+            if np.mean(signatures[anchor] == signatures[index]) >= threshold:
+                parent[find(index)] = find(anchor)
+
+    groups: Dict[int, List[int]] = defaultdict(list)
+    for index in range(len(records)):
+        groups[find(index)].append(index)
+    return list(groups.values())
+
+
+def _alternate(record: DocumentRecord) -> Dict[str, Any]:
+    return {
+        "id": record.id,
+        "url": record.url,
+        "source": record.source,
+        "domain": record.domain,
+    }
+
+
+def _merge_groups(
+    records: Sequence[DocumentRecord], groups: List[List[int]]
+) -> List[int]:
+    # Canonical = best score, then longest summary; the rest become alternate sources.
+    keep: List[int] = []
+    for group in groups:
+        canonical_index = max(
+            group, key=lambda index: (records[index].score or 0, len(records[index].summary))
+        )
+        canonical = records[canonical_index]
+        if len(group) > 1:
+            alternates = list(canonical.metadata.get("alternate_sources") or [])
+            for index in group:
+                if index != canonical_index:
+                    member = records[index]
+                    alternates.append(_alternate(member))
+                    alternates.extend(member.metadata.get("alternate_sources") or [])
+            canonical.metadata["alternate_sources"] = alternates
+        keep.append(canonical_index)
+    return keep
+
+
+def merge_near_duplicates(
+    records: Iterable[DocumentRecord],
+    *,
+    threshold: float = 0.8,
+) -> List[DocumentRecord]:
+    """
+    Collapse syndicated copies into one canonical record (best score, then longest
+    summary) and keep the other copies under `metadata["alternate_sources"]`.
+    """
+    records = list(records)
+    groups = near_duplicate_groups(records, threshold=threshold)
+    return [records[index] for index in _merge_groups(records, groups)]
+
+
+def _normalize_records(
+    records: Iterable[DocumentRecord],
+    near_duplicates: bool,
+    near_duplicate_threshold: float,
+) -> List[DocumentRecord]:
+    records = dedupe(enrich_provenance(records))
+    if near_duplicates:
+        groups = near_duplicate_groups(records, threshold=near_duplicate_threshold)
+        records = [records[index] for index in _merge_groups(records, groups)]
+    return records
+
+
+def normalize_batch(
+    records: Iterable[DocumentRecord],
+    *,
+    near_duplicates: bool = False,
+    near_duplicate_threshold: float = 0.8,
+) -> DocumentBatch:
+    """
+    `normalize`, with the survivors wrapped in a `DocumentBatch` for the cleaner's
+    column-wise scoring. Enrichment and canonicalization still run per record (memoized
+    per URL); only the exact-dedupe selection is vectorized.
+    """
+    return DocumentBatch.from_records(
+        _normalize_records(records, near_duplicates, near_duplicate_threshold)
+    )
+
+
+def normalize(
+    records: Iterable[DocumentRecord],
+    *,
+    near_duplicates: bool = False,
+    near_duplicate_threshold: float = 0.8,
+) -> List[DocumentRecord]:
+    return _normalize_records(records, near_duplicates, near_duplicate_threshold)
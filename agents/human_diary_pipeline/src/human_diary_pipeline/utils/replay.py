@@ -0,0 +1,143 @@
+"""
+Record/replay fixtures so the newsroom can run offline against captured provider traffic.
+
+HTTP traffic is captured at the transport layer of the shared adapter client, LLM
+completions through the response cache, and embeddings through the embedding store.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
+
+import httpx
+from langchain_core.embeddings import Embeddings
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import BaseMessage
+from langchain_core.outputs import ChatResult
+
+# Query parameters that carry credentials and must not leak into fixture keys or files.
+_SECRET_PARAMS = {"api_key", "apikey", "key"}
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when no fixture matches a request."""
+
+
+def request_key(request: httpx.Request) -> str:
+    params = sorted(
+        (name, value)
+        for name, value in request.url.params.multi_items()
+        if name.lower() not in _SECRET_PARAMS
+    )
+    material = "\n".join(
+        [
+            request.method,
+            f"{request.url.scheme}://{request.url.host}{request.url.path}",
+            urlencode(params),
+            hashlib.sha256(request.content).hexdigest(),
+        ]
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class FixtureStore:
+    def __init__(self, directory: Path) -> None:
+        self.directory = directory
+
+    def _path(self, kind: str, key: str) -> Path:
+        return self.directory / kind / f"{key}.json"
+
+    def read(self, kind: str, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(kind, key)
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def write(self, kind: str, key: str, payload: Dict[str, Any]) -> None:
+        path = self._path(kind, key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(payload, indent=2), encoding="utf-8")
+
+
+def _fixture_response(request: httpx.Request, fixture: Dict[str, Any]) -> httpx.Response:
+    return httpx.Response(
+        fixture["status"],
+        headers={"content-type": fixture.get("content_type") or "application/json"},
+        content=fixture["body"].encode("utf-8"),
+        request=request,
+    )
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Pass requests through and save every response body as a fixture."""
+
+    def __init__(self, transport: httpx.AsyncBaseTransport, store: FixtureStore) -> None:
+        self._transport = transport
+        self._store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        response = await self._transport.handle_async_request(request)
+        body = await response.aread()
+        await response.aclose()
+        fixture = {
+            "url": f"{request.url.scheme}://{request.url.host}{request.url.path}",
+            "status": response.status_code,
+            "content_type": response.headers.get("content-type"),
+            "body": body.decode("utf-8", errors="replace"),
+        }
+        self._store.write("http", request_key(request), fixture)
+        return _fixture_response(request, fixture)
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+
+class ReplayTransport(httpx.AsyncBaseTransport):
+    """Serve recorded responses; never touches the network."""
+
+    def __init__(self, store: FixtureStore) -> None:
+        self._store = store
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        fixture = self._store.read("http", request_key(request))
+        if fixture is None:
+            url = request.url.copy_with(query=None)
+            raise ReplayMissError(f"No HTTP fixture for {request.method} {url}")
+        return _fixture_response(request, fixture)
+
+
+class ReplayChatModel(BaseChatModel):
+    """
+    Chat model stand-in for replay mode: every answer must come from the attached
+    response cache, so a cache miss is a missing fixture.
+    """
+
+    model: str
+    temperature: float = 0.0
+
+    @property
+    def _llm_type(self) -> str:
+        return "replay"
+
+    def _generate(
+        self,
+        messages: List[BaseMessage],
+        stop: Optional[List[str]] = None,
+        run_manager: Any = None,
+        **kwargs: Any,
+    ) -> ChatResult:
+        raise ReplayMissError(f"No recorded completion for {self.model} (T={self.temperature})")
+
+
+class ReplayEmbeddings(Embeddings):
+    """Embeddings stand-in for replay mode; vectors must come from the embedding store."""
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        raise ReplayMissError(f"No recorded embeddings for {len(texts)} text(s)")
+
+    def embed_query(self, text: str) -> List[float]:
+        raise ReplayMissError("No recorded embedding for query")
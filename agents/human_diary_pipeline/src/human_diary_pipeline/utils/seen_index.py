@@ -0,0 +1,211 @@
+"""
+Persistent seen-document index and per-query `published_at` watermarks for incremental runs.
+"""
+
+from __future__ import annotations
+
+import datetime as dt
+import sqlite3
+import time
+from collections import Counter
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from ..adapters.base import DocumentRecord
+from ..adapters.cache import normalize_query
+from .provenance import provenance_hash
+
+
+def _utc(value: dt.datetime) -> dt.datetime:
+    # Naive timestamps are taken as UTC; stored watermarks are UTC so they compare as text.
+    if value.tzinfo is None:
+        return value.replace(tzinfo=dt.timezone.utc)
+    return value.astimezone(dt.timezone.utc)
+
+
+class SeenIndex:
+    """
+    SQLite store of documents already covered (keyed by `provenance_hash`) and the newest
+    `published_at` seen per normalized query. The connection is opened on first use, so
+    the index can be built on a warm-up thread and used from the event loop.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+    @cached_property
+    def _conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(str(self.path))
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS seen ("
+            " hash TEXT PRIMARY KEY,"
+            " url TEXT,"
+            " first_seen REAL NOT NULL,"
+            " edition TEXT)"
+        )
+        conn.execute("CREATE INDEX IF NOT EXISTS seen_age ON seen (first_seen)")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS watermarks ("
+            " query TEXT PRIMARY KEY,"
+            " published_at TEXT NOT NULL,"
+            " updated_at REAL NOT NULL)"
+        )
+        conn.commit()
+        return conn
+
+    def seen(self, hashes: Iterable[str]) -> Set[str]:
+        hashes = list(hashes)
+        found: Set[str] = set()
+        # Stay under SQLite's default host-parameter limit.
+        for start in range(0, len(hashes), 500):
+            chunk = hashes[start : start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            rows = self._conn.execute(
+                f"SELECT hash FROM seen WHERE hash IN ({placeholders})", chunk
+            ).fetchall()
+            found.update(row[0] for row in rows)
+        return found
+
+    def watermark(self, query: str) -> Optional[dt.datetime]:
+        row = self._conn.execute(
+            "SELECT published_at FROM watermarks WHERE query = ?",
+            (normalize_query(query),),
+        ).fetchone()
+        return dt.datetime.fromisoformat(row[0]) if row else None
+
+    def commit(self, updates: Dict[str, Any], edition: Optional[str] = None) -> None:
+        """Persist the `seen_updates` produced by an `IncrementalFilter`."""
+        now = time.time()
+        self._conn.executemany(
+            "INSERT OR IGNORE INTO seen (hash, url, first_seen, edition) VALUES (?, ?, ?, ?)",
+            [(entry["hash"], entry.get("url"), now, edition) for entry in updates.get("seen", [])],
+        )
+        self._conn.executemany(
+            "INSERT INTO watermarks (query, published_at, updated_at) VALUES (?, ?, ?)"
+            " ON CONFLICT(query) DO UPDATE SET"
+            " published_at = MAX(published_at, excluded.published_at),"
+            " updated_at = excluded.updated_at",
+            [(query, stamp, now) for query, stamp in updates.get("watermarks", {}).items()],
+        )
+        self._conn.commit()
+
+    def prune(self, max_age_seconds: float) -> int:
+        cursor = self._conn.execute(
+            "DELETE FROM seen WHERE first_seen < ?", (time.time() - max_age_seconds,)
+        )
+        self._conn.commit()
+        return cursor.rowcount
+
+    def close(self) -> None:
+        if "_conn" in self.__dict__:
+            self._conn.close()
+
+    def filter(self, overlap_seconds: float = 3600.0) -> "IncrementalFilter":
+        return IncrementalFilter(self, overlap_seconds=overlap_seconds)
+
+
+class IncrementalFilter:
+    """
+    Per-run filter applied right after retrieval: drops records already in the index or
+    published before the query's watermark (minus `overlap_seconds` for late indexing),
+    and collects what the run should commit once it finishes.
+    """
+
+    def __init__(self, index: SeenIndex, *, overlap_seconds: float = 3600.0) -> None:
+        self.index = index
+        self.overlap = dt.timedelta(seconds=overlap_seconds)
+        self.stats: Counter[str] = Counter()
+        self._seen: Dict[str, Optional[str]] = {}
+        self._watermarks: Dict[str, dt.datetime] = {}
+        self._cutoffs: Dict[str, Optional[dt.datetime]] = {}
+
+    def _cutoff(self, query: str) -> Optional[dt.datetime]:
+        if query not in self._cutoffs:
+            mark = self.index.watermark(query)
+            self._cutoffs[query] = _utc(mark) - self.overlap if mark else None
+        return self._cutoffs[query]
+
+    def __call__(self, query: str, records: List[DocumentRecord]) -> List[DocumentRecord]:
+        cutoff = self._cutoff(query)
+        hashes = [provenance_hash(record) for record in records]
+        already = self.index.seen(hashes)
+        kept: List[DocumentRecord] = []
+        key = normalize_query(query)
+        for record, digest in zip(records, hashes):
+            published = _utc(record.published_at) if record.published_at else None
+            if digest in already:
+                self.stats["dropped_seen"] += 1
+                continue
+            if cutoff is not None and published is not None and published < cutoff:
+                self.stats["dropped_watermark"] += 1
+                continue
+            self.stats["kept"] += 1
+            self._seen[digest] = record.url
+            # Cleaning sets canonical_url, which changes provenance_hash; keep the key used here.
+            record.metadata["seen_hash"] = digest
+            record.metadata["seen_query"] = key
+            if published is not None:
+                current = self._watermarks.get(key)
+                if current is None or published > current:
+                    self._watermarks[key] = published
+            kept.append(record)
+        return kept
+
+    @staticmethod
+    def merge_updates(updates: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Combine `updates()` from several filters, e.g. one per shard."""
+        seen: Dict[str, Optional[str]] = {}
+        watermarks: Dict[str, str] = {}
+        stats: Counter[str] = Counter()
+        for update in updates:
+            for entry in update.get("seen", []):
+                seen.setdefault(entry["hash"], entry.get("url"))
+            for query, stamp in update.get("watermarks", {}).items():
+                watermarks[query] = max(stamp, watermarks.get(query, stamp))
+            stats.update(update.get("stats", {}))
+        return {
+            "seen": [{"hash": digest, "url": url} for digest, url in seen.items()],
+            "watermarks": watermarks,
+            "stats": dict(stats),
+        }
+
+    @staticmethod
+    def restrict_updates(
+        updates: Dict[str, Any], records: Iterable[DocumentRecord]
+    ) -> Dict[str, Any]:
+        """
+        Limit `updates` to the records that survived cleaning, so stories dropped by dedupe,
+        near-duplicate merging or the ranking caps are not marked covered. Watermarks are
+        recomputed from those records only.
+        """
+        kept: Dict[str, Optional[str]] = {}
+        watermarks: Dict[str, dt.datetime] = {}
+        for record in records:
+            digest = record.metadata.get("seen_hash")
+            if digest is None:
+                continue
+            kept[digest] = record.url
+            query = record.metadata.get("seen_query")
+            if query is not None and record.published_at is not None:
+                published = _utc(record.published_at)
+                if query not in watermarks or published > watermarks[query]:
+                    watermarks[query] = published
+        seen = [entry for entry in updates.get("seen", []) if entry["hash"] in kept]
+        stats = dict(updates.get("stats", {}))
+        stats["committed"] = len(seen)
+        return {
+            "seen": seen,
+            "watermarks": {query: mark.isoformat() for query, mark in watermarks.items()},
+            "stats": stats,
+        }
+
+    def updates(self) -> Dict[str, Any]:
+        """State-friendly summary, committed by `SeenIndex.commit` after publishing."""
+        return {
+            "seen": [{"hash": digest, "url": url} for digest, url in self._seen.items()],
+            "watermarks": {query: mark.isoformat() for query, mark in self._watermarks.items()},
+            "stats": dict(self.stats),
+        }
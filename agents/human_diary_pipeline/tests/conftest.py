@@ -0,0 +1,25 @@
+import pytest
+
+from human_diary_pipeline.config import ApiConfig, PlannerConfig, RuntimeConfig
+
+
+@pytest.fixture
+def config(tmp_path) -> RuntimeConfig:
+    """Default runtime config with every on-disk store under `tmp_path`."""
+    base = RuntimeConfig(api=ApiConfig(), planner=PlannerConfig())
+    return base.model_copy(
+        update={
+            "cache": base.cache.model_copy(update={"directory": tmp_path / "cache"}),
+            "archive": base.archive.model_copy(update={"path": tmp_path / "archive.sqlite"}),
+            "checkpoint": base.checkpoint.model_copy(update={"path": tmp_path / "ckpt.sqlite"}),
+            "incremental": base.incremental.model_copy(update={"path": tmp_path / "seen.sqlite"}),
+            "memory": base.memory.model_copy(
+                update={
+                    "path": tmp_path / "memory.duckdb",
+                    "legacy_path": tmp_path / "memory.jsonl",
+                    "embeddings": False,
+                }
+            ),
+            "replay": base.replay.model_copy(update={"fixtures_dir": tmp_path / "fixtures"}),
+        }
+    )
@@ -0,0 +1,53 @@
+import asyncio
+import time
+
+from human_diary_pipeline.adapters.archive import DocumentArchive, LocalArchiveAdapter
+from human_diary_pipeline.adapters.base import DocumentRecord
+
+
+def test_run_metadata_is_not_archived(tmp_path):
+    record = DocumentRecord(
+        id="n-1",
+        title="Flood warning",
+        summary="Rivers rise",
+        url="https://a.example/1",
+        metadata={"ranking": {"total": 1.0}, "seen_hash": "abc", "seen_query": "q", "lang": "en"},
+    )
+    archive = DocumentArchive(tmp_path / "archive.sqlite")
+    try:
+        archive.add([record])
+        [(found, _)] = archive.search("flood")
+    finally:
+        archive.close()
+
+    assert set(found.metadata) == {"lang", "archive_id", "archived_at"}
+    assert record.metadata["ranking"] == {"total": 1.0}
+
+
+def test_rearchiving_refreshes_archived_at(tmp_path, monkeypatch):
+    record = DocumentRecord(id="n-1", title="Flood", summary="", url="https://a.example/1")
+    archive = DocumentArchive(tmp_path / "archive.sqlite")
+    try:
+        archive.add([record])
+        later = time.time() + 7200.0
+        monkeypatch.setattr(time, "time", lambda: later)
+        archive.add([record])
+        assert archive.prune(3600.0) == 0
+        assert len(archive) == 1
+    finally:
+        archive.close()
+
+
+def test_archive_hits_keep_the_provider_score(tmp_path):
+    record = DocumentRecord(
+        id="n-1", title="Flood warning", summary="", url="https://a.example/1", score=0.4
+    )
+    archive = DocumentArchive(tmp_path / "archive.sqlite")
+    try:
+        archive.add([record])
+        [hit] = asyncio.run(LocalArchiveAdapter(archive).search("flood"))
+    finally:
+        archive.close()
+
+    assert hit.score == 0.4
+    assert hit.metadata["bm25"] > 0
@@ -0,0 +1,42 @@
+import pytest
+
+from human_diary_pipeline.pipelines.batch import is_edition_name, load_editions
+
+
+def test_load_editions_reads_jsonl_and_text(tmp_path):
+    path = tmp_path / "editions.txt"
+    path.write_text(
+        '{"edition": "apac", "plan": "Monsoon coverage"}\n'
+        "# comment\n"
+        "emea: Energy prices\n"
+        "Global tech roundup\n"
+    )
+    editions = load_editions(path)
+    assert [(edition.name, edition.directive) for edition in editions] == [
+        ("apac", "Monsoon coverage"),
+        ("emea", "Energy prices"),
+        ("edition-4", "Global tech roundup"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "line",
+    [
+        '{"edition": "../../escape", "plan": "x"}',
+        '{"edition": "news/today", "plan": "x"}',
+        "news/today: Floods",
+        '{"edition": "apac"}',
+        '{"edition": "apac", "plan": ',
+    ],
+)
+def test_load_editions_rejects_bad_lines_with_location(tmp_path, line):
+    path = tmp_path / "editions.jsonl"
+    path.write_text("ok: fine\n" + line + "\n")
+    with pytest.raises(ValueError, match=f"{path.name}:2"):
+        load_editions(path)
+
+
+def test_edition_names_are_single_path_components():
+    assert is_edition_name("apac-breaking")
+    for name in ("", ".", "..", ".hidden", "a/b", "../x", None, 3):
+        assert not is_edition_name(name)
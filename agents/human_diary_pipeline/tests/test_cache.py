@@ -0,0 +1,23 @@
+import time
+
+from human_diary_pipeline.adapters.base import DocumentRecord
+from human_diary_pipeline.adapters.cache import RetrievalCache
+
+
+def _record() -> DocumentRecord:
+    return DocumentRecord(
+        id="n-1", title="Flood", summary="Rivers rise", url="https://a.example/1", source="serpapi"
+    )
+
+
+def test_empty_results_expire_after_empty_ttl(tmp_path, monkeypatch):
+    cache = RetrievalCache(tmp_path / "cache.sqlite", default_ttl=3600.0, empty_ttl=60.0)
+    cache.put("newsapi", "floods", [])
+    cache.put("serpapi", "floods", [_record()])
+    assert cache.get("newsapi", "floods") == []
+
+    later = time.time() + 120.0
+    monkeypatch.setattr(time, "time", lambda: later)
+    assert cache.get("newsapi", "floods") is None
+    assert [record.id for record in cache.get("serpapi", "floods")] == ["n-1"]
+    cache.close()
@@ -0,0 +1,33 @@
+import pytest
+
+from human_diary_pipeline.config import load_runtime_config
+
+
+@pytest.fixture(autouse=True)
+def _fresh_config():
+    load_runtime_config.cache_clear()
+    yield
+    load_runtime_config.cache_clear()
+
+
+def test_sections_read_their_environment_variables(monkeypatch):
+    monkeypatch.setenv("HUMAN_DIARY_SHARD_BY", "count")
+    monkeypatch.setenv("HUMAN_DIARY_SHARDS", "6")
+    monkeypatch.setenv("HUMAN_DIARY_REGIONS", "americas, apac")
+    monkeypatch.setenv("HUMAN_DIARY_RETRIEVAL_CACHE_TTLS", '{"newsapi": 60}')
+    monkeypatch.setenv("HUMAN_DIARY_CLEANER_MAX_DOCUMENTS", "")
+    monkeypatch.setenv("NEWSAPI_API_KEY", "key")
+
+    config = load_runtime_config()
+
+    assert config.sharding.shard_by == "count"
+    assert config.sharding.shards == 6
+    assert config.planner.regions == ["americas", "apac"]
+    assert config.cache.retrieval_ttls == {"newsapi": 60.0}
+    assert config.cleaner.max_documents is None
+    assert config.api.newsapi_key is None
+
+
+def test_unset_variables_keep_defaults(monkeypatch):
+    monkeypatch.delenv("HUMAN_DIARY_SHARD_BY", raising=False)
+    assert load_runtime_config().sharding.shard_by == "region"
@@ -0,0 +1,48 @@
+import multiprocessing
+
+import numpy as np
+
+from human_diary_pipeline.utils.embedding_store import EmbeddingStore
+
+
+def _vector(key: str) -> list:
+    return [float(int(key[:6], 16)), 1.0, 2.0]
+
+
+def _keys(prefix: str, index: int) -> list:
+    return [EmbeddingStore.key(f"{prefix}-{index}-{part}") for part in range(3)]
+
+
+def _write(directory, prefix: str) -> None:
+    store = EmbeddingStore(directory, "model")
+    for index in range(40):
+        keys = _keys(prefix, index)
+        store.put_many(keys, [_vector(key) for key in keys])
+
+
+def test_two_stores_on_one_directory_keep_each_others_keys(tmp_path):
+    first, second = EmbeddingStore(tmp_path, "model"), EmbeddingStore(tmp_path, "model")
+    first.put_many(["a" * 40], [[1.0, 2.0]])
+    second.put_many(["b" * 40], [[3.0, 4.0]])
+    first.put_many(["c" * 40], [[5.0, 6.0]])
+
+    reopened = EmbeddingStore(tmp_path, "model")
+    assert len(reopened) == 3
+    assert reopened.get("a" * 40).tolist() == [1.0, 2.0]
+    assert reopened.get("b" * 40).tolist() == [3.0, 4.0]
+    assert reopened.get("c" * 40).tolist() == [5.0, 6.0]
+
+
+def test_concurrent_processes_never_point_keys_at_foreign_rows(tmp_path):
+    context = multiprocessing.get_context("spawn")
+    workers = [context.Process(target=_write, args=(tmp_path, name)) for name in "wxyz"]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+        assert worker.exitcode == 0
+
+    store = EmbeddingStore(tmp_path, "model")
+    assert len(store) == 4 * 40 * 3
+    for key in (key for name in "wxyz" for index in range(40) for key in _keys(name, index)):
+        np.testing.assert_array_equal(store.get(key), np.asarray(_vector(key), np.float32))
@@ -0,0 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from human_diary_pipeline.agents.llm_cache import ResponseCache
+
+
+def test_model_parameters_are_part_of_the_key():
+    short = ResponseCache.key("gpt", 0.0, "prompt", "max_tokens=16")
+    long = ResponseCache.key("gpt", 0.0, "prompt", "max_tokens=512")
+    assert short != long
+
+
+def test_concurrent_writers_of_one_key_leave_a_whole_entry(tmp_path):
+    cache = ResponseCache(tmp_path / "llm")
+    key = ResponseCache.key("gpt", 0.0, "prompt")
+    payloads = [str(index) * 50_000 for index in range(8)]
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(lambda payload: cache.put(key, payload), payloads * 4))
+
+    assert cache.get(key) in payloads
+    assert not list((tmp_path / "llm").glob("*/*.tmp"))
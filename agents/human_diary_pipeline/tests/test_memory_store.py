@@ -0,0 +1,45 @@
+import asyncio
+import json
+
+from human_diary_pipeline.agents.publish import MemoryAgent
+from human_diary_pipeline.utils.memory_store import MemoryEntry, MemoryStore
+
+
+def _publication(lede: str, edition=None) -> dict:
+    return {
+        "published_entry": f"# {lede}\n\nBody",
+        "publication_meta": {"edition": edition, "selection": {"winner_id": "draft-1"}},
+    }
+
+
+def test_legacy_import_survives_the_first_compaction(tmp_path):
+    legacy = tmp_path / "newsroom_memory.jsonl"
+    legacy.write_text(
+        "\n".join(
+            json.dumps({"published_entry": f"# Entry {index}", "metadata": {}})
+            for index in range(60)
+        )
+        + "\n"
+    )
+    store = MemoryStore(tmp_path / "memory.duckdb")
+    agent = MemoryAgent(store, legacy_path=legacy, compact_every=50)
+    assert len(store) == 60
+    assert store.writes_since_compaction() == 0
+
+    asyncio.run(agent.run(_publication("Today"), None, run_id="2026-10-17-a"))
+    assert len(agent.store) == 61
+
+
+def test_compaction_supersedes_only_entries_of_the_same_run(tmp_path):
+    store = MemoryStore(tmp_path / "memory.duckdb")
+    store.add(MemoryEntry(published_entry="# Morning", run_id="run-a"))
+    store.add(MemoryEntry(published_entry="# Evening", run_id="run-b"))
+    store.add(MemoryEntry(published_entry="# Morning, resumed", run_id="run-a"))
+    store.add(MemoryEntry(published_entry="# Ad hoc"))
+    store.add(MemoryEntry(published_entry="# Ad hoc again"))
+
+    stats = store.compact()
+
+    assert stats["superseded"] == 1
+    kept = sorted(row["published_entry"] for row in store.search())
+    assert kept == ["# Ad hoc", "# Ad hoc again", "# Evening", "# Morning, resumed"]
@@ -0,0 +1,43 @@
+import asyncio
+
+from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+from human_diary_pipeline.agents.llm_cache import ResponseCache
+from human_diary_pipeline.graph.instrumentation import NewsroomMetrics
+from human_diary_pipeline.utils.metrics import NodeMetrics, TokenCountingHandler, current_node
+
+
+def test_finish_run_folds_into_totals_and_drops_the_run():
+    metrics = NewsroomMetrics()
+
+    async def node(state):
+        return {}
+
+    instrumented = metrics.instrument("planner", node)
+    for run_id in ("run-a", "run-b"):
+        asyncio.run(instrumented({}, {"configurable": {"thread_id": run_id}}))
+        metrics.finish_run(run_id)
+
+    assert metrics.runs == {}
+    assert metrics.finished_runs == 2
+    text = metrics.prometheus_text()
+    assert "run_id=" not in text
+    assert "newsroom_runs_finished_total 2" in text
+    assert 'newsroom_node_errors_total{node="planner"} 0' in text
+
+
+def test_response_cache_hits_are_not_counted_as_llm_calls(tmp_path):
+    cache = ResponseCache(tmp_path / "llm").for_model("fake", 0.0)
+    model = FakeListChatModel(responses=["first", "second"], cache=cache)
+    handler = TokenCountingHandler()
+    node = NodeMetrics(node="draft")
+    token = current_node.set(node)
+    try:
+        for _ in range(3):
+            asyncio.run(model.ainvoke("Summarize the floods", config={"callbacks": [handler]}))
+    finally:
+        current_node.reset(token)
+
+    assert node.llm_calls == 1
+    assert node.llm_cache_hits == 2
+    assert node.prompt_tokens > 0
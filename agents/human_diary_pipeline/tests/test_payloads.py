@@ -0,0 +1,15 @@
+from human_diary_pipeline.adapters.payloads import PayloadStore
+
+
+def test_in_memory_store_evicts_least_recently_used():
+    store = PayloadStore(max_entries=2)
+    first = store.put({"id": 1})
+    second = store.put({"id": 2})
+    assert store.get(first) == {"id": 1}
+
+    third = store.put({"id": 3})
+
+    assert len(store) == 2
+    assert second not in store
+    assert store.get(first) == {"id": 1}
+    assert store.get(third) == {"id": 3}
@@ -0,0 +1,42 @@
+from typing import List
+
+from langchain_core.embeddings import FakeEmbeddings
+from langchain_core.language_models import FakeListLLM
+
+from human_diary_pipeline.agents.planner import PlannerReviewerLoop
+
+
+class _CountingEmbeddings(FakeEmbeddings):
+    documents: int = 0
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.documents += 1
+        return super().embed_documents(texts)
+
+
+class _Factory:
+    def __init__(self) -> None:
+        self._embeddings = _CountingEmbeddings(size=8)
+
+    def embeddings(self) -> _CountingEmbeddings:
+        return self._embeddings
+
+    def planner_model(self) -> FakeListLLM:
+        return FakeListLLM(responses=["ok"])
+
+    critic_model = planner_model
+
+
+def test_each_run_gets_its_own_vector_store(config):
+    factory = _Factory()
+    loop = PlannerReviewerLoop(config, factory)
+    loop.warm()
+
+    first, second = loop._vectorstore(), loop._vectorstore()
+
+    first.add_texts(["result of edition one"])
+    assert [doc.page_content for doc in second.similarity_search("x", k=5)] == [
+        "Humanity's Diary anchor memory."
+    ]
+    # One call for the anchor, one for the added result; the second store reuses the anchor.
+    assert factory.embeddings().documents == 2
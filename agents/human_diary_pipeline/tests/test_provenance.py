@@ -0,0 +1,34 @@
+import random
+from typing import Dict, List
+
+from human_diary_pipeline.adapters.base import DocumentRecord
+from human_diary_pipeline.utils.provenance import dedupe, dedupe_key, enrich_provenance
+
+
+def _dict_dedupe(records: List[DocumentRecord]) -> List[DocumentRecord]:
+    """The original best-score-per-key pass the vectorized dedupe replaces."""
+    best_by_key: Dict[str, DocumentRecord] = {}
+    for record in records:
+        key = dedupe_key(record)
+        existing = best_by_key.get(key)
+        if not existing or (record.score or 0) > (existing.score or 0):
+            best_by_key[key] = record
+    return list(best_by_key.values())
+
+
+def test_dedupe_matches_the_dict_pass_exactly():
+    rng = random.Random(7)
+    records = enrich_provenance(
+        DocumentRecord(
+            id=f"doc-{index}",
+            title="t",
+            summary="s",
+            url=rng.choice([None, f"https://Example.com/story/{rng.randrange(40)}/"]),
+            score=rng.choice([None, 0.0, 0.5, 1.0, rng.random()]),
+        )
+        for index in range(500)
+    )
+
+    assert [id(record) for record in dedupe(records)] == [
+        id(record) for record in _dict_dedupe(records)
+    ]
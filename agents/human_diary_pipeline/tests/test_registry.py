@@ -0,0 +1,65 @@
+import asyncio
+
+import pytest
+
+from human_diary_pipeline.adapters.cache import CachedAdapter
+from human_diary_pipeline.adapters.registry import build_adapter_suite
+from human_diary_pipeline.config import load_runtime_config
+
+
+@pytest.mark.parametrize("mode", ["record", "replay"])
+def test_fixture_modes_bypass_the_retrieval_cache(config, mode):
+    config = config.model_copy(
+        update={"replay": config.replay.model_copy(update={"mode": mode})}
+    )
+    suite = build_adapter_suite(config)
+    try:
+        assert suite.cache is None
+        assert not any(isinstance(adapter, CachedAdapter) for adapter in suite.values())
+    finally:
+        asyncio.run(suite.aclose())
+
+
+def test_live_runs_use_the_retrieval_cache(config):
+    suite = build_adapter_suite(config)
+    try:
+        assert suite.cache is not None
+        assert all(
+            isinstance(adapter, CachedAdapter)
+            for name, adapter in suite.items()
+            if name != "local_archive"
+        )
+    finally:
+        asyncio.run(suite.aclose())
+
+
+@pytest.mark.parametrize("mode", ["record", "replay"])
+def test_fixture_modes_skip_the_archive(config, mode):
+    config = config.model_copy(
+        update={"replay": config.replay.model_copy(update={"mode": mode})}
+    )
+    suite = build_adapter_suite(config)
+    try:
+        assert suite.archive is None
+        assert "local_archive" not in suite
+    finally:
+        asyncio.run(suite.aclose())
+
+
+def test_archive_switch_is_read_from_the_environment(monkeypatch, config):
+    monkeypatch.setenv("HUMAN_DIARY_ARCHIVE", "false")
+    load_runtime_config.cache_clear()
+    try:
+        archive = load_runtime_config().archive
+    finally:
+        load_runtime_config.cache_clear()
+    assert archive.enabled is False
+    config = config.model_copy(
+        update={"archive": config.archive.model_copy(update={"enabled": False})}
+    )
+    suite = build_adapter_suite(config)
+    try:
+        assert suite.archive is None
+        assert "local_archive" not in suite
+    finally:
+        asyncio.run(suite.aclose())
@@ -0,0 +1,97 @@
+import asyncio
+
+import httpx
+import pytest
+
+from human_diary_pipeline.adapters.base import SourceAdapter
+from human_diary_pipeline.adapters.resilience import (
+    CircuitBreaker,
+    ResilientAdapter,
+    provider_health,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _Hanging(SourceAdapter):
+    name = "slow"
+
+    async def search(self, query):
+        await asyncio.sleep(3600)
+        return []
+
+
+class _Answering(SourceAdapter):
+    name = "slow"
+
+    async def search(self, query):
+        return []
+
+
+class _Failing(SourceAdapter):
+    name = "slow"
+
+    def __init__(self, error: Exception) -> None:
+        super().__init__()
+        self.error = error
+
+    async def search(self, query):
+        raise self.error
+
+
+def test_cancelled_half_open_probe_releases_the_circuit():
+    clock = _Clock()
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=5.0, clock=clock)
+    adapter = ResilientAdapter(
+        _Failing(httpx.ConnectError("boom")), breaker=breaker, max_attempts=1
+    )
+    with pytest.raises(httpx.ConnectError):
+        asyncio.run(adapter.search("floods"))
+    assert breaker.state == "open"
+
+    clock.now = 10.0
+    adapter.inner = _Hanging()
+
+    async def cancel_probe():
+        probe = asyncio.create_task(adapter.search("floods"))
+        await asyncio.sleep(0)
+        probe.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await probe
+
+    asyncio.run(cancel_probe())
+    clock.now = 10_000.0
+    assert breaker.state == "half_open"
+    assert breaker.allow()
+
+
+def test_non_retryable_errors_do_not_trip_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1)
+    adapter = ResilientAdapter(_Failing(ValueError("bad query")), breaker=breaker, max_attempts=1)
+
+    for _ in range(3):
+        with pytest.raises(ValueError):
+            asyncio.run(adapter.search("floods"))
+
+    assert breaker.state == "closed"
+    assert adapter.health.failures == 3
+
+
+def test_provider_health_since_reports_only_the_later_calls():
+    adapter = ResilientAdapter(_Failing(ValueError("bad query")), max_attempts=1)
+    with pytest.raises(ValueError):
+        asyncio.run(adapter.search("floods"))
+    before = provider_health([adapter])
+
+    adapter.inner = _Answering()
+    asyncio.run(adapter.search("floods"))
+
+    health = provider_health([adapter], since=before)["slow"]
+    assert (health["calls"], health["successes"], health["failures"]) == (1, 1, 0)
+    assert health["last_error"] is None
@@ -0,0 +1,54 @@
+import asyncio
+
+import pytest
+
+from human_diary_pipeline.adapters.base import DocumentRecord, SourceAdapter
+from human_diary_pipeline.agents.scheduler import RetrievalScheduler
+
+
+class _Racing(SourceAdapter):
+    """First call fails, later calls succeed; every call finishes when `release` is set."""
+
+    name = "racing"
+
+    def __init__(self, outcomes) -> None:
+        super().__init__()
+        self.outcomes = list(outcomes)
+        self.release = asyncio.Event()
+
+    async def search(self, query):
+        outcome = self.outcomes.pop(0)
+        await self.release.wait()
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def _hedged_search(adapter):
+    scheduler = RetrievalScheduler(hedge_quantile=0.9)
+    scheduler._hedge_after = lambda provider: 0.01
+
+    async def scenario():
+        search = asyncio.ensure_future(scheduler._search(adapter, "floods"))
+        await asyncio.sleep(0.05)  # past the hedge delay: primary and backup both waiting
+        adapter.release.set()
+        return await search
+
+    return asyncio.run(scenario())
+
+
+def test_backup_success_wins_when_both_racers_finish_together():
+    record = DocumentRecord(id="n-1", title="Flood", summary="")
+    adapter = _Racing([RuntimeError("primary failed"), [record]])
+
+    records, hedged = _hedged_search(adapter)
+
+    assert records == [record]
+    assert hedged
+
+
+def test_error_is_raised_only_when_every_racer_failed():
+    adapter = _Racing([RuntimeError("primary failed"), RuntimeError("backup failed")])
+
+    with pytest.raises(RuntimeError, match="primary failed"):
+        _hedged_search(adapter)
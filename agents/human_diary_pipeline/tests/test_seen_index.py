@@ -0,0 +1,44 @@
+import datetime as dt
+from concurrent.futures import ThreadPoolExecutor
+
+from human_diary_pipeline.adapters.base import DocumentRecord
+from human_diary_pipeline.utils.provenance import normalize
+from human_diary_pipeline.utils.seen_index import IncrementalFilter, SeenIndex
+
+
+def _record(index: int, hours_ago: float) -> DocumentRecord:
+    published = dt.datetime(2026, 10, 1, 12, tzinfo=dt.timezone.utc) - dt.timedelta(hours=hours_ago)
+    return DocumentRecord(
+        id=f"n-{index}",
+        title=f"Story {index}",
+        summary="",
+        url=f"https://news.example/{index}?utm_source=feed",
+        published_at=published,
+    )
+
+
+def test_only_cleaned_records_are_committed(tmp_path):
+    index = SeenIndex(tmp_path / "seen.sqlite")
+    active = index.filter(overlap_seconds=0)
+    retrieved = active("floods asia", [_record(0, 5), _record(1, 1), _record(2, 3)])
+    assert len(retrieved) == 3
+
+    # The cleaner canonicalizes URLs and keeps only the oldest two stories.
+    cleaned = [record for record in normalize(retrieved) if record.id != "n-1"]
+    updates = IncrementalFilter.restrict_updates(active.updates(), cleaned)
+    index.commit(updates)
+
+    later = index.filter(overlap_seconds=0)
+    again = later("floods asia", [_record(0, 5), _record(1, 1), _record(2, 3)])
+    assert [record.id for record in again] == ["n-1"]
+    assert updates["stats"]["committed"] == 2
+
+
+def test_index_built_on_another_thread_is_usable(tmp_path):
+    with ThreadPoolExecutor(1) as pool:
+        index = pool.submit(SeenIndex, tmp_path / "seen.sqlite").result()
+    try:
+        index.commit({"seen": [{"hash": "abc", "url": None}], "watermarks": {}})
+        assert index.seen(["abc", "def"]) == {"abc"}
+    finally:
+        index.close()
@@ -0,0 +1,83 @@
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+
+from human_diary_pipeline.config import ServiceConfig
+from human_diary_pipeline.pipelines.service import NewsroomService
+
+
+class _Workflow:
+    async def ainvoke(self, graph_input, graph_config):
+        return {"edition": graph_input["edition"], "publish_path": None}
+
+
+def test_result_write_failure_marks_the_job_and_keeps_the_worker(tmp_path):
+    blocker = tmp_path / "not-a-directory"
+    blocker.write_text("")
+    runtime = SimpleNamespace(
+        workflow=_Workflow(), metrics=SimpleNamespace(finish_run=lambda run_id: None)
+    )
+    config = ServiceConfig().model_copy(update={"workers": 1, "output_dir": blocker / "jobs"})
+
+    async def scenario():
+        service = NewsroomService(runtime, config)
+        service.start()
+        jobs = [service.submit("plan one"), service.submit("plan two")]
+        await asyncio.wait_for(service._queue.join(), timeout=5)
+        alive = not service._workers[0].done()
+        await service.stop()
+        return jobs, alive
+
+    jobs, alive = asyncio.run(scenario())
+
+    assert alive
+    assert [job.status for job in jobs] == ["error", "error"]
+    assert all(job.error.startswith("writing results failed") for job in jobs)
+    assert all(job.state_path is None for job in jobs)
+
+
+def test_broken_result_file_gets_a_500(tmp_path):
+    service = NewsroomService(SimpleNamespace(), ServiceConfig())
+    job = service.submit("plan")
+    job.status, job.state_path = "ok", str(tmp_path / "state.json")
+    (tmp_path / "state.json").write_text('{"trunc')
+
+    async def request():
+        reader = asyncio.StreamReader()
+        reader.feed_data(f"GET /jobs/{job.id}/result HTTP/1.1\r\n\r\n".encode())
+        reader.feed_eof()
+        writer = SimpleNamespace(sent=b"", close=lambda: None)
+        writer.write = lambda data: setattr(writer, "sent", writer.sent + data)
+        writer.drain = lambda: asyncio.sleep(0)
+        await service.handle(reader, writer)
+        return writer.sent
+
+    assert asyncio.run(request()).startswith(b"HTTP/1.1 500 ")
+
+
+def test_inbox_scan_skips_files_that_vanish(tmp_path, monkeypatch):
+    service = NewsroomService(SimpleNamespace(), ServiceConfig())
+    inbox = tmp_path / "inbox"
+    inbox.mkdir()
+    (inbox / "gone.json").write_text('{"plan": "a"}')
+    (inbox / "kept.json").write_text('{"plan": "b"}')
+    original_stat = Path.stat
+
+    def racing_stat(path, *args, **kwargs):
+        if path.name == "gone.json":
+            raise FileNotFoundError(path)
+        return original_stat(path, *args, **kwargs)
+
+    monkeypatch.setattr(Path, "stat", racing_stat)
+
+    async def one_poll():
+        watcher = asyncio.create_task(service.watch_inbox(inbox))
+        await asyncio.sleep(0.05)
+        alive = not watcher.done()
+        watcher.cancel()
+        await asyncio.gather(watcher, return_exceptions=True)
+        return alive
+
+    assert asyncio.run(one_poll())
+    assert (inbox / "accepted" / "kept.json").exists()
+    assert [job.directive for job in service.jobs.values()] == ["b"]
@@ -0,0 +1,45 @@
+from human_diary_pipeline.adapters.base import DocumentRecord
+from human_diary_pipeline.pipelines.sharded import (
+    _decode_result,
+    merge_shards,
+    pack,
+    records_to_columns,
+    shard_tasks,
+)
+
+
+def test_region_sharding_round_robins_plans_without_regions():
+    tasks = ["floods", "elections", "markets", {"task": "ai", "region": "APAC"}]
+
+    groups = shard_tasks(tasks, shard_by="region", shards=2)
+
+    assert groups == {"shard-0": ["floods", "markets"], "shard-1": ["elections", tasks[3]]}
+    assert set(shard_tasks([{"region": "emea"}, {"region": "apac"}])) == {"emea", "apac"}
+
+
+def _shard(name: str, records, citations):
+    return _decode_result(
+        pack(
+            {
+                "shard": name,
+                "documents": records_to_columns(records),
+                "sensemaking": [{"theme": "Floods", "citations": citations}],
+            }
+        )
+    )
+
+
+def test_merged_bullets_cite_surviving_record_ids():
+    story = DocumentRecord(id="newsapi-0", title="Flood", summary="", url="https://a.example/1")
+    copy = DocumentRecord(id="serpapi-0", title="Flood", summary="", url="https://a.example/1")
+    results = [
+        _shard("emea", [story], ["newsapi-0", "https://a.example/1"]),
+        _shard("apac", [copy], ["serpapi-0"]),
+    ]
+
+    merged = merge_shards(results, near_duplicates=False)
+
+    [survivor] = merged["clean_documents"]
+    [bullet] = merged["sensemaking"]
+    assert survivor.id == "emea:newsapi-0"
+    assert bullet["citations"] == ["emea:newsapi-0", "https://a.example/1"]